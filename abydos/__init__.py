@@ -21,5 +21,5 @@
 Abydos NLP/IR library by Christopher C. Little
 """
 
-__all__ = ['compression', 'corpus', 'distance', 'fingerprint', 'phones',
-           'phonetic', 'stats', 'stemmer', 'tokenizer', 'util']
+__all__ = ['compression', 'corpus', 'distance', 'fingerprint', 'index',
+           'phones', 'phonetic', 'stats', 'stemmer', 'tokenizer', 'util']
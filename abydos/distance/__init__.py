@@ -58,6 +58,11 @@ The distance module implements string edit distance functions including:
     - Indel distance
     - Synoname
 
+The distance.batch module applies these to whole collections of strings
+(cdist & top_k), and the distance.profile module stores the q-gram profiles
+of a collection, so that token-based measures need not re-tokenize them
+(QGramProfileStore).
+
 Functions beginning with the prefixes 'sim' and 'dist' are guaranteed to be
 in the range [0, 1], and sim_X = 1 - dist_X since the two are complements.
 If a sim_X function is supplied identical src & tar arguments, it is guaranteed
@@ -74,9 +79,9 @@ from .levenshtein import sim_levenshtein
 from ..tokenizer.qgram import QGrams
 
 
-__all__ = ['basic', 'baystat', 'compression', 'dist', 'editex', 'hamming',
-           'jaro', 'levenshtein', 'minkowski', 'sift4', 'sim', 'synoname',
-           'typo']
+__all__ = ['basic', 'batch', 'baystat', 'compression', 'dist', 'editex',
+           'hamming', 'jaro', 'levenshtein', 'minkowski', 'profile', 'sift4',
+           'sim', 'synoname', 'typo']
 
 
 def _get_qgrams(src, tar, qval=0, skip=0):
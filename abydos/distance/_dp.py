@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance._dp.
+
+The distance._dp module implements a shared dynamic programming kernel for
+the edit distance & alignment score functions that return only a score.
+Rather than a full matrix, only the last two (for transpositions, three) rows
+are kept, so memory use is proportional to the length of the shorter string.
+
+With engine='numpy', the DP is instead filled one anti-diagonal at a time,
+since each cell of an anti-diagonal depends only on the two anti-diagonals
+before it: each anti-diagonal then costs a few NumPy array operations, rather
+than a pass of the interpreter per cell.
+"""
+
+from __future__ import division, unicode_literals
+
+from numbers import Integral, Number
+
+from numpy import arange as np_arange
+from numpy import array as np_array
+from numpy import float64 as np_float64
+from numpy import full as np_full
+from numpy import intp as np_intp
+from numpy import maximum as np_maximum
+from numpy import minimum as np_minimum
+from numpy import where as np_where
+
+from six.moves import range
+
+__all__ = []
+
+
+def _dp_score(src, tar, ins_cost, del_cost, sub_cost, trans_cost=None,
+              first_row=None, first_col=None, optimum=min, floor=None,
+              max_distance=None, row_cost=None, engine='python'):
+    """Return the final cell of an edit distance or alignment DP.
+
+    This computes the Wagner-Fischer :cite:`Wagner:1974` style recurrence
+
+    :math:`D_{i,j} = optimum(D_{i,j-1} + ins_j, D_{i-1,j} + del_i,
+    D_{i-1,j-1} + sub(src_i, tar_j))`
+
+    row by row. If tar is the longer string, the two are exchanged (along with
+    the insert & delete costs), so that rows span the shorter string.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param ins_cost: the cost of an insert, or a sequence of the costs of
+        inserting each character of tar
+    :param del_cost: the cost of a delete, or a sequence of the costs of
+        deleting each character of src
+    :param sub_cost: the cost of a substitution of unequal characters (equal
+        characters cost 0), or a function of a src & a tar character returning
+        the cost of substituting one for the other (computed only once for
+        each pair of distinct characters)
+    :param float trans_cost: if set, the cost of an adjacent transposition
+        (as in Optimal String Alignment distance)
+    :param list first_row: the values of row 0; by default, the cumulative
+        insert costs
+    :param list first_col: the values of column 0; by default, the cumulative
+        delete costs
+    :param function optimum: min for distances; max for similarity scores
+    :param float floor: if set, each cell is at least (for max: at most) as
+        good as this value (as in Smith-Waterman)
+    :param float max_distance: if set (and optimum is min), only the diagonal
+        band reachable with at most this much insert & delete cost is
+        computed :cite:`Ukkonen:1985`, and the computation is abandoned as
+        soon as a whole row exceeds this bound
+    :param function row_cost: if set, in place of sub_cost, a function of a
+        character & a string returning the list of costs of substituting the
+        character & each character of the string (which must be symmetric)
+    :param str engine: 'python' (default) to fill the DP row by row, or
+        'numpy' to fill it by anti-diagonals with _dp_score_numpy
+    :returns: the value of the final cell, or max_distance + 1 if it exceeds
+        max_distance
+    :rtype: float
+
+    >>> _dp_score('Niall', 'Neil', 1, 1, 1)
+    3
+    >>> _dp_score('ATCG', 'TAGC', 1, 1, 1, trans_cost=1)
+    2
+    >>> _dp_score('cat', 'hat', -1, -1, lambda a, b: 1 if a == b else 0,
+    ...           optimum=max)
+    2
+    >>> _dp_score('aluminum', 'Catalan', 1, 1, 2, max_distance=3)
+    4
+    >>> _dp_score('aluminum', 'Catalan', 1, 1, 2, engine='numpy')
+    9
+    """
+    if engine == 'numpy':
+        score = _dp_score_numpy(src, tar, ins_cost, del_cost, sub_cost,
+                                trans_cost, first_row, first_col, optimum,
+                                floor, row_cost)
+        if max_distance is not None and score > max_distance:
+            return max_distance + 1
+        return score
+    elif engine != 'python':
+        raise ValueError("engine must be 'python' or 'numpy'")
+
+    if len(tar) > len(src):
+        src, tar = tar, src
+        ins_cost, del_cost = del_cost, ins_cost
+        first_row, first_col = first_col, first_row
+        transposed = True
+    else:
+        transposed = False
+    lens, lent = len(src), len(tar)
+
+    if isinstance(ins_cost, Number):
+        ins_cost = [ins_cost] * lent
+    if isinstance(del_cost, Number):
+        del_cost = [del_cost] * lens
+    if first_row is None:
+        first_row = [0]
+        for cost in ins_cost:
+            first_row.append(first_row[-1] + cost)
+    if first_col is None:
+        first_col = [0]
+        for cost in del_cost:
+            first_col.append(first_col[-1] + cost)
+    fixed_sub = isinstance(sub_cost, Number)
+
+    if max_distance is not None:
+        ceiling = max_distance + 1
+        min_indel = min(min(ins_cost), min(del_cost))
+        if min_indel > 0:
+            width = int(max_distance // min_indel)
+        else:
+            width = lens
+        first_row = [min(val, ceiling) for val in first_row]
+        blank = [ceiling] * (lent+1)
+    else:
+        width = lens
+        blank = [0] * (lent+1)
+
+    # the substitution costs of each distinct src character against tar
+    sub_rows = {}
+    plain_min = optimum is min and trans_cost is None and floor is None
+
+    two_back = None
+    prev = list(first_row)
+    for i in range(1, lens+1):
+        src_char = src[i-1]
+        del_i = del_cost[i-1]
+        sub_row = sub_rows.get(src_char)
+        if sub_row is None:
+            if row_cost is not None:
+                sub_row = row_cost(src_char, tar)
+            elif fixed_sub:
+                sub_row = [0 if src_char == tar_char else sub_cost
+                           for tar_char in tar]
+            elif transposed:
+                sub_row = [sub_cost(tar_char, src_char) for tar_char in tar]
+            else:
+                sub_row = [sub_cost(src_char, tar_char) for tar_char in tar]
+            sub_rows[src_char] = sub_row
+
+        cur = blank[:]
+        cur[0] = first_col[i]
+        if plain_min:
+            # the common case, with the minimum taken by comparison, which
+            # avoids a call to min() per cell
+            for j in range(max(1, i-width), min(lent, i+width)+1):
+                cell = cur[j-1] + ins_cost[j-1]  # ins
+                other = prev[j] + del_i  # del
+                if other < cell:
+                    cell = other
+                other = prev[j-1] + sub_row[j-1]  # sub/==
+                if other < cell:
+                    cell = other
+                cur[j] = cell
+        else:
+            for j in range(max(1, i-width), min(lent, i+width)+1):
+                cell = optimum(cur[j-1] + ins_cost[j-1],  # ins
+                               prev[j] + del_i,  # del
+                               prev[j-1] + sub_row[j-1])  # sub/==
+                if trans_cost is not None:
+                    if ((i > 1 and j > 1 and src_char == tar[j-2] and
+                         src[i-2] == tar[j-1])):
+                        # transposition
+                        cell = optimum(cell, two_back[j-2] + trans_cost)
+                if floor is not None:
+                    cell = optimum(cell, floor)
+                cur[j] = cell
+
+        if max_distance is not None:
+            cur = [ceiling if cell > ceiling else cell for cell in cur]
+            if min(cur) > max_distance:
+                return ceiling
+        two_back, prev = prev, cur
+
+    return prev[lent]
+
+
+def _dp_codes(src, tar, sub_cost, row_cost=None):
+    """Return the symbol codes of two strings & their substitution table.
+
+    Each distinct character of src & tar is assigned a code, and the
+    substitution cost (or similarity) of each pair of distinct characters is
+    computed once, into a table indexed by the codes.
+
+    :param str src: source string
+    :param str tar: target string
+    :param sub_cost: the cost of a substitution of unequal characters (equal
+        characters cost 0), or a function of a src & a tar character returning
+        the cost of substituting one for the other
+    :param function row_cost: if set, in place of sub_cost, a function of a
+        character & a string returning the list of costs of substituting the
+        character & each character of the string
+    :returns: the codes of src, the codes of tar, & the table of substitution
+        costs (rows for src codes, columns for tar codes)
+    :rtype: tuple
+
+    >>> src_codes, tar_codes, table = _dp_codes('cat', 'hat', 1)
+    >>> src_codes.tolist(), tar_codes.tolist()
+    ([1, 0, 3], [2, 0, 3])
+    >>> table.tolist()[1]
+    [1.0, 0.0, 1.0, 1.0]
+    """
+    symbols = sorted(set(src) | set(tar))
+    codes = {symbol: code for code, symbol in enumerate(symbols)}
+    if row_cost is not None:
+        alphabet = ''.join(symbols)
+        table = [row_cost(symbol, alphabet) for symbol in symbols]
+    elif isinstance(sub_cost, Number):
+        table = [[0 if symbol1 == symbol2 else sub_cost
+                  for symbol2 in symbols] for symbol1 in symbols]
+    else:
+        table = [[sub_cost(symbol1, symbol2) for symbol2 in symbols]
+                 for symbol1 in symbols]
+    return (np_array([codes[char] for char in src], dtype=np_intp),
+            np_array([codes[char] for char in tar], dtype=np_intp),
+            np_array(table, dtype=np_float64).reshape(len(symbols),
+                                                      len(symbols)))
+
+
+def _dp_score_numpy(src, tar, ins_cost, del_cost, sub_cost, trans_cost=None,
+                    first_row=None, first_col=None, optimum=min, floor=None,
+                    row_cost=None):
+    """Return the final cell of an edit distance or alignment DP (NumPy).
+
+    This computes the same recurrence as _dp_score, but one anti-diagonal
+    (the cells with a common i+j) at a time. Each anti-diagonal is held as an
+    array indexed by i, so the cells to the left, above, & above-left (and,
+    for transpositions, two above & two to the left) are shifted views of
+    the preceding anti-diagonals.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param ins_cost: the cost of an insert, or a sequence of the costs of
+        inserting each character of tar
+    :param del_cost: the cost of a delete, or a sequence of the costs of
+        deleting each character of src
+    :param sub_cost: the cost of a substitution of unequal characters (equal
+        characters cost 0), or a function of a src & a tar character returning
+        the cost of substituting one for the other
+    :param float trans_cost: if set, the cost of an adjacent transposition
+    :param list first_row: the values of row 0; by default, the cumulative
+        insert costs
+    :param list first_col: the values of column 0; by default, the cumulative
+        delete costs
+    :param function optimum: min for distances; max for similarity scores
+    :param float floor: if set, each cell is at least (for max: at most) as
+        good as this value
+    :param function row_cost: if set, in place of sub_cost, a function of a
+        character & a string returning the list of costs of substituting the
+        character & each character of the string
+    :returns: the value of the final cell (an int if every cost is an int)
+    :rtype: float
+
+    >>> _dp_score_numpy('Niall', 'Neil', 1, 1, 1)
+    3
+    >>> _dp_score_numpy('ATCG', 'TAGC', 1, 1, 1, trans_cost=1)
+    2
+    >>> _dp_score_numpy('cat', 'hat', -1, -1, lambda a, b: 1 if a == b else 0,
+    ...                 optimum=max)
+    2.0
+    """
+    lens, lent = len(src), len(tar)
+    integral = all(isinstance(cost, Integral) for cost in
+                   (ins_cost, del_cost, sub_cost,
+                    0 if trans_cost is None else trans_cost,
+                    0 if floor is None else floor)) and row_cost is None
+
+    ins_costs = np_array(ins_cost if not isinstance(ins_cost, Number) else
+                         [ins_cost] * lent, dtype=np_float64)
+    del_costs = np_array(del_cost if not isinstance(del_cost, Number) else
+                         [del_cost] * lens, dtype=np_float64)
+    if first_row is None:
+        first_row = [0]
+        for cost in ins_costs.tolist():
+            first_row.append(first_row[-1] + cost)
+    if first_col is None:
+        first_col = [0]
+        for cost in del_costs.tolist():
+            first_col.append(first_col[-1] + cost)
+    src_codes, tar_codes, table = _dp_codes(src, tar, sub_cost, row_cost)
+
+    if optimum is min:
+        better, worst = np_minimum, float('inf')
+    else:
+        better, worst = np_maximum, float('-inf')
+
+    # the anti-diagonals k-1, k-2, (& for transpositions) k-3, & k-4
+    diag1 = diag2 = diag3 = diag4 = None
+    for k in range(lens+lent+1):
+        diag = np_full(lens+1, worst, dtype=np_float64)
+        if k <= lent:
+            diag[0] = first_row[k]
+        if k <= lens:
+            diag[k] = first_col[k]
+
+        lo, hi = max(1, k-lent), min(lens, k-1)
+        if lo <= hi:
+            src_idx = np_arange(lo-1, hi)
+            tar_idx = k-2 - src_idx
+            cell = better(diag1[lo:hi+1] + ins_costs[tar_idx],  # ins
+                          diag1[lo-1:hi] + del_costs[lo-1:hi])  # del
+            cell = better(cell, diag2[lo-1:hi] +  # sub/==
+                          table[src_codes[lo-1:hi], tar_codes[tar_idx]])
+            if trans_cost is not None:
+                lo2, hi2 = max(lo, 2), min(hi, k-2)
+                if lo2 <= hi2:
+                    src_idx = np_arange(lo2-1, hi2)
+                    tar_idx = k-2 - src_idx
+                    swapped = ((src_codes[src_idx] == tar_codes[tar_idx-1]) &
+                               (src_codes[src_idx-1] == tar_codes[tar_idx]))
+                    part = cell[lo2-lo:hi2-lo+1]
+                    cell[lo2-lo:hi2-lo+1] = np_where(
+                        swapped,
+                        better(part, diag4[lo2-2:hi2-1] + trans_cost),
+                        part)
+            if floor is not None:
+                cell = better(cell, floor)
+            diag[lo:hi+1] = cell
+
+        diag4, diag3, diag2, diag1 = diag3, diag2, diag1, diag
+
+    score = diag1[lens].item()
+    return int(score) if integral else score
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,643 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance.batch.
+
+The distance.batch module implements one-to-many & many-to-many comparison
+functions, which apply any of the pairwise similarity or distance functions
+of the distance module to whole collections of strings:
+
+    - cdist (the matrix of scores between two collections)
+    - top_k (the best-scoring candidates for a query)
+    - qgram_cdist (cdist for the set-based q-gram measures, computed over a
+      sparse encoding of the whole collections)
+
+Each query (and, where useful, each candidate) is prepared only once, rather
+than once per pair: q-gram based measures tokenize each string once, Editex
+measures normalize each string once, and unit-cost Levenshtein & LCSseq
+measures build each query's bit-vectors once.
+"""
+
+from __future__ import division, unicode_literals
+
+from collections import Counter
+from heapq import heappush, heapreplace
+
+from numpy import arange as np_arange
+from numpy import bincount as np_bincount
+from numpy import concatenate as np_concatenate
+from numpy import cumsum as np_cumsum
+from numpy import errstate as np_errstate
+from numpy import float64 as np_float64
+from numpy import intp as np_intp
+from numpy import maximum as np_maximum
+from numpy import minimum as np_minimum
+from numpy import nonzero as np_nonzero
+from numpy import repeat as np_repeat
+from numpy import searchsorted as np_searchsorted
+from numpy import sqrt as np_sqrt
+from numpy import unique as np_unique
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+from .editex import _editex, _editex_d_costs, _editex_normalize, \
+    dist_editex, editex, sim_editex
+from .hamming import hamming
+from .levenshtein import _levenshtein_bitparallel, _myers_peq, \
+    damerau_levenshtein, dist_levenshtein, indel, levenshtein, \
+    sim_levenshtein
+from .minkowski import chebyshev, dist_euclidean, dist_manhattan, \
+    dist_minkowski, euclidean, manhattan, minkowski, sim_euclidean, \
+    sim_manhattan, sim_minkowski
+from .profile import QGramProfileStore
+from .sequence import _lcsseq_length, dist_lcsseq, sim_lcsseq
+from .token import bag, dist_cosine, dist_dice, dist_jaccard, \
+    dist_overlap, dist_tversky, sim_cosine, sim_dice, sim_jaccard, \
+    sim_overlap, sim_tanimoto, sim_tversky, tanimoto
+from ..tokenizer.qgram import QGrams
+
+__all__ = ['cdist', 'qgram_cdist', 'top_k']
+
+_QGRAM_METRICS = frozenset((
+    chebyshev, dist_cosine, dist_dice, dist_euclidean, dist_jaccard,
+    dist_manhattan, dist_minkowski, dist_overlap, dist_tversky, euclidean,
+    manhattan, minkowski, sim_cosine, sim_dice, sim_euclidean, sim_jaccard,
+    sim_manhattan, sim_minkowski, sim_overlap, sim_tanimoto, sim_tversky,
+    tanimoto))
+
+# the Tversky index parameters (alpha, beta) of the set-based measures that
+# qgram_cdist computes, & whether each is a distance
+_SET_METRICS = {
+    sim_tversky: (None, False), dist_tversky: (None, True),
+    sim_dice: ((0.5, 0.5), False), dist_dice: ((0.5, 0.5), True),
+    sim_jaccard: ((1, 1), False), dist_jaccard: ((1, 1), True),
+    sim_tanimoto: ((1, 1), False),
+    sim_cosine: ('cosine', False), dist_cosine: ('cosine', True),
+    sim_overlap: ('overlap', False), dist_overlap: ('overlap', True)}
+
+# whether greater scores are better, for the measures not named with the
+# prefix 'sim' (similarities) or 'dist' (distances)
+_GREATER_IS_BETTER = {
+    tanimoto: True, bag: False, chebyshev: False, damerau_levenshtein: False,
+    editex: False, euclidean: False, hamming: False, indel: False,
+    levenshtein: False, manhattan: False, minkowski: False}
+
+# the number of cells of the score matrix computed at once by qgram_cdist
+_BLOCK_CELLS = 1 << 22
+
+
+def _identity(term):
+    """Return term unchanged.
+
+    :param str term: a term
+    :returns: the term
+    :rtype: str
+
+    >>> _identity('Niall')
+    'Niall'
+    """
+    return term
+
+
+def _greater_is_better(metric):
+    """Return whether greater scores of a measure are better.
+
+    :param function metric: a similarity or distance function
+    :returns: True for similarities, False for distances, or None if unknown
+    :rtype: bool
+
+    >>> _greater_is_better(sim_jaccard), _greater_is_better(levenshtein)
+    (True, False)
+    """
+    if metric in _GREATER_IS_BETTER:
+        return _GREATER_IS_BETTER[metric]
+    name = getattr(metric, '__name__', '')
+    if name.startswith('sim'):
+        return True
+    if name.startswith('dist'):
+        return False
+    return None
+
+
+def _qgram_profile(term, qval=2):
+    """Return the q-gram profile of a term, as _get_qgrams() computes it.
+
+    :param str term: the term to tokenize
+    :param int qval: the length of each q-gram; 0 for non-q-gram version
+    :returns: the q-grams (or whitespace-delimited tokens) of term
+    :rtype: Counter
+
+    >>> _qgram_profile('Niall')
+    QGrams({'$N': 1, 'Ni': 1, 'ia': 1, 'al': 1, 'll': 1, 'l#': 1})
+    >>> _qgram_profile('Niall Little', qval=0)
+    Counter({'Niall': 1, 'Little': 1})
+    """
+    if qval > 0:
+        return QGrams(term, qval, '$#')
+    return Counter(term.strip().split())
+
+
+def _preparation(metric, kwargs):
+    """Return the functions used to prepare & score terms for a metric.
+
+    :param function metric: a similarity or distance function
+    :param dict kwargs: the keyword arguments to pass to metric
+    :returns: a function to prepare each query, a function to prepare each
+        candidate, a function that scores a prepared query & candidate (with an
+        optional bound, beyond which the exact score is not needed), and
+        whether greater scores are better (True), worse (False), or unknown
+        (None)
+    :rtype: tuple
+
+    >>> prep_query, prep_cand, score, _ = _preparation(sim_jaccard, {})
+    >>> score(prep_query('Niall'), prep_cand('Neil'))
+    0.2222222222222222
+    """
+    if metric in _QGRAM_METRICS:
+        qval = kwargs.get('qval', 2)
+
+        def _prep_qgrams(term):
+            return term, _qgram_profile(term, qval)
+
+        def _score_qgrams(query, cand, bound=None):
+            # metric tests identity & emptiness on the terms themselves, which
+            # equal or empty profiles do not reflect
+            if query[1] == cand[1] or not query[1] or not cand[1]:
+                return metric(query[0], cand[0], **kwargs)
+            return metric(query[1], cand[1], **kwargs)
+
+        return _prep_qgrams, _prep_qgrams, _score_qgrams, None
+
+    if metric in (editex, dist_editex, sim_editex):
+        return _editex_preparation(metric, kwargs)
+
+    if metric in (sim_lcsseq, dist_lcsseq):
+        def _prep_lcsseq(term):
+            return term, _myers_peq(term)
+
+        def _score_lcsseq(query, cand, bound=None):
+            query, peq = query
+            if query == cand:
+                sim = 1.0
+            elif not query or not cand:
+                sim = 0.0
+            else:
+                sim = (_lcsseq_length(query, cand, peq) /
+                       max(len(query), len(cand)))
+            return sim if metric is sim_lcsseq else 1 - sim
+
+        return _prep_lcsseq, _identity, _score_lcsseq, None
+
+    if metric in (levenshtein, dist_levenshtein, sim_levenshtein):
+        mode = kwargs.get('mode', 'lev')
+        cost = tuple(kwargs.get('cost', (1, 1, 1, 1)))
+        if mode in {'lev', 'osa'} and cost[:3] == (1, 1, 1) and (
+                mode == 'lev' or cost[3] == 1):
+            return _levenshtein_preparation(metric, mode == 'osa',
+                                            kwargs.get('max_distance'))
+
+    def _score_plain(query, cand, bound=None):
+        return metric(query, cand, **kwargs)
+
+    return _identity, _identity, _score_plain, None
+
+
+def _editex_preparation(metric, kwargs):
+    """Return the preparation functions for Editex measures.
+
+    :param function metric: editex, dist_editex, or sim_editex
+    :param dict kwargs: the keyword arguments to pass to metric
+    :returns: preparation functions, as for _preparation()
+    :rtype: tuple
+
+    >>> prep, _, score, _ = _editex_preparation(editex, {})
+    >>> score(prep('Niall'), prep('Neil'))
+    2
+    """
+    cost = tuple(kwargs.get('cost', (0, 1, 2)))
+    local = kwargs.get('local', False)
+    normalized = kwargs.get('normalized', False)
+
+    def _prep(term):
+        norm = term if normalized else _editex_normalize(term)
+        return term, norm, _editex_d_costs(norm, cost)
+
+    def _score(query, cand, bound=None):
+        if metric is not editex and query[0] == cand[0]:
+            return 0 if metric is dist_editex else 1
+        distance = _editex(query[1], cand[1], query[2], cand[2], cost, local)
+        if metric is editex:
+            return distance
+        distance /= max(len(query[0])*cost[2], len(cand[0])*cost[2])
+        return distance if metric is dist_editex else 1 - distance
+
+    return _prep, _prep, _score, None
+
+
+def _levenshtein_preparation(metric, transpositions, max_distance):
+    """Return the preparation functions for unit-cost Levenshtein measures.
+
+    :param function metric: levenshtein, dist_levenshtein, or sim_levenshtein
+    :param bool transpositions: True for Optimal String Alignment distance
+    :param float max_distance: the max_distance argument supplied for metric,
+        if any
+    :returns: preparation functions, as for _preparation()
+    :rtype: tuple
+
+    >>> prep_query, _, score, _ = _levenshtein_preparation(levenshtein, False,
+    ...                                                    None)
+    >>> score(prep_query('Niall'), 'Neil')
+    3
+    """
+    def _prep_query(term):
+        return term, _myers_peq(term)
+
+    def _limit(bound):
+        if bound is None:
+            return max_distance
+        if max_distance is None:
+            return bound
+        return min(bound, max_distance)
+
+    def _distance(query, cand, limit):
+        query, peq = query
+        if limit is not None and abs(len(query) - len(cand)) > limit:
+            return limit + 1
+        return _levenshtein_bitparallel(query, cand, transpositions, limit,
+                                        peq)
+
+    def _dist_normalized(query, cand, limit):
+        normalizer = max(len(query[0]), len(cand))
+        if query[0] == cand:
+            return 0.0
+        if limit is None:
+            return _distance(query, cand, None) / normalizer
+        # the slack guards against pruning ties lost to rounding
+        bound = limit * normalizer * (1 + 1e-9)
+        distance = _distance(query, cand, bound)
+        if distance > bound:
+            return 1.0
+        return distance / normalizer
+
+    if metric is levenshtein:
+        def _score(query, cand, bound=None):
+            return _distance(query, cand, _limit(bound))
+        better = False
+    elif metric is dist_levenshtein:
+        def _score(query, cand, bound=None):
+            return _dist_normalized(query, cand, _limit(bound))
+        better = False
+    else:
+        def _score(query, cand, bound=None):
+            return 1 - _dist_normalized(query, cand,
+                                        None if bound is None else 1 - bound)
+        better = True
+
+    return _prep_query, _identity, _score, better
+
+
+def cdist(queries, candidates, metric=sim_levenshtein, **kwargs):
+    """Return the matrix of scores between two collections of strings.
+
+    This is equivalent to computing metric(query, candidate) for every query
+    & candidate, but each string is prepared (e.g. tokenized into q-grams)
+    only once.
+
+    :param list queries: a collection of terms or a string that can be split
+    :param list candidates: a collection of terms or a string that can be
+        split
+    :param function metric: a similarity or distance function
+    :param kwargs: any additional arguments to metric
+    :returns: a matrix, in which the value at [i, j] is the score of the i-th
+        query & the j-th candidate
+    :rtype: numpy.ndarray
+
+    >>> cdist(['Niall', 'Neil'], ['Neal', 'Nigel', 'Niall'])
+    array([[0.6 , 0.6 , 1.  ],
+           [0.75, 0.4 , 0.4 ]])
+    >>> cdist('Niall Neil', 'Neal Nigel', metric=levenshtein)
+    array([[2., 2.],
+           [1., 3.]])
+    """
+    if not callable(metric):
+        raise ValueError('metric must be a function')
+    if hasattr(queries, 'split'):
+        queries = queries.split()
+    if hasattr(candidates, 'split'):
+        candidates = candidates.split()
+
+    prep_query, prep_cand, score, _ = _preparation(metric, kwargs)
+    candidates = [prep_cand(cand) for cand in candidates]
+
+    scores = np_zeros((len(queries), len(candidates)), dtype=np_float64)
+    for i, query in enumerate(queries):
+        query = prep_query(query)
+        scores[i] = [score(query, cand) for cand in candidates]
+    return scores
+
+
+def _binary_features(indptr, indices, data):
+    """Return a multiset CSR matrix as a binary (set) CSR matrix.
+
+    Each q-gram occurring c times is replaced by c features: the q-gram's
+    first, second, ... c-th occurrence. The dot product of two binary rows is
+    then the magnitude of the multiset intersection of the original rows.
+
+    :param numpy.ndarray indptr: the row offsets of the CSR matrix
+    :param numpy.ndarray indices: the q-gram ids of the CSR matrix
+    :param numpy.ndarray data: the counts of the CSR matrix
+    :returns: the row offsets & feature ids of the binary matrix, and the
+        number of distinct features
+    :rtype: tuple
+
+    >>> store = QGramProfileStore(['AAB', 'A'], qval=1)
+    >>> indptr, features, size = _binary_features(*store.csr())
+    >>> indptr.tolist(), features.tolist(), size
+    ([0, 3, 4], [0, 1, 2, 0], 3)
+    """
+    occurrence = (np_arange(data.sum(), dtype=np_intp) -
+                  np_repeat(np_cumsum(data) - data, data))
+    qgrams = np_repeat(indices, data)
+    keys = qgrams * (int(data.max()) if len(data) else 1) + occurrence
+    distinct, features = np_unique(keys, return_inverse=True)
+    row_lengths = np_bincount(np_repeat(np_arange(len(indptr) - 1),
+                                        indptr[1:] - indptr[:-1]),
+                              weights=data, minlength=len(indptr) - 1)
+    return (np_concatenate(([0], np_cumsum(row_lengths))).astype(np_intp),
+            features.ravel(), len(distinct))
+
+
+def _intersections(query_features, query_rows, cand_indptr, cand_rows,
+                   n_queries, n_cands):
+    """Return the intersection magnitudes of a block of queries & candidates.
+
+    The candidates' postings of the queries' features are gathered in chunks
+    of about _BLOCK_CELLS, so that frequent q-grams (which have long postings)
+    do not make the intermediate arrays much larger than the block.
+
+    :param numpy.ndarray query_features: the feature ids of the queries
+    :param numpy.ndarray query_rows: the row (within the block) of each
+        feature of the queries
+    :param numpy.ndarray cand_indptr: the offsets, by feature, of the
+        candidates' postings (i.e. the candidates' CSC matrix)
+    :param numpy.ndarray cand_rows: the candidates having each feature
+    :param int n_queries: the number of queries in the block
+    :param int n_cands: the number of candidates
+    :returns: the matrix of the number of features shared by each query &
+        candidate
+    :rtype: numpy.ndarray
+    """
+    starts = cand_indptr[query_features]
+    lengths = cand_indptr[query_features + 1] - starts
+    ends = np_cumsum(lengths)
+    inter = np_zeros(n_queries * n_cands, dtype=np_intp)
+
+    first = 0
+    while first < len(query_features):
+        # at least one feature per chunk, whose postings are at most n_cands
+        last = max(first + 1, int(np_searchsorted(
+            ends, ends[first] - lengths[first] + _BLOCK_CELLS, 'right')))
+        chunk = lengths[first:last]
+        offsets = np_cumsum(chunk) - chunk
+        postings = (np_repeat(starts[first:last] - offsets, chunk) +
+                    np_arange(chunk.sum(), dtype=np_intp))
+        cells = (np_repeat(query_rows[first:last], chunk) * n_cands +
+                 cand_rows[postings])
+        inter += np_bincount(cells, minlength=n_queries * n_cands)
+        first = last
+    return inter.reshape(n_queries, n_cands)
+
+
+def qgram_cdist(queries, candidates=None, metric=sim_jaccard, threshold=None,
+                block_size=None, **kwargs):
+    """Return the scores of the set-based q-gram measures between collections.
+
+    This returns the same scores as cdist(queries, candidates, metric), for
+    the Tversky, Sørensen–Dice, Jaccard, Tanimoto, cosine, & overlap measures,
+    but rather than comparing the q-grams of each pair, each collection is
+    encoded as a sparse matrix over a shared q-gram vocabulary (in which each
+    q-gram occurring c times in a term is c distinct features) and the
+    intersection magnitudes of whole blocks of queries & candidates are
+    computed together with NumPy array operations, from the candidates
+    having each feature of the queries. The only difference from cdist is
+    that a term with no q-grams (e.g. whitespace, with qval=0) scores 0 by
+    cosine & overlap similarity, where the pairwise functions fail.
+
+    :param list queries: a collection of terms or a string that can be split
+    :param list candidates: a collection of terms or a string that can be
+        split; if None, queries are compared with each other
+    :param function metric: sim_tversky, sim_dice, sim_jaccard, sim_tanimoto,
+        sim_cosine, sim_overlap, or the corresponding distance function
+    :param float threshold: if set, only the pairs scoring at least (or, for
+        distance functions, at most) this are returned
+    :param int block_size: the number of queries scored at once; by default,
+        enough to compute about four million scores at once
+    :param kwargs: any additional arguments to metric (qval, alpha, beta, &
+        bias)
+    :returns: a matrix, in which the value at [i, j] is the score of the i-th
+        query & the j-th candidate, or, if threshold is set, the query
+        indices, candidate indices, & scores of the pairs passing it
+    :rtype: numpy.ndarray or tuple of numpy.ndarray
+
+    >>> qgram_cdist(['Niall', 'Neil'], ['Neal', 'Nigel', 'Niall'])
+    array([[0.375     , 0.33333333, 1.        ],
+           [0.42857143, 0.22222222, 0.22222222]])
+    >>> rows, cols, scores = qgram_cdist(['Niall', 'Neil', 'Nigel'],
+    ...                                  metric=sim_dice, threshold=0.5)
+    >>> rows.tolist(), cols.tolist(), scores.tolist()
+    ([0, 0, 1, 2, 2], [0, 2, 1, 0, 2], [1.0, 0.5, 1.0, 0.5, 1.0])
+    """
+    if metric not in _SET_METRICS:
+        raise ValueError('metric must be a Tversky, Dice, Jaccard, Tanimoto, '
+                         'cosine, or overlap function')
+    measure, distance = _SET_METRICS[metric]
+    alpha, beta = kwargs.get('alpha', 1), kwargs.get('beta', 1)
+    bias = kwargs.get('bias')
+    if measure is not None:
+        alpha, beta, bias = 1, 1, None
+        if isinstance(measure, tuple):
+            alpha, beta = measure
+    elif alpha < 0 or beta < 0:
+        raise ValueError('Unsupported weight assignment; alpha and beta ' +
+                         'must be greater than or equal to 0.')
+
+    if hasattr(queries, 'split'):
+        queries = queries.split()
+    queries = list(queries)
+    if candidates is None:
+        candidates = queries
+    else:
+        if hasattr(candidates, 'split'):
+            candidates = candidates.split()
+        candidates = list(candidates)
+    n_queries, n_cands = len(queries), len(candidates)
+
+    store = QGramProfileStore(queries + candidates, kwargs.get('qval', 2))
+    indptr, features, n_features = _binary_features(*store.csr())
+    magnitudes = store.magnitudes.astype(np_float64)
+    query_mags, cand_mags = magnitudes[:n_queries], magnitudes[n_queries:]
+
+    # the candidates' postings: the candidates having each feature
+    cand_features = features[indptr[n_queries]:]
+    cand_rows = np_repeat(np_arange(n_cands), indptr[n_queries+1:] -
+                          indptr[n_queries:-1])
+    order = cand_features.argsort(kind='mergesort')
+    cand_rows = cand_rows[order]
+    cand_indptr = np_concatenate(([0], np_cumsum(np_bincount(
+        cand_features, minlength=n_features)))).astype(np_intp)
+
+    cand_index = {}
+    for j, cand in enumerate(candidates):
+        cand_index.setdefault(cand, []).append(j)
+    empty_cands = [j for j, cand in enumerate(candidates) if not cand]
+
+    if block_size is None:
+        block_size = max(1, _BLOCK_CELLS // max(1, n_cands))
+    if threshold is None:
+        matrix = np_zeros((n_queries, n_cands), dtype=np_float64)
+    else:
+        found = ([], [], [])
+
+    for start in range(0, n_queries, block_size):
+        stop = min(start + block_size, n_queries)
+        inter = _intersections(
+            features[indptr[start]:indptr[stop]],
+            np_repeat(np_arange(stop - start),
+                      indptr[start+1:stop+1] - indptr[start:stop]),
+            cand_indptr, cand_rows, stop - start, n_cands).astype(np_float64)
+        src_mag = query_mags[start:stop, None]
+        tar_mag = cand_mags[None, :]
+
+        with np_errstate(divide='ignore', invalid='ignore'):
+            if measure == 'cosine':
+                scores = inter / np_sqrt(src_mag * tar_mag)
+            elif measure == 'overlap':
+                scores = inter / np_minimum(src_mag, tar_mag)
+            elif bias is None:
+                scores = inter / (inter + alpha * (src_mag - inter) +
+                                  beta * (tar_mag - inter))
+            else:
+                a_val = np_minimum(src_mag - inter, tar_mag - inter)
+                b_val = np_maximum(src_mag - inter, tar_mag - inter)
+                c_val = inter + bias
+                scores = c_val / (beta * (alpha * a_val + (1 - alpha) *
+                                          b_val) + c_val)
+        # empty terms & profiles score 0, identical terms 1
+        scores[(src_mag == 0) | (tar_mag == 0)] = 0.0
+        for i in range(start, stop):
+            if not queries[i]:
+                scores[i - start] = 0.0
+            else:
+                scores[i - start, empty_cands] = 0.0
+            scores[i - start, cand_index.get(queries[i], [])] = 1.0
+        if distance:
+            scores = 1 - scores
+
+        if threshold is None:
+            matrix[start:stop] = scores
+        else:
+            rows, cols = np_nonzero(scores <= threshold if distance else
+                                    scores >= threshold)
+            found[0].append(rows + start)
+            found[1].append(cols)
+            found[2].append(scores[rows, cols])
+
+    if threshold is None:
+        return matrix
+    if not found[0]:
+        return (np_zeros(0, dtype=np_intp), np_zeros(0, dtype=np_intp),
+                np_zeros(0, dtype=np_float64))
+    return tuple(np_concatenate(part) for part in found)
+
+
+def top_k(query, candidates, metric=sim_levenshtein, k=10, threshold=None,
+          largest=None, **kwargs):
+    """Return the best-scoring candidates for a query.
+
+    The query is prepared only once and the candidates are streamed, keeping
+    only the best k seen. Where metric supports it (e.g. the unit-cost
+    Levenshtein measures), the score of the k-th best candidate so far (or
+    the threshold) bounds the computation of further scores.
+
+    :param str query: the query term
+    :param iterable candidates: the candidate terms (any iterable, including a
+        generator)
+    :param function metric: a similarity or distance function
+    :param int k: the number of candidates to return; if None, all candidates
+        passing the threshold are returned
+    :param float threshold: if set, only candidates scoring at least (or, if
+        largest is False, at most) this are returned
+    :param bool largest: True if greater scores are better, as for similarity
+        functions, or False if lesser scores are better, as for distance
+        functions; by default, inferred for the measures of the distance
+        package & functions named with the prefix 'sim' or 'dist' (it must be
+        set for other functions)
+    :param kwargs: any additional arguments to metric
+    :returns: (candidate, score) pairs, best first; ties are ordered as in
+        candidates
+    :rtype: list
+
+    >>> top_k('Niall', ['Neal', 'Nigel', 'Niall', 'Neil', 'Nile'], k=3)
+    [('Niall', 1.0), ('Neal', 0.6), ('Nigel', 0.6)]
+    >>> top_k('Niall', ['Neal', 'Nigel', 'Niall', 'Neil', 'Nile'],
+    ...       metric=levenshtein, k=2)
+    [('Niall', 0), ('Neal', 2)]
+    >>> top_k('Niall', ['Neal', 'Nigel', 'Niall', 'Neil', 'Nile'],
+    ...       metric=levenshtein, k=None, threshold=1)
+    [('Niall', 0)]
+    """
+    if not callable(metric):
+        raise ValueError('metric must be a function')
+    if largest is None:
+        largest = _greater_is_better(metric)
+        if largest is None:
+            raise ValueError('largest must be set for ' +
+                             getattr(metric, '__name__', repr(metric)))
+    if k is not None and k < 1:
+        return []
+
+    prep_query, prep_cand, score, better = _preparation(metric, kwargs)
+    query = prep_query(query)
+    prune = better is largest
+    sign = 1 if largest else -1
+
+    # heap holds (signed score, -index, candidate), worst kept on top
+    heap = []
+    bound = threshold
+    for idx, cand in enumerate(candidates):
+        value = score(query, prep_cand(cand), bound if prune else None)
+        if threshold is not None and sign * value < sign * threshold:
+            continue
+        item = (sign * value, -idx, cand)
+        if k is None or len(heap) < k:
+            heappush(heap, item)
+        elif item > heap[0]:
+            heapreplace(heap, item)
+        else:
+            continue
+        if k is not None and len(heap) == k:
+            bound = sign * heap[0][0]
+
+    return [(cand, sign * value) for value, _, cand in
+            sorted(heap, reverse=True)]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -25,16 +25,108 @@ from __future__ import division, unicode_literals
 
 from unicodedata import normalize as unicode_normalize
 
-from numpy import int as np_int
-from numpy import zeros as np_zeros
-
 from six import text_type
-from six.moves import range
 
-__all__ = ['dist_editex', 'editex', 'sim_editex']
+from ._dp import _dp_score
+
+__all__ = ['dist_editex', 'editex', 'editex_many', 'sim_editex']
+
+# each letter's Editex letter groups, as a bitmask of _EDITEX_GROUPS indices
+_EDITEX_GROUPS = ('AEIOUY', 'BP', 'CKQ', 'DT', 'LR', 'MN', 'GJ', 'FPV', 'SXZ',
+                  'CSZ')
+_EDITEX_GROUP_MASKS = {
+    letter: sum(1 << bit for bit, group in enumerate(_EDITEX_GROUPS)
+                if letter in group)
+    for letter in set(''.join(_EDITEX_GROUPS))}
+
+
+def _editex_normalize(term):
+    """Return a term as Editex compares it.
+
+    :param str term: the term to normalize
+    :returns: the term, upper-cased & NFKD normalized, with ß converted to SS
+    :rtype: str
+
+    >>> _editex_normalize('Straße')
+    'STRASSE'
+    """
+    # convert to NFKD normalized unicode & ß to SS (for Python2)
+    return unicode_normalize('NFKD', text_type(term.upper())).replace('ß',
+                                                                      'SS')
+
+
+def _editex_r_costs(cost):
+    """Return the function r(a,b) according to Zobel & Dart's definition.
+
+    :param tuple cost: the match, same-group, and mismatch costs
+    :returns: a function of a character & a string, returning r(a,b) between
+        the character & each character of the string
+    :rtype: function
+
+    >>> _editex_r_costs((0, 1, 2))('C', 'KDCS')
+    [1, 2, 0, 1]
+    """
+    match_cost, group_cost, mismatch_cost = cost
+    masks = _EDITEX_GROUP_MASKS
+
+    def _r_costs(char, term):
+        mask = masks.get(char, 0)
+        return [match_cost if char == other else
+                group_cost if mask & masks.get(other, 0) else
+                mismatch_cost for other in term]
+
+    return _r_costs
+
+
+def _editex_d_costs(term, cost):
+    """Return d(a,b) according to Zobel & Dart's definition for each letter.
+
+    :param str term: a normalized term
+    :param tuple cost: the match, same-group, and mismatch costs
+    :returns: the cost of inserting or deleting each character of term, i.e.
+        d(preceding character, character)
+    :rtype: list
+
+    >>> _editex_d_costs('NIHAL', (0, 1, 2))
+    [2, 2, 2, 1, 2]
+    """
+    match_cost, group_cost, mismatch_cost = cost
+    masks = _EDITEX_GROUP_MASKS
+    return [match_cost if prev == char else
+            group_cost if (prev == 'H' or prev == 'W' or
+                           masks.get(prev, 0) & masks.get(char, 0)) else
+            mismatch_cost for prev, char in zip(' '+term, term)]
+
+
+def _editex(src, tar, src_costs, tar_costs, cost, local):
+    """Return the Editex distance between two normalized strings.
+
+    :param str src: normalized source string for comparison
+    :param str tar: normalized target string for comparison
+    :param list src_costs: the d(a,b) costs of src, from _editex_d_costs()
+    :param list tar_costs: the d(a,b) costs of tar, from _editex_d_costs()
+    :param tuple cost: the match, same-group, and mismatch costs
+    :param bool local: if True, the local variant of Editex is used
+    :returns: Editex distance
+    :rtype: int
 
+    >>> _editex('NIALL', 'NEIL', _editex_d_costs('NIALL', (0, 1, 2)),
+    ...         _editex_d_costs('NEIL', (0, 1, 2)), (0, 1, 2), False)
+    2
+    """
+    if src == tar:
+        return 0
+    if not src:
+        return len(tar) * cost[2]
+    if not tar:
+        return len(src) * cost[2]
+
+    return _dp_score(src, tar, tar_costs, src_costs, None,
+                     first_col=([0] * (len(src)+1) if local else None),
+                     row_cost=_editex_r_costs(cost))
 
-def editex(src, tar, cost=(0, 1, 2), local=False):
+
+def editex(src, tar, cost=(0, 1, 2), local=False, normalized=False):
     """Return the Editex distance between two strings.
 
     As described on pages 3 & 4 of :cite:`Zobel:1996`.
@@ -47,6 +139,9 @@ def editex(src, tar, cost=(0, 1, 2), local=False):
         edits:
         match, same-group, and mismatch respectively (by default: (0, 1, 2))
     :param bool local: if True, the local variant of Editex is used
+    :param bool normalized: if True, src & tar are taken to be normalized
+        already (i.e. upper-cased & NFKD normalized, with ß converted to SS),
+        as when comparing stored terms repeatedly
     :returns: Editex distance
     :rtype: int
 
@@ -58,73 +153,53 @@ def editex(src, tar, cost=(0, 1, 2), local=False):
     12
     >>> editex('ATCG', 'TAGC')
     6
+    >>> editex('NIALL', 'NEIL', normalized=True)
+    2
     """
-    match_cost, group_cost, mismatch_cost = cost
-    letter_groups = ({'A', 'E', 'I', 'O', 'U', 'Y'},
-                     {'B', 'P'},
-                     {'C', 'K', 'Q'},
-                     {'D', 'T'},
-                     {'L', 'R'},
-                     {'M', 'N'},
-                     {'G', 'J'},
-                     {'F', 'P', 'V'},
-                     {'S', 'X', 'Z'},
-                     {'C', 'S', 'Z'})
-    all_letters = {'A', 'B', 'C', 'D', 'E', 'F', 'G', 'I', 'J', 'K', 'L', 'M',
-                   'N', 'O', 'P', 'Q', 'R', 'S', 'T', 'U', 'V', 'X', 'Y', 'Z'}
-
-    def r_cost(ch1, ch2):
-        """Return r(a,b) according to Zobel & Dart's definition."""
-        if ch1 == ch2:
-            return match_cost
-        if ch1 in all_letters and ch2 in all_letters:
-            for group in letter_groups:
-                if ch1 in group and ch2 in group:
-                    return group_cost
-        return mismatch_cost
-
-    def d_cost(ch1, ch2):
-        """Return d(a,b) according to Zobel & Dart's definition."""
-        if ch1 != ch2 and (ch1 == 'H' or ch1 == 'W'):
-            return group_cost
-        return r_cost(ch1, ch2)
-
-    # convert both src & tar to NFKD normalized unicode
-    src = unicode_normalize('NFKD', text_type(src.upper()))
-    tar = unicode_normalize('NFKD', text_type(tar.upper()))
-    # convert ß to SS (for Python2)
-    src = src.replace('ß', 'SS')
-    tar = tar.replace('ß', 'SS')
+    if not normalized:
+        src = _editex_normalize(src)
+        tar = _editex_normalize(tar)
+
+    return _editex(src, tar, _editex_d_costs(src, cost),
+                   _editex_d_costs(tar, cost), cost, local)
 
-    if src == tar:
-        return 0
-    if not src:
-        return len(tar) * mismatch_cost
-    if not tar:
-        return len(src) * mismatch_cost
 
-    d_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_int)
-    lens = len(src)
-    lent = len(tar)
-    src = ' '+src
-    tar = ' '+tar
+def editex_many(query, candidates, cost=(0, 1, 2), local=False,
+                normalized=False):
+    """Return the Editex distances between a query and many candidates.
 
-    if not local:
-        for i in range(1, lens+1):
-            d_mat[i, 0] = d_mat[i-1, 0] + d_cost(src[i-1], src[i])
-    for j in range(1, lent+1):
-        d_mat[0, j] = d_mat[0, j-1] + d_cost(tar[j-1], tar[j])
+    This is equivalent to [editex(query, cand) for cand in candidates], but
+    the query is normalized & its insert/delete costs computed only once.
 
-    for i in range(1, lens+1):
-        for j in range(1, lent+1):
-            d_mat[i, j] = min(d_mat[i-1, j] + d_cost(src[i-1], src[i]),
-                              d_mat[i, j-1] + d_cost(tar[j-1], tar[j]),
-                              d_mat[i-1, j-1] + r_cost(src[i], tar[j]))
+    :param str query: the query string
+    :param iterable candidates: the candidate strings
+    :param tuple cost: a 3-tuple representing the cost of the four possible
+        edits:
+        match, same-group, and mismatch respectively (by default: (0, 1, 2))
+    :param bool local: if True, the local variant of Editex is used
+    :param bool normalized: if True, query & candidates are taken to be
+        normalized already (i.e. upper-cased & NFKD normalized, with ß
+        converted to SS)
+    :returns: the Editex distance between the query & each candidate
+    :rtype: list
+
+    >>> editex_many('Niall', ['Neil', 'Nigel', 'Niall', 'Colin'])
+    [2, 3, 0, 8]
+    """
+    if not normalized:
+        query = _editex_normalize(query)
+    query_costs = _editex_d_costs(query, cost)
 
-    return d_mat[lens, lent]
+    distances = []
+    for cand in candidates:
+        if not normalized:
+            cand = _editex_normalize(cand)
+        distances.append(_editex(query, cand, query_costs,
+                                 _editex_d_costs(cand, cost), cost, local))
+    return distances
 
 
-def dist_editex(src, tar, cost=(0, 1, 2), local=False):
+def dist_editex(src, tar, cost=(0, 1, 2), local=False, normalized=False):
     """Return the normalized Editex distance between two strings.
 
     The Editex distance is normalized by dividing the Editex distance
@@ -140,6 +215,9 @@ def dist_editex(src, tar, cost=(0, 1, 2), local=False):
         edits:
         match, same-group, and mismatch respectively (by default: (0, 1, 2))
     :param bool local: if True, the local variant of Editex is used
+    :param bool normalized: if True, src & tar are taken to be normalized
+        already (i.e. upper-cased & NFKD normalized, with ß converted to SS),
+        as when comparing stored terms repeatedly
     :returns: normalized Editex distance
     :rtype: float
 
@@ -151,15 +229,17 @@ def dist_editex(src, tar, cost=(0, 1, 2), local=False):
     0.75
     >>> dist_editex('ATCG', 'TAGC')
     0.75
+    >>> round(dist_editex('NIALL', 'NEIL', normalized=True), 12)
+    0.2
     """
     if src == tar:
         return 0
     mismatch_cost = cost[2]
-    return (editex(src, tar, cost, local) /
+    return (editex(src, tar, cost, local, normalized) /
             (max(len(src)*mismatch_cost, len(tar)*mismatch_cost)))
 
 
-def sim_editex(src, tar, cost=(0, 1, 2), local=False):
+def sim_editex(src, tar, cost=(0, 1, 2), local=False, normalized=False):
     """Return the normalized Editex similarity of two strings.
 
     The Editex similarity is the complement of Editex distance:
@@ -171,6 +251,9 @@ def sim_editex(src, tar, cost=(0, 1, 2), local=False):
         edits:
         match, same-group, and mismatch respectively (by default: (0, 1, 2))
     :param bool local: if True, the local variant of Editex is used
+    :param bool normalized: if True, src & tar are taken to be normalized
+        already (i.e. upper-cased & NFKD normalized, with ß converted to SS),
+        as when comparing stored terms repeatedly
     :returns: normalized Editex similarity
     :rtype: float
 
@@ -182,8 +265,10 @@ def sim_editex(src, tar, cost=(0, 1, 2), local=False):
     0.25
     >>> sim_editex('ATCG', 'TAGC')
     0.25
+    >>> round(sim_editex('NIALL', 'NEIL', normalized=True), 12)
+    0.8
     """
-    return 1 - dist_editex(src, tar, cost, local)
+    return 1 - dist_editex(src, tar, cost, local, normalized)
 
 
 if __name__ == '__main__':
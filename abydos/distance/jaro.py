@@ -28,15 +28,27 @@ The distance.jaro module implements distance metrics based on
 
 from __future__ import division, unicode_literals
 
-from collections import defaultdict
-
 from six.moves import range
 
 from ..tokenizer.qgram import QGrams
 
 
-__all__ = ['dist_jaro_winkler', 'dist_strcmp95', 'sim_jaro_winkler',
-           'sim_strcmp95']
+__all__ = ['dist_jaro_winkler', 'dist_strcmp95', 'jaro_winkler_many',
+           'sim_jaro_winkler', 'sim_strcmp95']
+
+# The adjwt table is used to give partial credit for characters that may be
+# errors due to known phonetic or character recognition errors. A typical
+# example is to match the letter "O" with the number "0"
+_STRCMP95_SP_MX = (
+    ('A', 'E'), ('A', 'I'), ('A', 'O'), ('A', 'U'), ('B', 'V'), ('E', 'I'),
+    ('E', 'O'), ('E', 'U'), ('I', 'O'), ('I', 'U'), ('O', 'U'), ('I', 'Y'),
+    ('E', 'Y'), ('C', 'G'), ('E', 'F'), ('W', 'U'), ('W', 'V'), ('X', 'K'),
+    ('S', 'Z'), ('X', 'S'), ('Q', 'C'), ('U', 'V'), ('M', 'N'), ('L', 'I'),
+    ('Q', 'O'), ('P', 'R'), ('I', 'J'), ('2', 'Z'), ('5', 'S'), ('8', 'B'),
+    ('1', 'I'), ('1', 'L'), ('0', 'O'), ('0', 'Q'), ('C', 'K'), ('G', 'J')
+)
+_STRCMP95_ADJWT = {pair: 3 for sp_pair in _STRCMP95_SP_MX
+                   for pair in (sp_pair, sp_pair[::-1])}
 
 
 def sim_strcmp95(src, tar, long_strings=False):
@@ -85,24 +97,6 @@ def sim_strcmp95(src, tar, long_strings=False):
     if not ying or not yang:
         return 0.0
 
-    adjwt = defaultdict(int)
-    sp_mx = (
-        ('A', 'E'), ('A', 'I'), ('A', 'O'), ('A', 'U'), ('B', 'V'), ('E', 'I'),
-        ('E', 'O'), ('E', 'U'), ('I', 'O'), ('I', 'U'), ('O', 'U'), ('I', 'Y'),
-        ('E', 'Y'), ('C', 'G'), ('E', 'F'), ('W', 'U'), ('W', 'V'), ('X', 'K'),
-        ('S', 'Z'), ('X', 'S'), ('Q', 'C'), ('U', 'V'), ('M', 'N'), ('L', 'I'),
-        ('Q', 'O'), ('P', 'R'), ('I', 'J'), ('2', 'Z'), ('5', 'S'), ('8', 'B'),
-        ('1', 'I'), ('1', 'L'), ('0', 'O'), ('0', 'Q'), ('C', 'K'), ('G', 'J')
-    )
-
-    # Initialize the adjwt array on the first call to the function only.
-    # The adjwt array is used to give partial credit for characters that
-    # may be errors due to known phonetic or character recognition errors.
-    # A typical example is to match the letter "O" with the number "0"
-    for i in sp_mx:
-        adjwt[(i[0], i[1])] = 3
-        adjwt[(i[1], i[0])] = 3
-
     if len(ying) > len(yang):
         search_range = len(ying)
         minv = len(yang)
@@ -152,8 +146,8 @@ def sim_strcmp95(src, tar, long_strings=False):
             if ying_flag[i] == 0 and _in_range(ying[i]):
                 for j in range(len(yang)):
                     if yang_flag[j] == 0 and _in_range(yang[j]):
-                        if (ying[i], yang[j]) in adjwt:
-                            n_simi += adjwt[(ying[i], yang[j])]
+                        if (ying[i], yang[j]) in _STRCMP95_ADJWT:
+                            n_simi += _STRCMP95_ADJWT[(ying[i], yang[j])]
                             yang_flag[j] = 2
                             break
     num_sim = n_simi/10.0 + num_com
@@ -282,9 +276,45 @@ def sim_jaro_winkler(src, tar, qval=1, mode='winkler', long_strings=False,
     if src == tar:
         return 1.0
 
-    src = QGrams(src.strip(), qval).ordered_list
-    tar = QGrams(tar.strip(), qval).ordered_list
+    return _jaro_winkler(_jaro_tokens(src, qval), _jaro_tokens(tar, qval),
+                         mode, long_strings, boost_threshold, scaling_factor)
+
+
+def _jaro_tokens(term, qval):
+    """Return the tokens of a term that Jaro(-Winkler) similarity matches.
+
+    :param str term: the term to tokenize
+    :param int qval: the length of each q-gram
+    :returns: the stripped term itself (for character-wise matching, i.e.
+        qval=1) or its list of q-grams
+    :rtype: str or list
+
+    >>> _jaro_tokens(' Niall ', 1)
+    'Niall'
+    >>> _jaro_tokens('Niall', 2)
+    ['$N', 'Ni', 'ia', 'al', 'll', 'l#']
+    """
+    if qval == 1:
+        return term.strip()
+    return QGrams(term.strip(), qval).ordered_list
 
+
+def _jaro_winkler(src, tar, mode, long_strings, boost_threshold,
+                  scaling_factor):
+    """Return the Jaro or Jaro-Winkler similarity of two token sequences.
+
+    :param src: source tokens for comparison, from _jaro_tokens()
+    :param tar: target tokens for comparison, from _jaro_tokens()
+    :param str mode: 'winkler' or 'jaro'
+    :param bool long_strings: whether to adjust for long strings
+    :param float boost_threshold: the threshold for the Winkler boost
+    :param float scaling_factor: the scale of the Winkler boost
+    :returns: Jaro or Jaro-Winkler similarity
+    :rtype: float
+
+    >>> round(_jaro_winkler('Niall', 'Neil', 'winkler', False, 0.7, 0.1), 12)
+    0.805
+    """
     lens = len(src)
     lent = len(tar)
 
@@ -307,15 +337,29 @@ def sim_jaro_winkler(src, tar, qval=1, mode='winkler', long_strings=False,
     # Looking only within the search range, count and flag the matched pairs.
     num_com = 0
     yl1 = lent - 1
-    for i in range(lens):
-        low_lim = (i - search_range) if (i >= search_range) else 0
-        hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
-        for j in range(low_lim, hi_lim+1):
-            if (tar_flag[j] == 0) and (tar[j] == src[i]):
+    if hasattr(tar, 'find'):
+        # character-wise, so the first unflagged match within the range can
+        # be searched for with str.find
+        for i in range(lens):
+            low_lim = (i - search_range) if (i >= search_range) else 0
+            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
+            j = tar.find(src[i], low_lim, hi_lim+1)
+            while j != -1 and tar_flag[j]:
+                j = tar.find(src[i], j+1, hi_lim+1)
+            if j != -1:
                 tar_flag[j] = 1
                 src_flag[i] = 1
                 num_com += 1
-                break
+    else:
+        for i in range(lens):
+            low_lim = (i - search_range) if (i >= search_range) else 0
+            hi_lim = (i + search_range) if ((i + search_range) <= yl1) else yl1
+            for j in range(low_lim, hi_lim+1):
+                if (tar_flag[j] == 0) and (tar[j] == src[i]):
+                    tar_flag[j] = 1
+                    src_flag[i] = 1
+                    num_com += 1
+                    break
 
     # If no characters in common - return
     if num_com == 0:
@@ -360,6 +404,61 @@ def sim_jaro_winkler(src, tar, qval=1, mode='winkler', long_strings=False,
     return weight
 
 
+def jaro_winkler_many(query, candidates, qval=1, mode='winkler',
+                      long_strings=False, boost_threshold=0.7,
+                      scaling_factor=0.1):
+    """Return the Jaro or Jaro-Winkler similarities of a query & candidates.
+
+    This is equivalent to [sim_jaro_winkler(query, cand) for cand in
+    candidates], but the arguments are checked & the query is stripped &
+    tokenized only once.
+
+    :param str query: the query string
+    :param iterable candidates: the candidate strings
+    :param int qval: the length of each q-gram (defaults to 1: character-wise
+        matching)
+    :param str mode: indicates which variant of this distance metric to
+        compute:
+
+            - 'winkler' -- computes the Jaro-Winkler distance (default) which
+              increases the score for matches near the start of the word
+            - 'jaro' -- computes the Jaro distance
+
+    The following arguments apply only when mode is 'winkler':
+
+    :param bool long_strings: set to True to "Increase the probability of a
+        match when the number of matched characters is large.  This option
+        allows for a little more tolerance when the strings are large.  It is
+        not an appropriate test when comparing fixed length fields such as
+        phone and social security numbers."
+    :param float boost_threshold: a value between 0 and 1, below which the
+        Winkler boost is not applied (defaults to 0.7)
+    :param float scaling_factor: a value between 0 and 0.25, indicating by how
+        much to boost scores for matching prefixes (defaults to 0.1)
+
+    :returns: the Jaro or Jaro-Winkler similarity of the query & each
+        candidate
+    :rtype: list
+
+    >>> sims = jaro_winkler_many('Niall', ['Neil', 'Nigel', 'Niall'])
+    >>> [round(sim, 12) for sim in sims]
+    [0.805, 0.786666666667, 1.0]
+    """
+    if mode == 'winkler':
+        if boost_threshold > 1 or boost_threshold < 0:
+            raise ValueError('Unsupported boost_threshold assignment; ' +
+                             'boost_threshold must be between 0 and 1.')
+        if scaling_factor > 0.25 or scaling_factor < 0:
+            raise ValueError('Unsupported scaling_factor assignment; ' +
+                             'scaling_factor must be between 0 and 0.25.')
+
+    query_tokens = _jaro_tokens(query, qval)
+    return [1.0 if query == cand else
+            _jaro_winkler(query_tokens, _jaro_tokens(cand, qval), mode,
+                          long_strings, boost_threshold, scaling_factor)
+            for cand in candidates]
+
+
 def dist_jaro_winkler(src, tar, qval=1, mode='winkler', long_strings=False,
                       boost_threshold=0.7, scaling_factor=0.1):
     """Return the Jaro or Jaro-Winkler distance between two strings.
@@ -36,13 +36,15 @@ from numpy import zeros as np_zeros
 
 from six.moves import range
 
+from ._dp import _dp_score
 
 __all__ = ['damerau_levenshtein', 'dist_damerau', 'dist_indel',
            'dist_levenshtein', 'levenshtein', 'sim_damerau', 'sim_indel',
            'sim_levenshtein']
 
 
-def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
+def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1), max_distance=None,
+                engine='python'):
     """Return the Levenshtein distance between two strings.
 
     This is the standard edit distance measure. Cf.
@@ -54,7 +56,12 @@ def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
 
     The ordinary Levenshtein & Optimal String Alignment distance both
     employ the Wagner-Fischer dynamic programming algorithm
-    :cite:`Wagner:1974`.
+    :cite:`Wagner:1974`. When all relevant edit costs are 1, the equivalent
+    bit-parallel algorithm of Myers :cite:`Myers:1999` (and Hyyrö's extension
+    of it to transpositions :cite:`Hyyro:2003`, for Optimal String Alignment)
+    is employed instead. Otherwise, with engine='numpy', the Wagner-Fischer
+    DP is filled one anti-diagonal at a time with NumPy array operations,
+    which is much faster for long strings.
 
     Levenshtein edit distance ordinarily has unit insertion, deletion, and
     substitution costs.
@@ -75,6 +82,12 @@ def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     :param tuple cost: a 4-tuple representing the cost of the four possible
         edits: inserts, deletes, substitutions, and transpositions,
         respectively (by default: (1, 1, 1, 1))
+    :param float max_distance: if set, the largest distance of interest;
+        computation is confined to a diagonal band :cite:`Ukkonen:1985` and
+        abandoned as soon as the distance is known to exceed max_distance, in
+        which case max_distance + 1 is returned
+    :param str engine: 'python' (default) or 'numpy', the engine of the
+        Wagner-Fischer DP ('dam' mode is always computed in Python)
     :returns: the Levenshtein distance between src & tar
     :rtype: int (may return a float if cost has float values)
 
@@ -96,44 +109,171 @@ def levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     2
     >>> levenshtein('ACTG', 'TAGC', mode='dam')
     3
+
+    >>> levenshtein('aluminum', 'Catalan', max_distance=3)
+    4
+    >>> levenshtein('Niall', 'Neil', max_distance=3)
+    3
+
+    >>> levenshtein('aluminum', 'Catalan', cost=(1, 1, 0.5, 1),
+    ...             engine='numpy')
+    4.5
     """
+    if engine not in ('python', 'numpy'):
+        raise ValueError("engine must be 'python' or 'numpy'")
+
     ins_cost, del_cost, sub_cost, trans_cost = cost
 
     if src == tar:
         return 0
+
+    if 'dam' in mode:
+        return damerau_levenshtein(src, tar, cost, max_distance)
+
+    if max_distance is not None:
+        if _length_bound(src, tar, cost) > max_distance:
+            return max_distance + 1
     if not src:
         return len(tar) * ins_cost
     if not tar:
         return len(src) * del_cost
 
-    if 'dam' in mode:
-        return damerau_levenshtein(src, tar, cost)
+    if ins_cost == del_cost == sub_cost == 1 and (mode != 'osa' or
+                                                  trans_cost == 1):
+        return _levenshtein_bitparallel(src, tar, mode == 'osa',
+                                        max_distance)
+    return _dp_score(src, tar, ins_cost, del_cost, sub_cost,
+                     trans_cost if mode == 'osa' else None,
+                     max_distance=max_distance, engine=engine)
+
+
+def _length_bound(src, tar, cost):
+    """Return a lower bound on the edit distance, given the string lengths.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param tuple cost: a 4-tuple of edit costs, as for levenshtein()
+    :returns: the cost of the inserts or deletes required to equalize the
+        lengths of src & tar
+    :rtype: int (may return a float if cost has float values)
+
+    >>> _length_bound('Niall', 'Neil', (1, 1, 1, 1))
+    1
+    >>> _length_bound('cat', 'cart', (2, 1, 1, 1))
+    2
+    """
+    if len(src) > len(tar):
+        return (len(src) - len(tar)) * cost[1]
+    return (len(tar) - len(src)) * cost[0]
+
 
-    d_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_int)
-    for i in range(len(src)+1):
-        d_mat[i, 0] = i * del_cost
-    for j in range(len(tar)+1):
-        d_mat[0, j] = j * ins_cost
+def _myers_peq(src):
+    """Return the match bit-vectors of the characters of a pattern string.
 
-    for i in range(len(src)):
-        for j in range(len(tar)):
-            d_mat[i+1, j+1] = min(
-                d_mat[i+1, j] + ins_cost,  # ins
-                d_mat[i, j+1] + del_cost,  # del
-                d_mat[i, j] + (sub_cost if src[i] != tar[j] else 0)  # sub/==
-            )
+    :param str src: the pattern string
+    :returns: a dict mapping each character of src to a bit-vector, in which
+        bit i is set if src[i] is that character
+    :rtype: dict
+
+    >>> sorted(_myers_peq('Niall').items())
+    [('N', 1), ('a', 4), ('i', 2), ('l', 24)]
+    """
+    peq = {}
+    for i, char in enumerate(src):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
 
-            if mode == 'osa':
-                if ((i+1 > 1 and j+1 > 1 and src[i] == tar[j-1] and
-                     src[i-1] == tar[j])):
-                    # transposition
-                    d_mat[i+1, j+1] = min(d_mat[i+1, j+1],
-                                          d_mat[i-1, j-1] + trans_cost)
 
-    return d_mat[len(src), len(tar)]
+def _levenshtein_bitparallel(src, tar, transpositions=False,
+                             max_distance=None, peq=None):
+    """Return the unit-cost Levenshtein or OSA distance between two strings.
 
+    This is Myers' bit-vector algorithm :cite:`Myers:1999`, in the formulation
+    of Hyyrö :cite:`Hyyro:2003`, which also describes the extension that
+    permits adjacent transpositions (Optimal String Alignment distance).
+    Each column of the dynamic programming matrix is encoded as a pair of
+    bit-vectors of vertical deltas (+1 & -1), so a whole column is computed
+    in a constant number of bitwise operations. Python's arbitrary precision
+    integers serve as the bit-vectors, so src may be of any length.
 
-def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param bool transpositions: if True, compute the Optimal String Alignment
+        distance rather than the Levenshtein distance
+    :param float max_distance: if set, the computation is abandoned as soon as
+        the distance is known to exceed this bound, in which case
+        max_distance + 1 is returned
+    :param dict peq: the match bit-vectors of src, as returned by _myers_peq(),
+        if these have already been computed
+    :returns: the distance between src & tar
+    :rtype: int
+
+    >>> _levenshtein_bitparallel('Niall', 'Neil')
+    3
+    >>> _levenshtein_bitparallel('ATCG', 'TAGC')
+    3
+    >>> _levenshtein_bitparallel('ATCG', 'TAGC', transpositions=True)
+    2
+    >>> _levenshtein_bitparallel('aluminum', 'Catalan', max_distance=3)
+    4
+    """
+    if not src:
+        if max_distance is not None and len(tar) > max_distance:
+            return max_distance + 1
+        return len(tar)
+
+    if peq is None:
+        peq = _myers_peq(src)
+
+    mask = (1 << len(src)) - 1
+    high_bit = 1 << (len(src) - 1)
+    vp, vn = mask, 0
+    d0, prev_eq = 0, 0
+    distance = len(src)
+
+    # When bounded, the value on the diagonal that ends in the final cell is
+    # tracked, since values never decrease along a diagonal. diag_row is the
+    # row of that diagonal in the current column.
+    diag_row = len(src) - len(tar)
+    diag = abs(diag_row)
+
+    for char in tar:
+        eq = peq.get(char, 0)
+        if transpositions:
+            tr = (((~d0 & eq) << 1) & prev_eq)
+            prev_eq = eq
+        else:
+            tr = 0
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn | tr
+        hp = (vn | ~(d0 | vp)) & mask
+        hn = d0 & vp
+        if hp & high_bit:
+            distance += 1
+        elif hn & high_bit:
+            distance -= 1
+        hp = ((hp << 1) | 1) & mask
+        hn = (hn << 1) & mask
+        vp = (hn | ~(d0 | hp)) & mask
+        vn = hp & d0
+
+        if max_distance is not None:
+            diag_row += 1
+            if diag_row > 0:
+                # step down the diagonal: the horizontal delta in the row
+                # above, then the vertical delta into the new row
+                bit = 1 << (diag_row - 1)
+                diag += (((hp & bit) > 0) - ((hn & bit) > 0) +
+                         ((vp & bit) > 0) - ((vn & bit) > 0))
+                if diag > max_distance:
+                    return max_distance + 1
+
+    if max_distance is not None and distance > max_distance:
+        return max_distance + 1
+    return distance
+
+
+def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1),
+                     max_distance=None, engine='python'):
     """Return the normalized Levenshtein distance between two strings.
 
     The Levenshtein distance is normalized by dividing the Levenshtein distance
@@ -159,6 +299,11 @@ def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     :param tuple cost: a 4-tuple representing the cost of the four possible
         edits: inserts, deletes, substitutions, and transpositions,
         respectively (by default: (1, 1, 1, 1))
+    :param float max_distance: if set, the largest normalized distance of
+        interest; if the normalized distance exceeds this, computation is
+        abandoned early and 1.0 is returned
+    :param str engine: 'python' (default) or 'numpy', the engine of the
+        Wagner-Fischer DP, as for levenshtein
     :returns: normalized Levenshtein distance
     :rtype: float
 
@@ -170,15 +315,28 @@ def dist_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     0.875
     >>> dist_levenshtein('ATCG', 'TAGC')
     0.75
+    >>> dist_levenshtein('ATCG', 'TAGC', max_distance=0.5)
+    1.0
     """
+    if engine not in ('python', 'numpy'):
+        raise ValueError("engine must be 'python' or 'numpy'")
     if src == tar:
         return 0
     ins_cost, del_cost = cost[:2]
-    return (levenshtein(src, tar, mode, cost) /
-            (max(len(src)*del_cost, len(tar)*ins_cost)))
+    normalizer = max(len(src)*del_cost, len(tar)*ins_cost)
+    if max_distance is None:
+        return levenshtein(src, tar, mode, cost,
+                           engine=engine) / normalizer
+
+    bound = max_distance * normalizer
+    distance = levenshtein(src, tar, mode, cost, bound, engine)
+    if distance > bound:
+        return 1.0
+    return distance / normalizer
 
 
-def sim_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
+def sim_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1),
+                    engine='python'):
     """Return the Levenshtein similarity of two strings.
 
     Normalized Levenshtein similarity is the complement of normalized
@@ -202,6 +360,8 @@ def sim_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
         edits:
         inserts, deletes, substitutions, and transpositions, respectively
         (by default: (1, 1, 1, 1))
+    :param str engine: 'python' (default) or 'numpy', the engine of the
+        Wagner-Fischer DP, as for levenshtein
     :returns: normalized Levenshtein similarity
     :rtype: float
 
@@ -214,10 +374,10 @@ def sim_levenshtein(src, tar, mode='lev', cost=(1, 1, 1, 1)):
     >>> sim_levenshtein('ATCG', 'TAGC')
     0.25
     """
-    return 1 - dist_levenshtein(src, tar, mode, cost)
+    return 1 - dist_levenshtein(src, tar, mode, cost, engine=engine)
 
 
-def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
+def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1), max_distance=None):
     """Return the Damerau-Levenshtein distance between two strings.
 
     This computes the Damerau-Levenshtein distance :cite:`Damerau:1964`.
@@ -231,6 +391,9 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
         edits:
         inserts, deletes, substitutions, and transpositions, respectively
         (by default: (1, 1, 1, 1))
+    :param float max_distance: if set, the largest distance of interest;
+        computation is abandoned as soon as the distance is known to exceed
+        max_distance, in which case max_distance + 1 is returned
     :returns: the Damerau-Levenshtein distance between src & tar
     :rtype: int (may return a float if cost has float values)
 
@@ -242,11 +405,16 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
     7
     >>> damerau_levenshtein('ATCG', 'TAGC')
     2
+    >>> damerau_levenshtein('aluminum', 'Catalan', max_distance=3)
+    4
     """
     ins_cost, del_cost, sub_cost, trans_cost = cost
 
     if src == tar:
         return 0
+    if max_distance is not None:
+        if _length_bound(src, tar, cost) > max_distance:
+            return max_distance + 1
     if not src:
         return len(tar) * ins_cost
     if not tar:
@@ -278,6 +446,11 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
                           (0 if src[0] == tar[j] else sub_cost))
         d_mat[0, j] = min(del_distance, ins_distance, match_distance)
 
+    # When bounded, skip_floor tracks min(row minimum - row * del_cost) over
+    # the completed rows (and the virtual row before the first), so that
+    # transpositions, which may jump over rows, can be bounded too.
+    skip_floor = min(del_cost, d_mat[0].min())
+
     for i in range(1, len(src)):
         max_src_letter_match_index = (0 if src[i] == tar[0] else -1)
         for j in range(1, len(tar)):
@@ -310,6 +483,17 @@ def damerau_levenshtein(src, tar, cost=(1, 1, 1, 1)):
                               match_distance, swap_distance)
         src_index_by_character[src[i]] = i
 
+        if max_distance is not None:
+            # Any alignment either passes through row i, reaches the first
+            # column below it, or transposes across it from an earlier row.
+            row_min = d_mat[i].min()
+            if min(row_min, (i+1) * del_cost,
+                   skip_floor + trans_cost + (i-1) * del_cost) > max_distance:
+                return max_distance + 1
+            skip_floor = min(skip_floor, row_min - i * del_cost)
+
+    if max_distance is not None and d_mat[-1, -1] > max_distance:
+        return max_distance + 1
     return d_mat[len(src)-1, len(tar)-1]
 
 
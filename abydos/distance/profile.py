@@ -0,0 +1,704 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance.profile.
+
+The distance.profile module implements a store of precomputed q-gram
+profiles, against which the token-based similarity & distance measures of
+the token & minkowski modules can be computed without re-tokenizing:
+
+    - QGramProfileStore
+"""
+
+from __future__ import division, unicode_literals
+
+from array import array
+from collections import Counter
+from math import log, sqrt
+from numbers import Integral, Number
+
+from numpy import array as np_array
+from numpy import intp as np_intp
+
+from six.moves import range
+
+from ..tokenizer.qgram import QGrams
+
+__all__ = ['QGramProfileStore']
+
+_METRICS = frozenset((
+    'chebyshev', 'dist_cosine', 'dist_dice', 'dist_euclidean', 'dist_jaccard',
+    'dist_manhattan', 'dist_minkowski', 'dist_overlap', 'dist_tversky',
+    'euclidean', 'manhattan', 'minkowski', 'sim_cosine', 'sim_dice',
+    'sim_euclidean', 'sim_jaccard', 'sim_manhattan', 'sim_minkowski',
+    'sim_overlap', 'sim_tanimoto', 'sim_tversky', 'tanimoto'))
+
+
+class QGramProfileStore(object):
+    """QGramProfileStore object.
+
+    A q-gram profile store tokenizes each of a collection of terms once, as
+    _get_qgrams() would, and keeps its profile compactly: each distinct q-gram
+    is assigned an integer id from a shared vocabulary, and each profile is
+    held as a run of sorted ids & their counts in flat arrays, alongside the
+    profile's magnitude (its total count of q-grams).
+
+    The similarity & distance methods take the same parameters as the
+    functions of the same names in the token & minkowski modules (except
+    qval, which is fixed for the store) and return the same values, but each
+    of src & tar may be the id of a stored term, a term (which is tokenized
+    for the call), or a profile returned by prepare().
+    """
+
+    def __init__(self, terms=(), qval=2, skip=0):
+        """Initialize QGramProfileStore.
+
+        :param iterable terms: the terms to store initially
+        :param int qval: the length of each q-gram; 0 for non-q-gram version
+        :param int skip: the number of characters to skip
+
+        >>> store = QGramProfileStore(['Niall', 'Neil'])
+        >>> len(store)
+        2
+        >>> store.sim_jaccard(0, 1)
+        0.2222222222222222
+        """
+        self.qval = qval
+        self.skip = skip
+        self._vocabulary = {}
+        self._terms = []
+        self._indptr = array('l', [0])
+        self._ids = array('l')
+        self._counts = array('l')
+        self._magnitudes = array('l')
+
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        """Return the number of stored terms.
+
+        :returns: the number of stored terms
+        :rtype: int
+        """
+        return len(self._terms)
+
+    @property
+    def vocabulary(self):
+        """Return the q-gram vocabulary.
+
+        :returns: a map from each q-gram of the stored terms to its id
+        :rtype: dict
+        """
+        return self._vocabulary
+
+    def _tokenize(self, term):
+        """Return the q-grams of a term, as _get_qgrams() computes them.
+
+        :param str term: the term to tokenize
+        :returns: the q-grams (or whitespace-delimited tokens) of term
+        :rtype: Counter
+        """
+        if self.qval > 0:
+            return QGrams(term, self.qval, '$#', self.skip)
+        return Counter(term.strip().split())
+
+    def add(self, term):
+        """Add a term to the store.
+
+        :param str term: the term to add
+        :returns: the id of the term
+        :rtype: int
+
+        >>> store = QGramProfileStore()
+        >>> store.add('Niall'), store.add('Neil')
+        (0, 1)
+        >>> store.term(1)
+        'Neil'
+        """
+        vocabulary = self._vocabulary
+        profile = []
+        for qgram, count in self._tokenize(term).items():
+            if qgram not in vocabulary:
+                vocabulary[qgram] = len(vocabulary)
+            profile.append((vocabulary[qgram], count))
+        profile.sort()
+
+        self._ids.extend(qgram_id for qgram_id, _ in profile)
+        self._counts.extend(count for _, count in profile)
+        self._indptr.append(len(self._ids))
+        self._magnitudes.append(sum(count for _, count in profile))
+        self._terms.append(term)
+        return len(self._terms) - 1
+
+    def term(self, term_id):
+        """Return a stored term.
+
+        :param int term_id: the id of the term
+        :returns: the term
+        :rtype: str
+        """
+        return self._terms[term_id]
+
+    def profile(self, term_id):
+        """Return the profile of a stored term.
+
+        :param int term_id: the id of the term
+        :returns: the sorted q-gram ids of the term & the count of each
+        :rtype: tuple
+
+        >>> store = QGramProfileStore(['AATTATAT'], qval=1, skip=0)
+        >>> store.profile(0)
+        (array('l', [0, 1]), array('l', [4, 4]))
+        """
+        start, stop = self._indptr[term_id], self._indptr[term_id+1]
+        return self._ids[start:stop], self._counts[start:stop]
+
+    def csr(self):
+        """Return the profiles of the stored terms as a CSR matrix.
+
+        The matrix is held, as in compressed sparse row format, in three
+        arrays: the q-gram ids (columns) of all profiles, in the order of the
+        terms, the count of each, and the offset in these of each term's
+        profile (with a final offset, the total length).
+
+        :returns: the offsets (indptr), q-gram ids (indices), & counts (data)
+        :rtype: tuple of numpy.ndarray
+
+        >>> indptr, indices, data = QGramProfileStore(['cat', 'at']).csr()
+        >>> indptr.tolist(), indices.tolist(), data.tolist()
+        ([0, 4, 7], [0, 1, 2, 3, 2, 3, 4], [1, 1, 1, 1, 1, 1, 1])
+        """
+        return (np_array(self._indptr, dtype=np_intp),
+                np_array(self._ids, dtype=np_intp),
+                np_array(self._counts, dtype=np_intp))
+
+    @property
+    def magnitudes(self):
+        """Return the magnitudes of the stored terms' profiles.
+
+        :returns: the total count of q-grams of each stored term
+        :rtype: numpy.ndarray
+        """
+        return np_array(self._magnitudes, dtype=np_intp)
+
+    def prepare(self, term):
+        """Return the profile of a term that is not stored.
+
+        The q-grams of term absent from the vocabulary are given negative ids,
+        so that the vocabulary is unchanged. The profile may be passed in place
+        of src or tar, to compare one term with many stored terms without
+        re-tokenizing it. If terms added later extend the vocabulary with any
+        of its q-grams, their ids are resolved again when it is compared.
+
+        :param str term: the term to tokenize
+        :returns: the term, the sorted q-gram ids of the term, the count of
+            each, their total, the size of the vocabulary, & the q-grams
+            absent from it (in the order of their negative ids)
+        :rtype: tuple
+
+        >>> store = QGramProfileStore(['Niall', 'Neil'])
+        >>> query = store.prepare('Nigel')
+        >>> store.sim_jaccard(query, 0), store.sim_jaccard(query, 1)
+        (0.3333333333333333, 0.2222222222222222)
+        """
+        return self._prepare(term, {})
+
+    def _prepare(self, term, unknown):
+        """Return the profile of a term, sharing ids for unknown q-grams.
+
+        :param str term: the term to tokenize
+        :param dict unknown: a map from q-grams absent from the vocabulary to
+            their (negative) ids, extended as needed
+        :returns: the profile, as for prepare()
+        :rtype: tuple
+        """
+        vocabulary = self._vocabulary
+        profile = []
+        for qgram, count in self._tokenize(term).items():
+            if qgram in vocabulary:
+                profile.append((vocabulary[qgram], count))
+            else:
+                if qgram not in unknown:
+                    unknown[qgram] = -1 - len(unknown)
+                profile.append((unknown[qgram], count))
+        profile.sort()
+        return (term, [qgram_id for qgram_id, _ in profile],
+                [count for _, count in profile],
+                sum(count for _, count in profile), len(vocabulary),
+                tuple(sorted(unknown, key=unknown.get, reverse=True)))
+
+    def _resolve(self, profile):
+        """Return a prepared profile, with its ids resolved again if stale.
+
+        :param tuple profile: a profile returned by prepare()
+        :returns: the profile, with the ids of its q-grams added to the
+            vocabulary since it was prepared
+        :rtype: tuple
+        """
+        vocabulary = self._vocabulary
+        if profile[4] == len(vocabulary):
+            return profile
+
+        unknown = profile[5]
+        resolved = []
+        for qgram_id, count in zip(profile[1], profile[2]):
+            if qgram_id < 0:
+                qgram_id = vocabulary.get(unknown[-1 - qgram_id], qgram_id)
+            resolved.append((qgram_id, count))
+        resolved.sort()
+        return (profile[0], [qgram_id for qgram_id, _ in resolved],
+                [count for _, count in resolved], profile[3], len(vocabulary),
+                unknown)
+
+    def _profiles(self, src, tar):
+        """Return the profiles of src & tar.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: the profiles of src & tar, as for prepare()
+        :rtype: tuple
+        """
+        # the negative ids of two prepared profiles are not comparable, so
+        # neither is used unless the other is a stored term
+        if not isinstance(src, Integral) and not isinstance(tar, Integral):
+            src = src[0] if isinstance(src, tuple) else src
+            tar = tar[0] if isinstance(tar, tuple) else tar
+
+        unknown = {}
+        profiles = []
+        for key in (src, tar):
+            if isinstance(key, Integral):
+                ids, counts = self.profile(key)
+                profiles.append((self._terms[key], ids, counts,
+                                 self._magnitudes[key]))
+            elif isinstance(key, tuple):
+                profiles.append(self._resolve(key))
+            else:
+                profiles.append(self._prepare(key, unknown))
+        return profiles
+
+    @staticmethod
+    def _intersection(src, tar):
+        """Return the magnitude of the intersection of two profiles.
+
+        :param tuple src: source profile
+        :param tuple tar: target profile
+        :returns: the sum of the lesser count of each common q-gram
+        :rtype: int
+        """
+        src_ids, src_counts = src[1], src[2]
+        tar_ids, tar_counts = tar[1], tar[2]
+        i = j = 0
+        intersection = 0
+        while i < len(src_ids) and j < len(tar_ids):
+            if src_ids[i] < tar_ids[j]:
+                i += 1
+            elif src_ids[i] > tar_ids[j]:
+                j += 1
+            else:
+                intersection += min(src_counts[i], tar_counts[j])
+                i += 1
+                j += 1
+        return intersection
+
+    def sim_tversky(self, src, tar, alpha=1, beta=1, bias=None):
+        """Return the Tversky index of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param float alpha: Tversky index parameter, as for sim_tversky
+        :param float beta: Tversky index parameter, as for sim_tversky
+        :param float bias: The symmetric Tversky index bias parameter
+        :returns: Tversky similarity
+        :rtype: float
+
+        >>> store = QGramProfileStore(['cat', 'hat'])
+        >>> store.sim_tversky(0, 1)
+        0.3333333333333333
+        >>> store.sim_tversky(0, 'hat')
+        0.3333333333333333
+        """
+        if alpha < 0 or beta < 0:
+            raise ValueError('Unsupported weight assignment; alpha and beta ' +
+                             'must be greater than or equal to 0.')
+
+        src, tar = self._profiles(src, tar)
+        if src[0] == tar[0]:
+            return 1.0
+        elif not src[0] or not tar[0] or not src[3] or not tar[3]:
+            return 0.0
+
+        q_src_mag = src[3]
+        q_tar_mag = tar[3]
+        q_intersection_mag = self._intersection(src, tar)
+
+        if bias is None:
+            return q_intersection_mag / (q_intersection_mag + alpha *
+                                         (q_src_mag - q_intersection_mag) +
+                                         beta * (q_tar_mag -
+                                                 q_intersection_mag))
+
+        a_val = min(q_src_mag - q_intersection_mag,
+                    q_tar_mag - q_intersection_mag)
+        b_val = max(q_src_mag - q_intersection_mag,
+                    q_tar_mag - q_intersection_mag)
+        c_val = q_intersection_mag + bias
+        return c_val / (beta * (alpha * a_val + (1 - alpha) * b_val) + c_val)
+
+    def dist_tversky(self, src, tar, alpha=1, beta=1, bias=None):
+        """Return the Tversky distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param float alpha: the Tversky index's alpha parameter
+        :param float beta: the Tversky index's beta parameter
+        :param float bias: The symmetric Tversky index bias parameter
+        :returns: Tversky distance
+        :rtype: float
+        """
+        return 1 - self.sim_tversky(src, tar, alpha, beta, bias)
+
+    def sim_dice(self, src, tar):
+        """Return the Sørensen–Dice coefficient of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Sørensen–Dice similarity
+        :rtype: float
+
+        >>> QGramProfileStore(['Niall', 'Neil']).sim_dice(0, 1)
+        0.36363636363636365
+        """
+        return self.sim_tversky(src, tar, 0.5, 0.5)
+
+    def dist_dice(self, src, tar):
+        """Return the Sørensen–Dice distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Sørensen–Dice distance
+        :rtype: float
+        """
+        return 1 - self.sim_dice(src, tar)
+
+    def sim_jaccard(self, src, tar):
+        """Return the Jaccard similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Jaccard similarity
+        :rtype: float
+
+        >>> QGramProfileStore(['aluminum', 'Catalan']).sim_jaccard(0, 1)
+        0.0625
+        """
+        return self.sim_tversky(src, tar, 1, 1)
+
+    def dist_jaccard(self, src, tar):
+        """Return the Jaccard distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Jaccard distance
+        :rtype: float
+        """
+        return 1 - self.sim_jaccard(src, tar)
+
+    def sim_tanimoto(self, src, tar):
+        """Return the Tanimoto similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Tanimoto similarity
+        :rtype: float
+        """
+        return self.sim_jaccard(src, tar)
+
+    def tanimoto(self, src, tar):
+        """Return the Tanimoto distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: Tanimoto distance
+        :rtype: float
+
+        >>> QGramProfileStore(['cat', 'hat']).tanimoto(0, 1)
+        -1.5849625007211563
+        """
+        coeff = self.sim_jaccard(src, tar)
+        if coeff != 0:
+            return log(coeff, 2)
+
+        return float('-inf')
+
+    def sim_overlap(self, src, tar):
+        """Return the overlap coefficient of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: overlap similarity
+        :rtype: float
+
+        >>> QGramProfileStore(['Niall', 'Neil']).sim_overlap(0, 1)
+        0.4
+        """
+        src, tar = self._profiles(src, tar)
+        if src[0] == tar[0]:
+            return 1.0
+        elif not src[0] or not tar[0]:
+            return 0.0
+
+        return self._intersection(src, tar) / min(src[3], tar[3])
+
+    def dist_overlap(self, src, tar):
+        """Return the overlap distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: overlap distance
+        :rtype: float
+        """
+        return 1 - self.sim_overlap(src, tar)
+
+    def sim_cosine(self, src, tar):
+        """Return the cosine similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: cosine similarity
+        :rtype: float
+
+        >>> QGramProfileStore(['Niall', 'Neil']).sim_cosine(0, 1)
+        0.3651483716701107
+        """
+        src, tar = self._profiles(src, tar)
+        if src[0] == tar[0]:
+            return 1.0
+        if not src[0] or not tar[0]:
+            return 0.0
+
+        return self._intersection(src, tar) / sqrt(src[3] * tar[3])
+
+    def dist_cosine(self, src, tar):
+        """Return the cosine distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :returns: cosine distance
+        :rtype: float
+        """
+        return 1 - self.sim_cosine(src, tar)
+
+    def minkowski(self, src, tar, pval=1, normalized=False, alphabet=None):
+        """Return the Minkowski distance (:math:`L^p-norm`) of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param int or float pval: the :math:`p`-value of the :math:`L^p`-space.
+        :param bool normalized: normalizes to [0, 1] if True
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the Minkowski distance
+        :rtype: float
+
+        >>> store = QGramProfileStore(['Niall', 'Neil'])
+        >>> store.minkowski(0, 1)
+        7.0
+        >>> round(store.minkowski(0, 1, normalized=True), 12)
+        0.636363636364
+        """
+        src, tar = self._profiles(src, tar)
+        src_ids, src_counts = src[1], src[2]
+        tar_ids, tar_counts = tar[1], tar[2]
+
+        # merge the profiles into the nonzero differences & the totals of the
+        # union of their q-grams
+        diffs = []
+        totals = []
+        i = j = 0
+        while i < len(src_ids) or j < len(tar_ids):
+            if j == len(tar_ids) or (i < len(src_ids) and
+                                     src_ids[i] < tar_ids[j]):
+                diffs.append(src_counts[i])
+                totals.append(src_counts[i])
+                i += 1
+            elif i == len(src_ids) or src_ids[i] > tar_ids[j]:
+                diffs.append(tar_counts[j])
+                totals.append(tar_counts[j])
+                j += 1
+            else:
+                if src_counts[i] != tar_counts[j]:
+                    diffs.append(abs(src_counts[i] - tar_counts[j]))
+                totals.append(src_counts[i] + tar_counts[j])
+                i += 1
+                j += 1
+
+        normalizer = 1
+        if normalized:
+            if alphabet is not None:
+                normalizer = (alphabet if isinstance(alphabet, Number) else
+                              len(alphabet))
+            elif pval == 0:
+                normalizer = len(totals)
+            else:
+                normalizer = sum(_**pval for _ in totals)**(1 / pval)
+
+        if len(diffs) == 0:
+            return 0.0
+        if pval == float('inf'):
+            # Chebyshev distance
+            return max(diffs)/normalizer
+        if pval == 0:
+            # This is the l_0 "norm" as developed by David Donoho
+            return len(diffs)/normalizer
+        return sum(_**pval for _ in diffs)**(1 / pval)/normalizer
+
+    def dist_minkowski(self, src, tar, pval=1, alphabet=None):
+        """Return normalized Minkowski distance of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param int or float pval: the :math:`p`-value of the :math:`L^p`-space.
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Minkowski distance
+        :rtype: float
+        """
+        return self.minkowski(src, tar, pval, True, alphabet)
+
+    def sim_minkowski(self, src, tar, pval=1, alphabet=None):
+        """Return normalized Minkowski similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param int or float pval: the :math:`p`-value of the :math:`L^p`-space.
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Minkowski similarity
+        :rtype: float
+        """
+        return 1 - self.minkowski(src, tar, pval, True, alphabet)
+
+    def manhattan(self, src, tar, normalized=False, alphabet=None):
+        """Return the Manhattan distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param normalized: normalizes to [0, 1] if True
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the Manhattan distance
+        :rtype: float
+        """
+        return self.minkowski(src, tar, 1, normalized, alphabet)
+
+    def dist_manhattan(self, src, tar, alphabet=None):
+        """Return the normalized Manhattan distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Manhattan distance
+        :rtype: float
+        """
+        return self.manhattan(src, tar, True, alphabet)
+
+    def sim_manhattan(self, src, tar, alphabet=None):
+        """Return the normalized Manhattan similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Manhattan similarity
+        :rtype: float
+        """
+        return 1 - self.manhattan(src, tar, True, alphabet)
+
+    def euclidean(self, src, tar, normalized=False, alphabet=None):
+        """Return the Euclidean distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param normalized: normalizes to [0, 1] if True
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the Euclidean distance
+        :rtype: float
+        """
+        return self.minkowski(src, tar, 2, normalized, alphabet)
+
+    def dist_euclidean(self, src, tar, alphabet=None):
+        """Return the normalized Euclidean distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Euclidean distance
+        :rtype: float
+        """
+        return self.euclidean(src, tar, True, alphabet)
+
+    def sim_euclidean(self, src, tar, alphabet=None):
+        """Return the normalized Euclidean similarity of two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the normalized Euclidean similarity
+        :rtype: float
+        """
+        return 1 - self.euclidean(src, tar, True, alphabet)
+
+    def chebyshev(self, src, tar, normalized=False, alphabet=None):
+        """Return the Chebyshev distance between two terms.
+
+        :param src: source term id, term, or prepared profile
+        :param tar: target term id, term, or prepared profile
+        :param normalized: normalizes to [0, 1] if True
+        :param collection or int alphabet: the values or size of the alphabet
+        :returns: the Chebyshev distance
+        :rtype: float
+        """
+        return self.minkowski(src, tar, float('inf'), normalized, alphabet)
+
+    def scores(self, query, metric='sim_jaccard', **kwargs):
+        """Return the scores of a query against every stored term.
+
+        The query is tokenized only once.
+
+        :param query: the query term id, term, or prepared profile
+        :param str metric: the name of a similarity or distance method of the
+            store
+        :param kwargs: any additional arguments to the method
+        :returns: the score of the query & each stored term, in id order
+        :rtype: list
+
+        >>> store = QGramProfileStore(['Neal', 'Nigel', 'Niall'])
+        >>> store.scores('Niall')
+        [0.375, 0.3333333333333333, 1.0]
+        """
+        if metric not in _METRICS:
+            raise ValueError('Unknown metric: ' + metric)
+        if isinstance(query, tuple):
+            query = self._resolve(query)
+        elif not isinstance(query, Integral):
+            query = self.prepare(query)
+        method = getattr(self, metric)
+        return [method(query, term_id, **kwargs)
+                for term_id in range(len(self._terms))]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -25,18 +25,94 @@ used in sequence alignment:
     - Needleman-Wunsch score
     - Smith-Waterman score
     - Gotoh score
+    - Needleman-Wunsch, Smith-Waterman, & Gotoh alignments (in linear space)
 """
 
 from __future__ import unicode_literals
 
-from numpy import float32 as np_float32
-from numpy import zeros as np_zeros
+from collections import deque
+
+from numpy import arange as np_arange
+from numpy import float64 as np_float64
+from numpy import full as np_full
+from numpy import maximum as np_maximum
 
 from six.moves import range
 
+from ._dp import _dp_codes, _dp_score
 from .basic import sim_ident
+from .substitution import SubstitutionMatrix
+
+__all__ = ['gotoh', 'gotoh_alignment', 'needleman_wunsch',
+           'needleman_wunsch_alignment', 'sim_matrix', 'smith_waterman',
+           'smith_waterman_alignment']
+
+# subproblems with no more DP cells than this are aligned with a full matrix
+# traceback, rather than divided further
+_ALIGN_FULL_CELLS = 1024
+
+# the three Gotoh states: match (or mismatch), gap in tar, & gap in src
+_MATCH, _GAP_TAR, _GAP_SRC = 0, 1, 2
+_NEG_INF = float('-inf')
+
+
+def _sim_rows(sim_func, tar):
+    """Return a function returning the similarities of a character & tar.
+
+    The similarities of each distinct character are computed once, by array
+    indexing if sim_func is a SubstitutionMatrix.
 
-__all__ = ['gotoh', 'needleman_wunsch', 'sim_matrix', 'smith_waterman']
+    :param function sim_func: a function that returns the similarity of two
+        characters (or a SubstitutionMatrix)
+    :param str tar: target string
+    :returns: a function of a src character returning the list of its
+        similarities with each character of tar
+    :rtype: function
+
+    >>> _sim_rows(sim_ident, 'cat')('a')
+    [0, 1, 0]
+    """
+    rows = {}
+    if isinstance(sim_func, SubstitutionMatrix):
+        positions = sim_func.encode(tar)
+
+        def _row(char):
+            if char not in rows:
+                rows[char] = sim_func.row(char, positions)
+            return rows[char]
+    else:
+        def _row(char):
+            if char not in rows:
+                rows[char] = [sim_func(char, tar_char) for tar_char in tar]
+            return rows[char]
+
+    return _row
+
+
+def _sim_row_cost(sim_func):
+    """Return the row_cost function of _dp_score for a sim_func, if any.
+
+    :param function sim_func: a function that returns the similarity of two
+        characters (or a SubstitutionMatrix)
+    :returns: a function of a character & a string returning the list of the
+        similarities of the character with each character of the string, or
+        None if sim_func is not a symmetric SubstitutionMatrix
+    :rtype: function
+
+    >>> _sim_row_cost(sim_ident) is None
+    True
+    """
+    if not (isinstance(sim_func, SubstitutionMatrix) and
+            sim_func.symmetric):
+        return None
+    positions = {}
+
+    def _row_cost(char, string):
+        if string not in positions:
+            positions[string] = sim_func.encode(string)
+        return sim_func.row(char, positions[string])
+
+    return _row_cost
 
 
 def sim_matrix(src, tar, mat=None, mismatch_cost=0, match_cost=1,
@@ -51,7 +127,8 @@ def sim_matrix(src, tar, mat=None, mismatch_cost=0, match_cost=1,
     :param str src: source string for comparison
     :param str tar: target string for comparison
     :param dict mat: a dict mapping tuples to costs; the tuples are (src, tar)
-        pairs of symbols from the alphabet parameter
+        pairs of symbols from the alphabet parameter (or a SubstitutionMatrix,
+        which is looked up directly)
     :param float mismatch_cost: the value returned if (src, tar) is absent from
         mat when src does not equal tar
     :param float match_cost: the value returned if (src, tar) is absent from
@@ -69,6 +146,8 @@ def sim_matrix(src, tar, mat=None, mismatch_cost=0, match_cost=1,
     0
     >>> sim_matrix('hat', 'hat')
     1
+    >>> sim_matrix('A', 'C', SubstitutionMatrix('ACGT', mismatch_cost=-1))
+    -1.0
     """
     if alphabet:
         alphabet = tuple(alphabet)
@@ -79,6 +158,8 @@ def sim_matrix(src, tar, mat=None, mismatch_cost=0, match_cost=1,
             if i not in alphabet:
                 raise ValueError('tar value not in alphabet')
 
+    if isinstance(mat, SubstitutionMatrix):
+        return mat(src, tar)
     if src == tar:
         if mat and (src, src) in mat:
             return mat[(src, src)]
@@ -90,7 +171,8 @@ def sim_matrix(src, tar, mat=None, mismatch_cost=0, match_cost=1,
     return mismatch_cost
 
 
-def needleman_wunsch(src, tar, gap_cost=1, sim_func=sim_ident):
+def needleman_wunsch(src, tar, gap_cost=1, sim_func=sim_ident,
+                     engine='python'):
     """Return the Needleman-Wunsch score of two strings.
 
     The Needleman-Wunsch score :cite:`Needleman:1970` is a standard edit
@@ -100,7 +182,10 @@ def needleman_wunsch(src, tar, gap_cost=1, sim_func=sim_ident):
     :param str tar: target string for comparison
     :param float gap_cost: the cost of an alignment gap (1 by default)
     :param function sim_func: a function that returns the similarity of two
-        characters (identity similarity by default)
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str engine: 'python' (default) to fill the DP row by row, or
+        'numpy' to fill it by anti-diagonals with NumPy (faster for long
+        strings)
     :returns: Needleman-Wunsch score
     :rtype: float
 
@@ -112,23 +197,17 @@ def needleman_wunsch(src, tar, gap_cost=1, sim_func=sim_ident):
     -1.0
     >>> needleman_wunsch('ATCG', 'TAGC')
     0.0
-    """
-    d_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_float32)
 
-    for i in range(len(src)+1):
-        d_mat[i, 0] = -(i * gap_cost)
-    for j in range(len(tar)+1):
-        d_mat[0, j] = -(j * gap_cost)
-    for i in range(1, len(src)+1):
-        for j in range(1, len(tar)+1):
-            match = d_mat[i-1, j-1] + sim_func(src[i-1], tar[j-1])
-            delete = d_mat[i-1, j] - gap_cost
-            insert = d_mat[i, j-1] - gap_cost
-            d_mat[i, j] = max(match, delete, insert)
-    return d_mat[d_mat.shape[0]-1, d_mat.shape[1]-1]
+    >>> needleman_wunsch('aluminum', 'Catalan', engine='numpy')
+    -1.0
+    """
+    return float(_dp_score(src, tar, -gap_cost, -gap_cost, sim_func,
+                           optimum=max, row_cost=_sim_row_cost(sim_func),
+                           engine=engine))
 
 
-def smith_waterman(src, tar, gap_cost=1, sim_func=sim_ident):
+def smith_waterman(src, tar, gap_cost=1, sim_func=sim_ident,
+                   engine='python'):
     """Return the Smith-Waterman score of two strings.
 
     The Smith-Waterman score :cite:`Smith:1981` is a standard edit distance
@@ -139,7 +218,9 @@ def smith_waterman(src, tar, gap_cost=1, sim_func=sim_ident):
     :param str tar: target string for comparison
     :param float gap_cost: the cost of an alignment gap (1 by default)
     :param function sim_func: a function that returns the similarity of two
-        characters (identity similarity by default)
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str engine: 'python' (default) or 'numpy', as for
+        needleman_wunsch
     :returns: Smith-Waterman score
     :rtype: float
 
@@ -151,23 +232,19 @@ def smith_waterman(src, tar, gap_cost=1, sim_func=sim_ident):
     0.0
     >>> smith_waterman('ATCG', 'TAGC')
     1.0
-    """
-    d_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_float32)
 
-    for i in range(len(src)+1):
-        d_mat[i, 0] = 0
-    for j in range(len(tar)+1):
-        d_mat[0, j] = 0
-    for i in range(1, len(src)+1):
-        for j in range(1, len(tar)+1):
-            match = d_mat[i-1, j-1] + sim_func(src[i-1], tar[j-1])
-            delete = d_mat[i-1, j] - gap_cost
-            insert = d_mat[i, j-1] - gap_cost
-            d_mat[i, j] = max(0, match, delete, insert)
-    return d_mat[d_mat.shape[0]-1, d_mat.shape[1]-1]
+    >>> smith_waterman('ATCG', 'TAGC', engine='numpy')
+    1.0
+    """
+    return float(_dp_score(src, tar, -gap_cost, -gap_cost, sim_func,
+                           first_row=[0] * (len(tar)+1),
+                           first_col=[0] * (len(src)+1),
+                           optimum=max, floor=0,
+                           row_cost=_sim_row_cost(sim_func), engine=engine))
 
 
-def gotoh(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
+def gotoh(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident,
+          engine='python'):
     """Return the Gotoh score of two strings.
 
     The Gotoh score :cite:`Gotoh:1982` is essentially Needleman-Wunsch with
@@ -179,7 +256,9 @@ def gotoh(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
     :param float gap_ext: the cost of an alignment gap extension (0.4 by
         default)
     :param function sim_func: a function that returns the similarity of two
-        characters (identity similarity by default)
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str engine: 'python' (default) to fill the DP row by row, or
+        'numpy' to fill it by anti-diagonals with _gotoh_numpy
     :returns: Gotoh score
     :rtype: float
 
@@ -191,40 +270,603 @@ def gotoh(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident):
     -0.4
     >>> gotoh('cat', 'hat')
     2.0
+
+    >>> round(gotoh('aluminum', 'Catalan', engine='numpy'), 12)
+    -0.4
     """
-    d_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_float32)
-    p_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_float32)
-    q_mat = np_zeros((len(src)+1, len(tar)+1), dtype=np_float32)
+    if engine == 'numpy':
+        return _gotoh_numpy(src, tar, gap_open, gap_ext, sim_func)
+    elif engine != 'python':
+        raise ValueError("engine must be 'python' or 'numpy'")
+
+    # Only the previous row of each of the three matrices (match, gap in src,
+    # gap in tar) is needed to compute the current row.
+    d_row = [0.0] + [float('-inf')] * len(tar)
+    p_row = [float('-inf')] * (len(tar)+1)
+    q_row = [float('-inf')] + [-gap_open - gap_ext*(j-1)
+                               for j in range(1, len(tar)+1)]
+    sim_rows = _sim_rows(sim_func, tar)
 
-    d_mat[0, 0] = 0
-    p_mat[0, 0] = float('-inf')
-    q_mat[0, 0] = float('-inf')
     for i in range(1, len(src)+1):
-        d_mat[i, 0] = float('-inf')
-        p_mat[i, 0] = -gap_open - gap_ext*(i-1)
-        q_mat[i, 0] = float('-inf')
-        q_mat[i, 1] = -gap_open
-    for j in range(1, len(tar)+1):
-        d_mat[0, j] = float('-inf')
-        p_mat[0, j] = float('-inf')
-        p_mat[1, j] = -gap_open
-        q_mat[0, j] = -gap_open - gap_ext*(j-1)
+        sim_row = sim_rows(src[i-1])
+        d_cur = [float('-inf')] * (len(tar)+1)
+        p_cur = [-gap_open - gap_ext*(i-1)] + [0.0] * len(tar)
+        q_cur = [float('-inf')] * (len(tar)+1)
 
-    for i in range(1, len(src)+1):
         for j in range(1, len(tar)+1):
-            sim_val = sim_func(src[i-1], tar[j-1])
-            d_mat[i, j] = max(d_mat[i-1, j-1] + sim_val,
-                              p_mat[i-1, j-1] + sim_val,
-                              q_mat[i-1, j-1] + sim_val)
+            sim_val = sim_row[j-1]
+            d_cur[j] = max(d_row[j-1] + sim_val,
+                           p_row[j-1] + sim_val,
+                           q_row[j-1] + sim_val)
+
+            p_cur[j] = max(d_row[j] - gap_open,
+                           p_row[j] - gap_ext)
+
+            q_cur[j] = max(d_cur[j-1] - gap_open,
+                           q_cur[j-1] - gap_ext)
+
+        d_row, p_row, q_row = d_cur, p_cur, q_cur
+
+    return float(max(d_row[-1], p_row[-1], q_row[-1]))
+
+
+def _gotoh_numpy(src, tar, gap_open, gap_ext, sim_func):
+    """Return the Gotoh score of two strings, computed by anti-diagonals.
+
+    As in _dp_score_numpy, each of the three matrices is filled one
+    anti-diagonal at a time: a match cell depends on the anti-diagonal two
+    before it, & a gap cell on the anti-diagonal just before it.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param float gap_open: the cost of an open alignment gap
+    :param float gap_ext: the cost of an alignment gap extension
+    :param function sim_func: a function that returns the similarity of two
+        characters, or a SubstitutionMatrix
+    :returns: Gotoh score
+    :rtype: float
+
+    >>> _gotoh_numpy('Niall', 'Neil', 1, 0.4, sim_ident)
+    1.0
+    """
+    lens, lent = len(src), len(tar)
+    src_codes, tar_codes, table = _dp_codes(src, tar, sim_func,
+                                            _sim_row_cost(sim_func))
+
+    # the anti-diagonals k-1 & k-2 of the match (d), gap in tar (p), & gap in
+    # src (q) matrices
+    d_diag1 = d_diag2 = p_diag1 = p_diag2 = q_diag1 = q_diag2 = None
+    for k in range(lens+lent+1):
+        d_diag = np_full(lens+1, _NEG_INF, dtype=np_float64)
+        p_diag = np_full(lens+1, _NEG_INF, dtype=np_float64)
+        q_diag = np_full(lens+1, _NEG_INF, dtype=np_float64)
+        if k == 0:
+            d_diag[0] = 0.0
+        elif k <= lent:
+            q_diag[0] = -gap_open - gap_ext*(k-1)
+        if 0 < k <= lens:
+            p_diag[k] = -gap_open - gap_ext*(k-1)
+
+        lo, hi = max(1, k-lent), min(lens, k-1)
+        if lo <= hi:
+            src_idx = np_arange(lo-1, hi)
+            tar_idx = k-2 - src_idx
+            d_diag[lo:hi+1] = (np_maximum(np_maximum(d_diag2[lo-1:hi],
+                                                     p_diag2[lo-1:hi]),
+                                          q_diag2[lo-1:hi]) +
+                               table[src_codes[src_idx], tar_codes[tar_idx]])
+            p_diag[lo:hi+1] = np_maximum(d_diag1[lo-1:hi] - gap_open,
+                                         p_diag1[lo-1:hi] - gap_ext)
+            q_diag[lo:hi+1] = np_maximum(d_diag1[lo:hi+1] - gap_open,
+                                         q_diag1[lo:hi+1] - gap_ext)
+
+        d_diag2, p_diag2, q_diag2 = d_diag1, p_diag1, q_diag1
+        d_diag1, p_diag1, q_diag1 = d_diag, p_diag, q_diag
+
+    return float(max(d_diag1[lens], p_diag1[lens], q_diag1[lens]))
+
+
+def _alignment(src, tar, ops, score, gap):
+    """Return an alignment tuple from a sequence of alignment operations.
+
+    :param str src: source string
+    :param str tar: target string
+    :param list ops: the alignment operations, each 'M' (src & tar
+        characters aligned), 'D' (a src character aligned to a gap), or 'I' (a
+        tar character aligned to a gap)
+    :param float score: the alignment score
+    :param str gap: the gap character
+    :returns: the score, the aligned src, the aligned tar, & the edit
+        operations, with 'M' refined to '=' (match) or 'X' (mismatch)
+    :rtype: tuple
+
+    >>> _alignment('cat', 'at', ['D', 'M', 'M'], 1, '-')
+    (1.0, 'cat', '-at', 'D==')
+    """
+    src_aligned = []
+    tar_aligned = []
+    edits = []
+    i = j = 0
+    for op in ops:
+        if op == 'M':
+            src_aligned.append(src[i])
+            tar_aligned.append(tar[j])
+            edits.append('=' if src[i] == tar[j] else 'X')
+            i += 1
+            j += 1
+        elif op == 'D':
+            src_aligned.append(src[i])
+            tar_aligned.append(gap)
+            edits.append('D')
+            i += 1
+        else:
+            src_aligned.append(gap)
+            tar_aligned.append(tar[j])
+            edits.append('I')
+            j += 1
+    return (float(score), ''.join(src_aligned), ''.join(tar_aligned),
+            ''.join(edits))
+
+
+def _nw_rows(src, tar, gap_cost, sim_func):
+    """Yield each row of the Needleman-Wunsch DP of two strings.
+
+    Each row is a new list, so only the rows retained by the caller are kept
+    in memory.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_cost: the cost of an alignment gap
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :returns: the rows 0 to len(src) of the DP
+    :rtype: generator
+
+    >>> list(_nw_rows('a', 'ab', 1, sim_ident))
+    [[0, -1, -2], [-1, 1, 0]]
+    """
+    sim_rows = _sim_rows(sim_func, tar)
+    row = [-gap_cost * j for j in range(len(tar)+1)]
+    yield row
+    for i, src_char in enumerate(src, 1):
+        sim_row = sim_rows(src_char)
+        cur = [-gap_cost * i] + [0] * len(tar)
+        for j in range(1, len(tar)+1):
+            cell = row[j-1] + sim_row[j-1]
+            other = row[j] - gap_cost
+            if other > cell:
+                cell = other
+            other = cur[j-1] - gap_cost
+            if other > cell:
+                cell = other
+            cur[j] = cell
+        yield cur
+        row = cur
+
+
+def _nw_last_row(src, tar, gap_cost, sim_func):
+    """Return the last row of the Needleman-Wunsch DP of two strings.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_cost: the cost of an alignment gap
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :returns: the scores of aligning src with each prefix of tar
+    :rtype: list
+
+    >>> _nw_last_row('cat', 'hat', 1, sim_ident)
+    [-3, -2, 0, 2]
+    """
+    return deque(_nw_rows(src, tar, gap_cost, sim_func), maxlen=1)[0]
+
+
+def _nw_traceback(src, tar, gap_cost, sim_func):
+    """Return the operations of a Needleman-Wunsch alignment (full matrix).
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_cost: the cost of an alignment gap
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :returns: the alignment operations ('M', 'D', or 'I')
+    :rtype: list
+
+    >>> _nw_traceback('cat', 'at', 1, sim_ident)
+    ['D', 'M', 'M']
+    """
+    rows = list(_nw_rows(src, tar, gap_cost, sim_func))
+    ops = []
+    i, j = len(src), len(tar)
+    while i or j:
+        if i and j and (rows[i][j] ==
+                        rows[i-1][j-1] + sim_func(src[i-1], tar[j-1])):
+            ops.append('M')
+            i -= 1
+            j -= 1
+        elif i and rows[i][j] == rows[i-1][j] - gap_cost:
+            ops.append('D')
+            i -= 1
+        else:
+            ops.append('I')
+            j -= 1
+    ops.reverse()
+    return ops
+
+
+def _nw_hirschberg(src, tar, gap_cost, sim_func):
+    """Return the operations of a Needleman-Wunsch alignment (linear space).
+
+    Hirschberg's algorithm :cite:`Hirschberg:1975` finds the column at which
+    an optimal alignment crosses the middle row of the DP, by adding the last
+    row of the DP of the first half of src with the last row of the DP of the
+    reversed second half, and then aligns the two halves independently.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_cost: the cost of an alignment gap
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :returns: the alignment operations ('M', 'D', or 'I')
+    :rtype: list
+
+    >>> _nw_hirschberg('cat', 'at', 1, sim_ident)
+    ['D', 'M', 'M']
+    """
+    if len(src) < 2 or (len(src)+1) * (len(tar)+1) <= _ALIGN_FULL_CELLS:
+        return _nw_traceback(src, tar, gap_cost, sim_func)
+
+    mid = len(src) // 2
+    fwd = _nw_last_row(src[:mid], tar, gap_cost, sim_func)
+    rev = _nw_last_row(src[:mid-1:-1], tar[::-1], gap_cost, sim_func)
+    lent = len(tar)
+    split = max(range(lent+1), key=lambda j: fwd[j] + rev[lent-j])
+
+    return (_nw_hirschberg(src[:mid], tar[:split], gap_cost, sim_func) +
+            _nw_hirschberg(src[mid:], tar[split:], gap_cost, sim_func))
+
+
+def _nw_alignment_score(src, tar, ops, gap_cost, sim_func):
+    """Return the Needleman-Wunsch score of an alignment.
+
+    :param str src: source string
+    :param str tar: target string
+    :param list ops: the alignment operations ('M', 'D', or 'I')
+    :param float gap_cost: the cost of an alignment gap
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :returns: the alignment score
+    :rtype: float
+
+    >>> _nw_alignment_score('cat', 'at', ['D', 'M', 'M'], 1, sim_ident)
+    1
+    """
+    score = 0
+    i = j = 0
+    for op in ops:
+        if op == 'M':
+            score += sim_func(src[i], tar[j])
+            i += 1
+            j += 1
+        elif op == 'D':
+            score -= gap_cost
+            i += 1
+        else:
+            score -= gap_cost
+            j += 1
+    return score
+
+
+def needleman_wunsch_alignment(src, tar, gap_cost=1, sim_func=sim_ident,
+                               gap='-'):
+    """Return an optimal Needleman-Wunsch alignment of two strings.
+
+    The alignment is found with Hirschberg's divide & conquer algorithm
+    :cite:`Hirschberg:1975`, so memory use is proportional to the length of
+    tar (rather than the product of the lengths), at about twice the
+    computation of needleman_wunsch, which returns only the score.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param float gap_cost: the cost of an alignment gap (1 by default)
+    :param function sim_func: a function that returns the similarity of two
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str gap: the character that fills gaps in the aligned strings
+    :returns: the Needleman-Wunsch score, the aligned src, the aligned tar, &
+        the edit operations, with one of '=' (match), 'X' (mismatch), 'D' (src
+        character aligned to a gap), or 'I' (tar character aligned to a gap)
+        for each column of the alignment
+    :rtype: tuple
+
+    >>> needleman_wunsch_alignment('cat', 'hat')
+    (2.0, 'cat', 'hat', 'X==')
+    >>> needleman_wunsch_alignment('Niall', 'Neil')
+    (1.0, 'Niall', 'N-eil', '=DXX=')
+    >>> needleman_wunsch_alignment('ATCG', 'TAGC')
+    (0.0, 'ATCG', 'TAGC', 'XXXX')
+    """
+    ops = _nw_hirschberg(src, tar, gap_cost, sim_func)
+    return _alignment(src, tar, ops,
+                      _nw_alignment_score(src, tar, ops, gap_cost, sim_func),
+                      gap)
 
-            p_mat[i, j] = max(d_mat[i-1, j] - gap_open,
-                              p_mat[i-1, j] - gap_ext)
 
-            q_mat[i, j] = max(d_mat[i, j-1] - gap_open,
-                              q_mat[i, j-1] - gap_ext)
+def smith_waterman_alignment(src, tar, gap_cost=1, sim_func=sim_ident,
+                             gap='-'):
+    """Return an optimal Smith-Waterman alignment of two strings.
 
-    i, j = (n - 1 for n in d_mat.shape)
-    return max(d_mat[i, j], p_mat[i, j], q_mat[i, j])
+    As with smith_waterman, this is the best scoring alignment of a suffix of
+    src with a suffix of tar :cite:`Smith:1981`, or the empty alignment if
+    none scores above 0. The suffixes are found with a score-only pass over
+    the reversed strings, & then aligned with Hirschberg's algorithm
+    :cite:`Hirschberg:1975`, so memory use is proportional to the length of
+    tar.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param float gap_cost: the cost of an alignment gap (1 by default)
+    :param function sim_func: a function that returns the similarity of two
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str gap: the character that fills gaps in the aligned strings
+    :returns: the Smith-Waterman score, the aligned suffix of src, the aligned
+        suffix of tar, & the edit operations (as in
+        needleman_wunsch_alignment)
+    :rtype: tuple
+
+    >>> smith_waterman_alignment('cat', 'hat')
+    (2.0, 'at', 'at', '==')
+    >>> smith_waterman_alignment('ATCG', 'TAGC')
+    (1.0, 'TCG-', 'TAGC', '=X=I')
+    >>> smith_waterman_alignment('aluminum', 'Catalan')
+    (0.0, '', '', '')
+    """
+    # find the suffixes of src & tar with the best alignment
+    best, best_i, best_j = 0, 0, 0
+    for i, row in enumerate(_nw_rows(src[::-1], tar[::-1], gap_cost,
+                                     sim_func)):
+        for j, cell in enumerate(row):
+            if cell > best:
+                best, best_i, best_j = cell, i, j
+
+    src = src[len(src)-best_i:]
+    tar = tar[len(tar)-best_j:]
+    ops = _nw_hirschberg(src, tar, gap_cost, sim_func)
+    return _alignment(src, tar, ops,
+                      _nw_alignment_score(src, tar, ops, gap_cost, sim_func),
+                      gap)
+
+
+def _gotoh_rows(src, tar, gap_open, gap_ext, sim_func, start):
+    """Yield each row of the Gotoh DP of two strings.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_open: the cost of an open alignment gap
+    :param float gap_ext: the cost of an alignment gap extension
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :param int start: the state (_MATCH, _GAP_TAR, or _GAP_SRC) at the start
+        of the alignment
+    :returns: the rows 0 to len(src) of the match, gap in tar, & gap in src
+        matrices
+    :rtype: generator
+
+    >>> rows = list(_gotoh_rows('cat', 'hat', 1, 0.4, sim_ident, _MATCH))
+    >>> rows[-1][0]
+    [-inf, -1.4, -1.0, 2.0]
+    """
+    sim_rows = _sim_rows(sim_func, tar)
+    lent = len(tar)
+    d_row = [_NEG_INF] * (lent+1)
+    p_row = [_NEG_INF] * (lent+1)
+    q_row = [_NEG_INF] * (lent+1)
+    (d_row, p_row, q_row)[start][0] = 0.0
+    for j in range(1, lent+1):
+        q_row[j] = max(d_row[j-1] - gap_open, q_row[j-1] - gap_ext)
+    yield d_row, p_row, q_row
+
+    for src_char in src:
+        sim_row = sim_rows(src_char)
+        d_cur = [_NEG_INF] * (lent+1)
+        p_cur = [_NEG_INF] * (lent+1)
+        q_cur = [_NEG_INF] * (lent+1)
+        p_cur[0] = max(d_row[0] - gap_open, p_row[0] - gap_ext)
+        for j in range(1, lent+1):
+            d_cur[j] = (max(d_row[j-1], p_row[j-1], q_row[j-1]) +
+                        sim_row[j-1])
+            p_cur[j] = max(d_row[j] - gap_open, p_row[j] - gap_ext)
+            q_cur[j] = max(d_cur[j-1] - gap_open, q_cur[j-1] - gap_ext)
+        yield d_cur, p_cur, q_cur
+        d_row, p_row, q_row = d_cur, p_cur, q_cur
+
+
+def _gotoh_first_rows(src, tar, gap_open, gap_ext, sim_func, end):
+    """Return the first rows of the reverse Gotoh DP of two strings.
+
+    Each cell of the reverse DP holds the best score of the remainder of an
+    alignment that passes through that cell in the given state.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_open: the cost of an open alignment gap
+    :param float gap_ext: the cost of an alignment gap extension
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :param int end: the state (_MATCH, _GAP_TAR, or _GAP_SRC) required at the
+        end of the alignment, or None for any state
+    :returns: the first rows of the match, gap in tar, & gap in src matrices
+    :rtype: tuple
+
+    >>> _gotoh_first_rows('cat', 'hat', 1, 0.4, sim_ident, None)[0]
+    [2.0, 1.0, -0.4, -1.8]
+    """
+    sim_rows = _sim_rows(sim_func, tar)
+    lent = len(tar)
+    d_row = [_NEG_INF] * (lent+1)
+    p_row = [_NEG_INF] * (lent+1)
+    q_row = [_NEG_INF] * (lent+1)
+    for state, row in enumerate((d_row, p_row, q_row)):
+        if end is None or end == state:
+            row[lent] = 0.0
+    for j in range(lent-1, -1, -1):
+        d_row[j] = q_row[j+1] - gap_open
+        q_row[j] = q_row[j+1] - gap_ext
+
+    for src_char in src[::-1]:
+        sim_row = sim_rows(src_char)
+        d_cur = [_NEG_INF] * (lent+1)
+        p_cur = [_NEG_INF] * (lent+1)
+        q_cur = [_NEG_INF] * (lent+1)
+        d_cur[lent] = p_row[lent] - gap_open
+        p_cur[lent] = p_row[lent] - gap_ext
+        for j in range(lent-1, -1, -1):
+            diag = d_row[j+1] + sim_row[j]
+            d_cur[j] = max(diag, p_row[j] - gap_open, q_cur[j+1] - gap_open)
+            p_cur[j] = max(diag, p_row[j] - gap_ext)
+            q_cur[j] = max(diag, q_cur[j+1] - gap_ext)
+        d_row, p_row, q_row = d_cur, p_cur, q_cur
+
+    return d_row, p_row, q_row
+
+
+def _gotoh_traceback(src, tar, gap_open, gap_ext, sim_func, start, end):
+    """Return the operations of a Gotoh alignment (full matrix).
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_open: the cost of an open alignment gap
+    :param float gap_ext: the cost of an alignment gap extension
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :param int start: the state at the start of the alignment
+    :param int end: the state required at the end of the alignment, or None
+        for any state
+    :returns: the alignment operations ('M', 'D', or 'I')
+    :rtype: list
+
+    >>> _gotoh_traceback('cat', 'at', 1, 0.4, sim_ident, _MATCH, None)
+    ['D', 'M', 'M']
+    """
+    rows = list(_gotoh_rows(src, tar, gap_open, gap_ext, sim_func, start))
+
+    i, j = len(src), len(tar)
+    if end is None:
+        state = max(range(3), key=lambda s: rows[i][s][j])
+    else:
+        state = end
+    ops = []
+    while i or j:
+        d_row, p_row, q_row = rows[i]
+        if state == _MATCH:
+            prev = rows[i-1]
+            state = max(range(3), key=lambda s: prev[s][j-1])
+            ops.append('M')
+            i -= 1
+            j -= 1
+        elif state == _GAP_TAR:
+            prev = rows[i-1]
+            if p_row[j] != prev[_MATCH][j] - gap_open:
+                state = _GAP_TAR
+            else:
+                state = _MATCH
+            ops.append('D')
+            i -= 1
+        else:
+            if q_row[j] != d_row[j-1] - gap_open:
+                state = _GAP_SRC
+            else:
+                state = _MATCH
+            ops.append('I')
+            j -= 1
+    ops.reverse()
+    return ops
+
+
+def _gotoh_myers_miller(src, tar, gap_open, gap_ext, sim_func, start, end):
+    """Return the operations of a Gotoh alignment (linear space).
+
+    Following Myers & Miller :cite:`Myers:1988`, the middle row of the DP is
+    crossed by adding the forward & reverse scores of each state at each
+    column; the best column & state divide the alignment into two halves,
+    which are aligned with that state as their end & start, respectively.
+
+    :param str src: source string
+    :param str tar: target string
+    :param float gap_open: the cost of an open alignment gap
+    :param float gap_ext: the cost of an alignment gap extension
+    :param function sim_func: a function that returns the similarity of two
+        characters
+    :param int start: the state at the start of the alignment
+    :param int end: the state required at the end of the alignment, or None
+        for any state
+    :returns: the alignment operations ('M', 'D', or 'I')
+    :rtype: list
+
+    >>> _gotoh_myers_miller('cat', 'at', 1, 0.4, sim_ident, _MATCH, None)
+    ['D', 'M', 'M']
+    """
+    if len(src) < 2 or (len(src)+1) * (len(tar)+1) <= _ALIGN_FULL_CELLS:
+        return _gotoh_traceback(src, tar, gap_open, gap_ext, sim_func, start,
+                                end)
+
+    mid = len(src) // 2
+    fwd = deque(_gotoh_rows(src[:mid], tar, gap_open, gap_ext, sim_func,
+                            start), maxlen=1)[0]
+    rev = _gotoh_first_rows(src[mid:], tar, gap_open, gap_ext, sim_func, end)
+    split, state = max(((j, s) for j in range(len(tar)+1) for s in range(3)),
+                       key=lambda js: fwd[js[1]][js[0]] + rev[js[1]][js[0]])
+
+    return (_gotoh_myers_miller(src[:mid], tar[:split], gap_open, gap_ext,
+                                sim_func, start, state) +
+            _gotoh_myers_miller(src[mid:], tar[split:], gap_open, gap_ext,
+                                sim_func, state, end))
+
+
+def gotoh_alignment(src, tar, gap_open=1, gap_ext=0.4, sim_func=sim_ident,
+                    gap='-'):
+    """Return an optimal Gotoh alignment of two strings.
+
+    The alignment is found with the linear space divide & conquer algorithm
+    of Myers & Miller :cite:`Myers:1988` for affine gap penalties, so memory
+    use is proportional to the length of tar.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param float gap_open: the cost of an open alignment gap (1 by default)
+    :param float gap_ext: the cost of an alignment gap extension (0.4 by
+        default)
+    :param function sim_func: a function that returns the similarity of two
+        characters (identity similarity by default), or a SubstitutionMatrix
+    :param str gap: the character that fills gaps in the aligned strings
+    :returns: the Gotoh score, the aligned src, the aligned tar, & the edit
+        operations (as in needleman_wunsch_alignment)
+    :rtype: tuple
+
+    >>> gotoh_alignment('cat', 'hat')
+    (2.0, 'cat', 'hat', 'X==')
+    >>> gotoh_alignment('Niall', 'Neil')
+    (1.0, 'Niall', 'N-eil', '=DXX=')
+    """
+    ops = _gotoh_myers_miller(src, tar, gap_open, gap_ext, sim_func, _MATCH,
+                              None)
+
+    score = 0
+    i = j = 0
+    prev = None
+    for op in ops:
+        if op == 'M':
+            score += sim_func(src[i], tar[j])
+        elif op == prev:
+            score -= gap_ext
+        else:
+            score -= gap_open
+        if op != 'I':
+            i += 1
+        if op != 'D':
+            j += 1
+        prev = op
+
+    return _alignment(src, tar, ops, score, gap)
 
 
 if __name__ == '__main__':
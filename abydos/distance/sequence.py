@@ -30,11 +30,206 @@ from numpy import zeros as np_zeros
 
 from six.moves import range
 
+from .levenshtein import _myers_peq
 
 __all__ = ['dist_lcsseq', 'dist_lcsstr', 'dist_ratcliff_obershelp', 'lcsseq',
            'lcsstr', 'sim_lcsseq', 'sim_lcsstr', 'sim_ratcliff_obershelp']
 
 
+# below this many DP cells, _lcsstr_stl_dp is faster than a suffix automaton
+_LCSSTR_DP_CELLS = 200
+
+
+def _suffix_automaton(term, start=0, end=None):
+    """Return the suffix automaton of a string.
+
+    The suffix automaton :cite:`Blumer:1985` is the smallest automaton
+    accepting every suffix of a string; every substring of the string is the
+    label of a path from the initial state (0). It is built in linear time.
+
+    :param str term: the string
+    :param int start: the index of the start of the string within term
+    :param int end: the index of the end of the string within term (by
+        default, the end of term)
+    :returns: the suffix link, the length of the longest string, and the
+        transitions (a dict of characters to states) of each state
+    :rtype: tuple
+
+    >>> link, length, trans = _suffix_automaton('aab')
+    >>> len(length), sorted(trans[0])
+    (4, ['a', 'b'])
+    """
+    if end is None:
+        end = len(term)
+    link = [-1]
+    length = [0]
+    trans = [{}]
+    last = 0
+    for pos in range(start, end):
+        char = term[pos]
+        cur = len(length)
+        length.append(length[last]+1)
+        link.append(0)
+        trans.append({})
+        state = last
+        while state != -1 and char not in trans[state]:
+            trans[state][char] = cur
+            state = link[state]
+        if state != -1:
+            nxt = trans[state][char]
+            if length[state]+1 == length[nxt]:
+                link[cur] = nxt
+            else:
+                # split nxt, cloning it for the shorter strings
+                clone = len(length)
+                length.append(length[state]+1)
+                link.append(link[nxt])
+                trans.append(dict(trans[nxt]))
+                while state != -1 and trans[state].get(char) == nxt:
+                    trans[state][char] = clone
+                    state = link[state]
+                link[nxt] = clone
+                link[cur] = clone
+        last = cur
+    return link, length, trans
+
+
+def _lcsstr_stl_dp(src, tar, src_start, src_end, tar_start, tar_end):
+    """Return the start positions & length of the longest common substring.
+
+    This is the quadratic dynamic programming equivalent of _lcsstr_stl(),
+    which is faster on short strings.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param int src_start: the index of the start of the range of src compared
+    :param int src_end: the index of the end of the range of src compared
+    :param int tar_start: the index of the start of the range of tar compared
+    :param int tar_end: the index of the end of the range of tar compared
+    :returns: the start position in src, the start position in tar, and the
+        length of the longest common substring
+    :rtype: tuple
+
+    >>> _lcsstr_stl_dp('aluminum', 'Catalan', 0, 8, 0, 7)
+    (0, 3, 2)
+    """
+    # only the previous row of common suffix lengths is retained
+    tar_range = tar[tar_start:tar_end]
+    prev = [0] * (len(tar_range)+1)
+    longest, src_longest, tar_longest = 0, 0, 0
+    for i in range(src_start, src_end):
+        src_char = src[i]
+        cur = [0] * (len(tar_range)+1)
+        for j, tar_char in enumerate(tar_range, 1):
+            if src_char == tar_char:
+                cur[j] = prev[j-1] + 1
+                if cur[j] > longest:
+                    longest = cur[j]
+                    src_longest = i+1
+                    tar_longest = tar_start+j
+        prev = cur
+    if not longest:
+        return src_start, tar_start, 0
+    return src_longest-longest, tar_longest-longest, longest
+
+
+def _lcsstr_stl(src, tar, src_start=0, src_end=None, tar_start=0,
+                tar_end=None):
+    """Return the start positions & length of the longest common substring.
+
+    The longest common substring of src[src_start:src_end] and
+    tar[tar_start:tar_end] is found by running the former through a suffix
+    automaton of the latter, tracking the longest suffix of each prefix of the
+    former that is a substring of the latter. This takes linear, rather than
+    quadratic, time. Where several common substrings share the greatest
+    length, the one ending first in src (and its first occurrence in tar) is
+    returned.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param int src_start: the index of the start of the range of src compared
+    :param int src_end: the index of the end of the range of src compared (by
+        default, the end of src)
+    :param int tar_start: the index of the start of the range of tar compared
+    :param int tar_end: the index of the end of the range of tar compared (by
+        default, the end of tar)
+    :returns: the start position in src, the start position in tar, and the
+        length of the longest common substring
+    :rtype: tuple
+
+    >>> _lcsstr_stl('Niall', 'Neil')
+    (0, 0, 1)
+    >>> _lcsstr_stl('aluminum', 'Catalan')
+    (0, 3, 2)
+    >>> _lcsstr_stl('aluminum', 'Catalan', 1, 8, 0, 4)
+    (1, 0, 0)
+    """
+    if src_end is None:
+        src_end = len(src)
+    if tar_end is None:
+        tar_end = len(tar)
+    if (src_end-src_start) * (tar_end-tar_start) <= _LCSSTR_DP_CELLS:
+        return _lcsstr_stl_dp(src, tar, src_start, src_end, tar_start,
+                              tar_end)
+    link, length, trans = _suffix_automaton(tar, tar_start, tar_end)
+
+    state = current = longest = 0
+    src_longest = src_start
+    for pos in range(src_start, src_end):
+        char = src[pos]
+        while state and char not in trans[state]:
+            state = link[state]
+            current = length[state]
+        if char in trans[state]:
+            state = trans[state][char]
+            current += 1
+        else:
+            current = 0
+        if current > longest:
+            longest = current
+            src_longest = pos+1
+
+    if not longest:
+        return src_start, tar_start, 0
+    src_longest -= longest
+    return (src_longest,
+            tar.find(src[src_longest:src_longest+longest], tar_start,
+                     tar_end),
+            longest)
+
+
+def _lcsseq_length(src, tar, peq=None):
+    """Return the length of the longest common subsequence of two strings.
+
+    This is the bit-parallel algorithm of Allison & Dix :cite:`Allison:1986`,
+    in the formulation of Hyyrö :cite:`Hyyro:2004`. A row of the LCS length
+    matrix is encoded as a bit-vector (with Python's arbitrary-precision
+    integers, so src may be of any length), so each character of tar is
+    processed with a handful of bitwise operations, rather than a loop over
+    src.
+
+    :param str src: source string for comparison
+    :param str tar: target string for comparison
+    :param dict peq: the match bit-vectors of src, as returned by
+        _myers_peq(src), if already computed
+    :returns: the length of the longest common subsequence
+    :rtype: int
+
+    >>> _lcsseq_length('Niall', 'Neil')
+    3
+    >>> _lcsseq_length('aluminum', 'Catalan')
+    3
+    """
+    if peq is None:
+        peq = _myers_peq(src)
+    mask = (1 << len(src)) - 1
+    row = mask
+    for char in tar:
+        matches = row & peq.get(char, 0)
+        row = ((row + matches) | (row - matches)) & mask
+    return len(src) - bin(row).count('1')
+
+
 def lcsseq(src, tar):
     """Return the longest common subsequence of two strings.
 
@@ -95,6 +290,10 @@ def sim_lcsseq(src, tar):
     This employs the LCSseq function to derive a similarity metric:
     :math:`sim_{LCSseq}(s,t) = \\frac{|LCSseq(s,t)|}{max(|s|, |t|)}`
 
+    Only the length of the longest common subsequence is needed, so it is
+    computed with a bit-parallel algorithm, without finding the subsequence
+    itself.
+
     :param str src: source string for comparison
     :param str tar: target string for comparison
     :returns: LCSseq similarity
@@ -113,7 +312,7 @@ def sim_lcsseq(src, tar):
         return 1.0
     elif not src or not tar:
         return 0.0
-    return len(lcsseq(src, tar)) / max(len(src), len(tar))
+    return _lcsseq_length(src, tar) / max(len(src), len(tar))
 
 
 def dist_lcsseq(src, tar):
@@ -146,15 +345,9 @@ def lcsstr(src, tar):
 
     Longest common substring (LCSstr).
 
-    Based on the code from
-    https://en.wikibooks.org/wiki/Algorithm_Implementation/Strings/Longest_common_substring#Python
-    :cite:`Wikibooks:2018`.
-    This is licensed Creative Commons: Attribution-ShareAlike 3.0.
-
-    Modifications include:
-
-        - conversion to a numpy array in place of a list of lists
-        - conversion to Python 2/3-safe range from xrange via six
+    This is found in linear time by matching src against a suffix automaton
+    of tar :cite:`Blumer:1985`. Where several common substrings share the
+    greatest length, the one occurring first in src is returned.
 
     :param str src: source string for comparison
     :param str tar: target string for comparison
@@ -170,18 +363,8 @@ def lcsstr(src, tar):
     >>> lcsstr('ATCG', 'TAGC')
     'A'
     """
-    lengths = np_zeros((len(src)+1, len(tar)+1), dtype=np_int)
-    longest, i_longest = 0, 0
-    for i in range(1, len(src)+1):
-        for j in range(1, len(tar)+1):
-            if src[i-1] == tar[j-1]:
-                lengths[i, j] = lengths[i-1, j-1] + 1
-                if lengths[i, j] > longest:
-                    longest = lengths[i, j]
-                    i_longest = i
-            else:
-                lengths[i, j] = 0
-    return src[i_longest - longest:i_longest]
+    src_start, _, length = _lcsstr_stl(src, tar)
+    return src[src_start:src_start+length]
 
 
 def sim_lcsstr(src, tar):
@@ -269,27 +452,6 @@ def sim_ratcliff_obershelp(src, tar):
     >>> sim_ratcliff_obershelp('ATCG', 'TAGC')
     0.5
     """
-    def _lcsstr_stl(src, tar):
-        """Return start positions & length for Ratcliff-Obershelp.
-
-        Return the start position in the source string, start position in
-        the target string, and length of the longest common substring of
-        strings src and tar.
-        """
-        lengths = np_zeros((len(src)+1, len(tar)+1), dtype=np_int)
-        longest, src_longest, tar_longest = 0, 0, 0
-        for i in range(1, len(src)+1):
-            for j in range(1, len(tar)+1):
-                if src[i-1] == tar[j-1]:
-                    lengths[i, j] = lengths[i-1, j-1] + 1
-                    if lengths[i, j] > longest:
-                        longest = lengths[i, j]
-                        src_longest = i
-                        tar_longest = j
-                else:
-                    lengths[i, j] = 0
-        return src_longest-longest, tar_longest-longest, longest
-
     def _sstr_matches(src, tar):
         """Return the sum of substring match lengths.
 
@@ -300,14 +462,25 @@ def sim_ratcliff_obershelp(src, tar):
              3. Base case is a 0 length common substring, in which case,
                  return 0.
              4. Return the sum.
+
+        Rather than recursing on copies of the substrings, a stack of the
+        index ranges remaining to be matched is kept.
         """
-        src_start, tar_start, length = _lcsstr_stl(src, tar)
-        if length == 0:
-            return 0
-        return (_sstr_matches(src[:src_start], tar[:tar_start]) +
-                length +
-                _sstr_matches(src[src_start+length:],
-                              tar[tar_start+length:]))
+        matches = 0
+        ranges = [(0, len(src), 0, len(tar))]
+        while ranges:
+            src_start, src_end, tar_start, tar_end = ranges.pop()
+            if src_start == src_end or tar_start == tar_end:
+                continue
+            src_pos, tar_pos, length = _lcsstr_stl(src, tar, src_start,
+                                                   src_end, tar_start,
+                                                   tar_end)
+            if length:
+                matches += length
+                ranges.append((src_start, src_pos, tar_start, tar_pos))
+                ranges.append((src_pos+length, src_end, tar_pos+length,
+                               tar_end))
+        return matches
 
     if src == tar:
         return 1.0
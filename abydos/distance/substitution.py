@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.distance.substitution.
+
+The distance.substitution module implements substitution matrices: tables of
+the similarity of each pair of symbols of an alphabet, such as BLOSUM
+:cite:`Henikoff:1992` & PAM :cite:`Dayhoff:1978` matrices, for use as the
+sim_func of the sequence alignment functions of distance.seqalign.
+"""
+
+from __future__ import division, unicode_literals
+
+from io import open
+
+from numpy import array as np_array
+from numpy import array_equal as np_array_equal
+from numpy import float64 as np_float64
+from numpy import full as np_full
+from numpy import intp as np_intp
+
+from six import text_type
+
+from ..phones import cmp_features, ipa_to_features
+
+__all__ = ['SubstitutionMatrix']
+
+
+class SubstitutionMatrix(object):
+    """SubstitutionMatrix object.
+
+    A substitution matrix holds the similarity of each pair of symbols of an
+    alphabet in a dense array, indexed through a map from each symbol to its
+    position in the alphabet, so that a lookup costs one dict access & one
+    array access. Calling the object with two symbols returns their
+    similarity, so it can be supplied anywhere a sim_func is expected; the
+    alignment functions of distance.seqalign further recognize it and gather
+    whole rows of similarities by array indexing.
+    """
+
+    def __init__(self, alphabet, scores=None, mismatch_cost=0, match_cost=1):
+        """Initialize SubstitutionMatrix.
+
+        :param alphabet: the symbols of the matrix (a string or a sequence of
+            strings)
+        :param scores: a square array (or nested sequence) of similarities,
+            in the order of alphabet (rows are src symbols, columns tar
+            symbols); if None, the matrix is filled with match_cost on the
+            diagonal & mismatch_cost elsewhere
+        :param float mismatch_cost: the similarity of unequal symbols, if
+            scores is None
+        :param float match_cost: the similarity of equal symbols, if scores is
+            None
+
+        >>> sm = SubstitutionMatrix('ACGT', mismatch_cost=-1)
+        >>> sm('A', 'A'), sm('A', 'C')
+        (1.0, -1.0)
+        """
+        self._alphabet = tuple(alphabet)
+        self._index = {}
+        for pos, symbol in enumerate(self._alphabet):
+            if symbol in self._index:
+                raise ValueError('duplicate symbol in alphabet: ' + symbol)
+            self._index[symbol] = pos
+
+        size = len(self._alphabet)
+        if scores is None:
+            self._scores = np_full((size, size), mismatch_cost,
+                                   dtype=np_float64)
+            self._scores.flat[::size+1] = match_cost
+        else:
+            self._scores = np_array(scores, dtype=np_float64)
+            if self._scores.shape != (size, size):
+                raise ValueError('scores must be a ' + text_type(size) + 'x' +
+                                 text_type(size) + ' matrix')
+        self._symmetric = np_array_equal(self._scores, self._scores.T)
+
+    @classmethod
+    def from_dict(cls, mat, alphabet=None, mismatch_cost=0, match_cost=1,
+                  symmetric=True):
+        """Return a SubstitutionMatrix built from a sim_matrix style dict.
+
+        :param dict mat: a dict mapping (src, tar) tuples of symbols to
+            similarities
+        :param alphabet: the symbols of the matrix; by default, those that
+            appear in mat (in sorted order)
+        :param float mismatch_cost: the similarity of unequal symbols absent
+            from mat
+        :param float match_cost: the similarity of equal symbols absent from
+            mat
+        :param bool symmetric: True if (src, tar) pairs in mat also give the
+            similarity of (tar, src), as in sim_matrix
+        :returns: the substitution matrix
+        :rtype: SubstitutionMatrix
+
+        >>> sm = SubstitutionMatrix.from_dict({('A', 'G'): -1, ('A', 'A'): 10})
+        >>> sm.alphabet
+        ('A', 'G')
+        >>> sm('G', 'A'), sm('A', 'A'), sm('G', 'G')
+        (-1.0, 10.0, 1.0)
+        """
+        if alphabet is None:
+            alphabet = sorted({symbol for pair in mat for symbol in pair})
+        matrix = cls(alphabet, None, mismatch_cost, match_cost)
+        index = matrix._index
+        for (src, tar), score in mat.items():
+            matrix._scores[index[src], index[tar]] = score
+            if symmetric and (tar, src) not in mat:
+                matrix._scores[index[tar], index[src]] = score
+        matrix._symmetric = np_array_equal(matrix._scores, matrix._scores.T)
+        return matrix
+
+    @classmethod
+    def from_text(cls, text):
+        """Return a SubstitutionMatrix parsed from BLOSUM/PAM style text.
+
+        The text format is that of the matrices distributed with NCBI BLAST:
+        lines beginning with '#' are comments, the first other line lists the
+        column symbols, and each remaining line holds a row symbol followed
+        by its similarity with each column symbol.
+
+        :param text: the text of the matrix (a string or an iterable of lines)
+        :returns: the substitution matrix
+        :rtype: SubstitutionMatrix
+
+        >>> sm = SubstitutionMatrix.from_text('''# excerpt of BLOSUM62
+        ...    A  R  N
+        ... A  4 -1 -2
+        ... R -1  5  0
+        ... N -2  0  6''')
+        >>> sm.alphabet
+        ('A', 'R', 'N')
+        >>> sm('R', 'A')
+        -1.0
+        """
+        if isinstance(text, (str, text_type)):
+            text = text.splitlines()
+
+        columns = None
+        rows = {}
+        for line in text:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            fields = line.split()
+            if columns is None:
+                columns = fields
+                continue
+            if len(fields) != len(columns)+1:
+                raise ValueError('matrix row has ' +
+                                 text_type(len(fields)-1) +
+                                 ' values; expected ' +
+                                 text_type(len(columns)))
+            rows[fields[0]] = [float(value) for value in fields[1:]]
+
+        if columns is None or set(rows) != set(columns):
+            raise ValueError('matrix rows & columns must list the same '
+                             'symbols')
+        return cls(columns, [rows[symbol] for symbol in columns])
+
+    @classmethod
+    def from_file(cls, filename, encoding='utf-8'):
+        """Return a SubstitutionMatrix loaded from a BLOSUM/PAM style file.
+
+        :param str filename: the path of the matrix file (in the format read by
+            from_text)
+        :param str encoding: the character encoding of the file
+        :returns: the substitution matrix
+        :rtype: SubstitutionMatrix
+        """
+        with open(filename, encoding=encoding) as matrix_file:
+            return cls.from_text(matrix_file)
+
+    @classmethod
+    def from_phones(cls, alphabet):
+        """Return a SubstitutionMatrix of phonetic feature similarities.
+
+        Each pair of phones is scored by cmp_features of their feature
+        bundles, so similarities fall in the range :math:`[0, 1]`, while a
+        phone with no (single) feature bundle scores -1 against every phone.
+
+        :param alphabet: the IPA phones of the matrix (a string or a sequence
+            of strings)
+        :returns: the substitution matrix
+        :rtype: SubstitutionMatrix
+
+        >>> sm = SubstitutionMatrix.from_phones('lnzi')
+        >>> sm('l', 'n')
+        0.8709677419354839
+        >>> sm('l', 'i')
+        0.564516129032258
+        """
+        alphabet = tuple(alphabet)
+        features = []
+        for phone in alphabet:
+            bundles = ipa_to_features(phone)
+            features.append(bundles[0] if len(bundles) == 1 else -1)
+        return cls(alphabet, [[cmp_features(feat1, feat2)
+                               for feat2 in features] for feat1 in features])
+
+    @property
+    def alphabet(self):
+        """Return the symbols of the matrix.
+
+        :returns: the symbols, in the order of the rows & columns of scores
+        :rtype: tuple
+        """
+        return self._alphabet
+
+    @property
+    def scores(self):
+        """Return the array of similarities.
+
+        :returns: the square array of similarities, with rows for src symbols
+            & columns for tar symbols
+        :rtype: numpy.ndarray
+        """
+        return self._scores
+
+    @property
+    def symmetric(self):
+        """Return whether the matrix is symmetric.
+
+        :returns: True if each (src, tar) similarity equals the (tar, src)
+            similarity
+        :rtype: bool
+        """
+        return self._symmetric
+
+    def index(self, symbol):
+        """Return the position of a symbol in the alphabet.
+
+        :param str symbol: a symbol of the alphabet
+        :returns: the row & column of the symbol in scores
+        :rtype: int
+
+        >>> SubstitutionMatrix('ACGT').index('G')
+        2
+        """
+        try:
+            return self._index[symbol]
+        except KeyError:
+            raise ValueError(symbol + ' not in alphabet')
+
+    def encode(self, string):
+        """Return the positions in the alphabet of the symbols of a string.
+
+        :param string: a string (or sequence) of symbols of the alphabet
+        :returns: the row & column of each symbol in scores
+        :rtype: numpy.ndarray
+
+        >>> SubstitutionMatrix('ACGT').encode('GATTACA').tolist()
+        [2, 0, 3, 3, 0, 1, 0]
+        """
+        index = self.index
+        return np_array([index(symbol) for symbol in string], dtype=np_intp)
+
+    def row(self, symbol, positions):
+        """Return the similarities of a symbol with a sequence of symbols.
+
+        :param str symbol: a src symbol
+        :param numpy.ndarray positions: the tar symbols, as returned by encode
+        :returns: the similarity of symbol with each of the tar symbols
+        :rtype: list
+
+        >>> sm = SubstitutionMatrix('ACGT', mismatch_cost=-1)
+        >>> sm.row('A', sm.encode('CAT'))
+        [-1.0, 1.0, -1.0]
+        """
+        return self._scores[self.index(symbol)][positions].tolist()
+
+    def __call__(self, src, tar):
+        """Return the similarity of two symbols.
+
+        :param str src: a src symbol
+        :param str tar: a tar symbol
+        :returns: the similarity of src with tar
+        :rtype: float
+
+        >>> sm = SubstitutionMatrix('ACGT', mismatch_cost=-1)
+        >>> sm('T', 'T')
+        1.0
+        >>> sm('T', 'U')
+        Traceback (most recent call last):
+            ...
+        ValueError: U not in alphabet
+        """
+        return float(self._scores[self.index(src), self.index(tar)])
+
+    def __len__(self):
+        """Return the number of symbols in the alphabet.
+
+        :returns: the size of the alphabet
+        :rtype: int
+
+        >>> len(SubstitutionMatrix('ACGT'))
+        4
+        """
+        return len(self._alphabet)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
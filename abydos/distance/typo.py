@@ -25,15 +25,141 @@ from __future__ import division, unicode_literals
 
 from math import log
 
-from numpy import float32 as np_float32
-from numpy import zeros as np_zeros
-
-from six.moves import range
+from ._dp import _dp_score
 
 __all__ = ['dist_typo', 'sim_typo', 'typo']
 
+_KEYBOARDS = {'QWERTY': (
+    (('`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '='),
+     ('', 'q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '[', ']',
+      '\\'),
+     ('', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', ';', '\''),
+     ('', 'z', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '/')),
+    (('~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+'),
+     ('', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '{', '}', '|'),
+     ('', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ':', '"'),
+     ('', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', '<', '>', '?'))
+), 'Dvorak': (
+    (('`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '[', ']'),
+     ('', '\'', ',', '.', 'p', 'y', 'f', 'g', 'c', 'r', 'l', '/', '=',
+      '\\'),
+     ('', 'a', 'o', 'e', 'u', 'i', 'd', 'h', 't', 'n', 's', '-'),
+     ('', ';', 'q', 'j', 'k', 'x', 'b', 'm', 'w', 'v', 'z')),
+    (('~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '{', '}'),
+     ('', '"', '<', '>', 'P', 'Y', 'F', 'G', 'C', 'R', 'L', '?', '+', '|'),
+     ('', 'A', 'O', 'E', 'U', 'I', 'D', 'H', 'T', 'N', 'S', '_'),
+     ('', ':', 'Q', 'J', 'K', 'X', 'B', 'M', 'W', 'V', 'Z'))
+), 'AZERTY': (
+    (('²', '&', 'é', '"', '\'', '(', '-', 'è', '_', 'ç', 'à', ')', '='),
+     ('', 'a', 'z', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '', '$'),
+     ('', 'q', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'ù', '*'),
+     ('<', 'w', 'x', 'c', 'v', 'b', 'n', ',', ';', ':', '!')),
+    (('~', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '°', '+'),
+     ('', 'A', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '', '£'),
+     ('', 'Q', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'M', 'Ù', 'μ'),
+     ('>', 'W', 'X', 'C', 'V', 'B', 'N', '?', '.', '/', '§'))
+), 'QWERTZ': (
+    (('', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', 'ß', ''),
+     ('', 'q', 'w', 'e', 'r', 't', 'z', 'u', 'i', 'o', 'p', ' ü', '+',
+      '\\'),
+     ('', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'ö', 'ä', '#'),
+     ('<', 'y', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '-')),
+    (('°', '!', '"', '§', '$', '%', '&', '/', '(', ')', '=', '?', ''),
+     ('', 'Q', 'W', 'E', 'R', 'T', 'Z', 'U', 'I', 'O', 'P', 'Ü', '*', ''),
+     ('', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Ö', 'Ä', '\''),
+     ('>', 'Y', 'X', 'C', 'V', 'B', 'N', 'M', ';', ':', '_'))
+)}
+
+
+def _keyboard_coords(keyboard):
+    """Return the position of each character of a keyboard layout.
+
+    A character found in both the unshifted & shifted layout (or more than
+    once in either) is placed at its first unshifted position.
+
+    :param tuple keyboard: the unshifted & shifted rows of a keyboard layout
+    :returns: a dict mapping each character to its (row, column, shift) on the
+        keyboard, where shift is 0 (unshifted) or 1 (shifted)
+    :rtype: dict
+
+    >>> coords = _keyboard_coords(((('a', 'b'), ('', 'c')),
+    ...                            (('A', 'B'), ('', 'C'))))
+    >>> coords['b'], coords['c'], coords['C']
+    ((0, 1, 0), (1, 1, 0), (1, 1, 1))
+    """
+    coords = {}
+    for shift, kb_array in enumerate(keyboard):
+        for row, keys in enumerate(kb_array):
+            for col, char in enumerate(keys):
+                if char and char not in coords:
+                    coords[char] = (row, col, shift)
+    return coords
+
+
+_KEYBOARD_COORDS = {layout: _keyboard_coords(keyboard) for layout, keyboard
+                    in _KEYBOARDS.items()}
+
+
+def _euclidean_keyboard_distance(coord1, coord2):
+    return ((coord1[0] - coord2[0]) ** 2 + (coord1[1] - coord2[1]) ** 2) ** 0.5
+
+
+def _manhattan_keyboard_distance(coord1, coord2):
+    return abs(coord1[0] - coord2[0]) + abs(coord1[1] - coord2[1])
+
+
+def _log_euclidean_keyboard_distance(coord1, coord2):
+    return log(1 + _euclidean_keyboard_distance(coord1, coord2))
+
+
+def _log_manhattan_keyboard_distance(coord1, coord2):
+    return log(1 + _manhattan_keyboard_distance(coord1, coord2))
+
 
-def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY'):
+_KEYBOARD_METRICS = {'euclidean': _euclidean_keyboard_distance,
+                     'manhattan': _manhattan_keyboard_distance,
+                     'log-euclidean': _log_euclidean_keyboard_distance,
+                     'log-manhattan': _log_manhattan_keyboard_distance}
+
+# substitution cost matrices, by (layout, metric, sub_cost, shift_cost)
+_SUBSTITUTION_COSTS = {}
+
+
+def _typo_substitution_costs(layout, metric, sub_cost, shift_cost):
+    """Return the substitution costs between the keys of a keyboard.
+
+    The matrix is computed on first use and cached.
+
+    :param str layout: name of the keyboard layout
+    :param str metric: the keyboard distance metric, as for typo()
+    :param float sub_cost: the cost of a substitution
+    :param float shift_cost: the cost of a shift
+    :returns: a dict mapping each character to its index in the matrix, and
+        the matrix of costs of substituting each character for each other
+    :rtype: tuple
+
+    >>> index, costs = _typo_substitution_costs('QWERTY', 'manhattan', 0.5,
+    ...                                         0.5)
+    >>> costs[index['c']][index['h']]
+    2.0
+    >>> costs[index['c']][index['H']]
+    2.25
+    """
+    key = (layout, metric, sub_cost, shift_cost)
+    if key not in _SUBSTITUTION_COSTS:
+        coords = _KEYBOARD_COORDS[layout]
+        distance = _KEYBOARD_METRICS[metric]
+        chars = sorted(coords)
+        _SUBSTITUTION_COSTS[key] = (
+            {char: idx for idx, char in enumerate(chars)},
+            [[sub_cost * (distance(coords[char1], coords[char2]) +
+                          shift_cost * (coords[char1][2] != coords[char2][2]))
+              for char2 in chars] for char1 in chars])
+    return _SUBSTITUTION_COSTS[key]
+
+
+def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY',
+         engine='python'):
     """Return the typo distance between two strings.
 
     This is inspired by Typo-Distance :cite:`Song:2011`, and a fair bit of
@@ -51,15 +177,18 @@ def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY'):
         a log metric is used.
     :param str layout: name of the keyboard layout to use (Currently supported:
         QWERTY, Dvorak, AZERTY, QWERTZ)
+    :param str engine: 'python' (default) to fill the DP row by row, or
+        'numpy' to fill it by anti-diagonals with NumPy (faster for long
+        strings)
     :returns: typo distance
     :rtype: float
 
-    >>> typo('cat', 'hat')
-    1.5811388
-    >>> typo('Niall', 'Neil')
-    2.8251407
-    >>> typo('Colin', 'Cuilen')
-    3.4142137
+    >>> round(typo('cat', 'hat'), 12)
+    1.581138830084
+    >>> round(typo('Niall', 'Neil'), 12)
+    2.825140769936
+    >>> round(typo('Colin', 'Cuilen'), 12)
+    3.414213562373
     >>> typo('ATCG', 'TAGC')
     2.5
 
@@ -72,14 +201,17 @@ def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY'):
     >>> typo('ATCG', 'TAGC', metric='manhattan')
     2.5
 
-    >>> typo('cat', 'hat', metric='log-manhattan')
-    0.804719
-    >>> typo('Niall', 'Neil', metric='log-manhattan')
-    2.2424533
+    >>> round(typo('cat', 'hat', metric='log-manhattan'), 12)
+    0.804718956217
+    >>> round(typo('Niall', 'Neil', metric='log-manhattan'), 12)
+    2.242453324894
     >>> typo('Colin', 'Cuilen', metric='log-manhattan')
-    2.2424533
-    >>> typo('ATCG', 'TAGC', metric='log-manhattan')
-    2.3465736
+    2.242453324894
+    >>> round(typo('ATCG', 'TAGC', metric='log-manhattan'), 12)
+    2.34657359028
+
+    >>> round(typo('Niall', 'Neil', engine='numpy'), 12)
+    2.825140769936
     """
     ins_cost, del_cost, sub_cost, shift_cost = cost
 
@@ -90,112 +222,24 @@ def typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5), layout='QWERTY'):
     if not tar:
         return len(src) * del_cost
 
-    kbs = {'QWERTY': (
-        (('`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '-', '='),
-         ('', 'q', 'w', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '[', ']',
-          '\\'),
-         ('', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', ';', '\''),
-         ('', 'z', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '/')),
-        (('~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '_', '+'),
-         ('', 'Q', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '{', '}', '|'),
-         ('', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', ':', '"'),
-         ('', 'Z', 'X', 'C', 'V', 'B', 'N', 'M', '<', '>', '?'))
-    ), 'Dvorak': (
-        (('`', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '[', ']'),
-         ('', '\'', ',', '.', 'p', 'y', 'f', 'g', 'c', 'r', 'l', '/', '=',
-          '\\'),
-         ('', 'a', 'o', 'e', 'u', 'i', 'd', 'h', 't', 'n', 's', '-'),
-         ('', ';', 'q', 'j', 'k', 'x', 'b', 'm', 'w', 'v', 'z')),
-        (('~', '!', '@', '#', '$', '%', '^', '&', '*', '(', ')', '{', '}'),
-         ('', '"', '<', '>', 'P', 'Y', 'F', 'G', 'C', 'R', 'L', '?', '+', '|'),
-         ('', 'A', 'O', 'E', 'U', 'I', 'D', 'H', 'T', 'N', 'S', '_'),
-         ('', ':', 'Q', 'J', 'K', 'X', 'B', 'M', 'W', 'V', 'Z'))
-    ), 'AZERTY': (
-        (('²', '&', 'é', '"', '\'', '(', '-', 'è', '_', 'ç', 'à', ')', '='),
-         ('', 'a', 'z', 'e', 'r', 't', 'y', 'u', 'i', 'o', 'p', '', '$'),
-         ('', 'q', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'm', 'ù', '*'),
-         ('<', 'w', 'x', 'c', 'v', 'b', 'n', ',', ';', ':', '!')),
-        (('~', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', '°', '+'),
-         ('', 'A', 'W', 'E', 'R', 'T', 'Y', 'U', 'I', 'O', 'P', '', '£'),
-         ('', 'Q', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'M', 'Ù', 'μ'),
-         ('>', 'W', 'X', 'C', 'V', 'B', 'N', '?', '.', '/', '§'))
-    ), 'QWERTZ': (
-        (('', '1', '2', '3', '4', '5', '6', '7', '8', '9', '0', 'ß', ''),
-         ('', 'q', 'w', 'e', 'r', 't', 'z', 'u', 'i', 'o', 'p', ' ü', '+',
-          '\\'),
-         ('', 'a', 's', 'd', 'f', 'g', 'h', 'j', 'k', 'l', 'ö', 'ä', '#'),
-         ('<', 'y', 'x', 'c', 'v', 'b', 'n', 'm', ',', '.', '-')),
-        (('°', '!', '"', '§', '$', '%', '&', '/', '(', ')', '=', '?', ''),
-         ('', 'Q', 'W', 'E', 'R', 'T', 'Z', 'U', 'I', 'O', 'P', 'Ü', '*', ''),
-         ('', 'A', 'S', 'D', 'F', 'G', 'H', 'J', 'K', 'L', 'Ö', 'Ä', '\''),
-         ('>', 'Y', 'X', 'C', 'V', 'B', 'N', 'M', ';', ':', '_'))
-    )}
-
-    keyboard = kbs[layout]
-    lowercase = {item for sublist in keyboard[0] for item in sublist}
-    uppercase = {item for sublist in keyboard[1] for item in sublist}
-
-    def _kb_array_for_char(char):
-        """Return the keyboard layout that contains ch."""
-        if char in lowercase:
-            return keyboard[0]
-        elif char in uppercase:
-            return keyboard[1]
-        raise ValueError(char + ' not found in any keyboard layouts')
-
-    def _get_char_coord(char, kb_array):
-        """Return the row & column of char in the keyboard."""
-        for row in kb_array:  # pragma: no branch
-            if char in row:
-                return kb_array.index(row), row.index(char)
-
-    def _euclidean_keyboard_distance(char1, char2):
-        row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-        row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-        return ((row1 - row2) ** 2 + (col1 - col2) ** 2) ** 0.5
-
-    def _manhattan_keyboard_distance(char1, char2):
-        row1, col1 = _get_char_coord(char1, _kb_array_for_char(char1))
-        row2, col2 = _get_char_coord(char2, _kb_array_for_char(char2))
-        return abs(row1 - row2) + abs(col1 - col2)
-
-    def _log_euclidean_keyboard_distance(char1, char2):
-        return log(1 + _euclidean_keyboard_distance(char1, char2))
-
-    def _log_manhattan_keyboard_distance(char1, char2):
-        return log(1 + _manhattan_keyboard_distance(char1, char2))
-
-    metric_dict = {'euclidean': _euclidean_keyboard_distance,
-                   'manhattan': _manhattan_keyboard_distance,
-                   'log-euclidean': _log_euclidean_keyboard_distance,
-                   'log-manhattan': _log_manhattan_keyboard_distance}
-
-    def _substitution_cost(char1, char2):
-        cost = sub_cost
-        cost *= (metric_dict[metric](char1, char2) +
-                 shift_cost * (_kb_array_for_char(char1) !=
-                               _kb_array_for_char(char2)))
-        return cost
-
-    d_mat = np_zeros((len(src) + 1, len(tar) + 1), dtype=np_float32)
-    for i in range(len(src) + 1):
-        d_mat[i, 0] = i * del_cost
-    for j in range(len(tar) + 1):
-        d_mat[0, j] = j * ins_cost
-
-    for i in range(len(src)):
-        for j in range(len(tar)):
-            d_mat[i + 1, j + 1] = min(
-                d_mat[i + 1, j] + ins_cost,  # ins
-                d_mat[i, j + 1] + del_cost,  # del
-                d_mat[i, j] + (_substitution_cost(src[i], tar[j])
-                               if src[i] != tar[j] else 0)  # sub/==
-            )
-
-    return d_mat[len(src), len(tar)]
-
-
-def dist_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5)):
+    sub_index, sub_costs = _typo_substitution_costs(layout, metric, sub_cost,
+                                                    shift_cost)
+
+    def _cell_cost(char1, char2):
+        if char1 == char2:
+            return 0
+        try:
+            return sub_costs[sub_index[char1]][sub_index[char2]]
+        except KeyError:
+            char = char2 if char1 in sub_index else char1
+            raise ValueError(char + ' not found in any keyboard layouts')
+
+    return float(_dp_score(src, tar, ins_cost, del_cost, _cell_cost,
+                           engine=engine))
+
+
+def dist_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5),
+              engine='python'):
     """Return the normalized typo distance between two strings.
 
     This is typo distance, normalized to [0, 1].
@@ -209,26 +253,28 @@ def dist_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5)):
         default: (1, 1, 0.5, 0.5)) The substitution & shift costs should be
         significantly less than the cost of an insertion & deletion unless
         a log metric is used.
+    :param str engine: 'python' (default) or 'numpy', as for typo
     :returns: normalized typo distance
     :rtype: float
 
     >>> round(dist_typo('cat', 'hat'), 12)
-    0.527046283086
+    0.527046276695
     >>> round(dist_typo('Niall', 'Neil'), 12)
-    0.565028142929
+    0.565028153987
     >>> round(dist_typo('Colin', 'Cuilen'), 12)
-    0.569035609563
+    0.569035593729
     >>> dist_typo('ATCG', 'TAGC')
     0.625
     """
     if src == tar:
         return 0
     ins_cost, del_cost = cost[:2]
-    return (typo(src, tar, metric, cost) /
+    return (typo(src, tar, metric, cost, engine=engine) /
             (max(len(src)*del_cost, len(tar)*ins_cost)))
 
 
-def sim_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5)):
+def sim_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5),
+             engine='python'):
     """Return the normalized typo similarity between two strings.
 
     Normalized typo similarity is the complement of normalized typo distance:
@@ -243,19 +289,20 @@ def sim_typo(src, tar, metric='euclidean', cost=(1, 1, 0.5, 0.5)):
         default: (1, 1, 0.5, 0.5)) The substitution & shift costs should be
         significantly less than the cost of an insertion & deletion unless
         a log metric is used.
+    :param str engine: 'python' (default) or 'numpy', as for typo
     :returns: normalized typo similarity
     :rtype: float
 
     >>> round(sim_typo('cat', 'hat'), 12)
-    0.472953716914
+    0.472953723305
     >>> round(sim_typo('Niall', 'Neil'), 12)
-    0.434971857071
+    0.434971846013
     >>> round(sim_typo('Colin', 'Cuilen'), 12)
-    0.430964390437
+    0.430964406271
     >>> sim_typo('ATCG', 'TAGC')
     0.375
     """
-    return 1 - dist_typo(src, tar, metric, cost)
+    return 1 - dist_typo(src, tar, metric, cost, engine)
 
 
 if __name__ == '__main__':
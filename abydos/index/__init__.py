@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.
+
+The index package includes indices that find the candidate matches of a
+query within a large collection of terms, without comparing the query with
+every term:
+    - Burkhard-Keller trees (BK-trees) for integer-valued metrics, such as
+      Levenshtein distance
+    - MinHash locality-sensitive hashing (LSH) for q-gram Jaccard similarity
+    - phonetic blocking indices, from the codes of phonetic algorithms to
+      records
+    - SymSpell symmetric delete indices for small edit distances
+    - vantage-point trees (VP-trees) for real-valued metrics, such as
+      euclidean distance
+"""
+
+from __future__ import unicode_literals
+
+__all__ = ['bktree', 'lsh', 'phonetic', 'symspell', 'vptree']
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index._storage.
+
+The index._storage module implements the on-disk storage of the indices of
+the index package: each index is saved as a directory of NumPy .npy files,
+one per array, which can be loaded as memory maps, so that several processes
+share one copy of an index.
+"""
+
+from __future__ import unicode_literals
+
+import os
+
+from numpy import array as np_array
+from numpy import cumsum as np_cumsum
+from numpy import frombuffer as np_frombuffer
+from numpy import int64 as np_int64
+from numpy import load as np_load
+from numpy import save as np_save
+from numpy import uint8 as np_uint8
+from numpy import zeros as np_zeros
+
+__all__ = []
+
+
+class _PackedTerms(object):
+    """_PackedTerms object.
+
+    A read-only sequence of terms, held as their UTF-8 encodings, concatenated
+    into one array of bytes, and the offset of each term in it.
+    """
+
+    def __init__(self, data, offsets):
+        """Initialize _PackedTerms.
+
+        :param numpy.ndarray data: the concatenated UTF-8 encodings
+        :param numpy.ndarray offsets: the offset of each term in data (with a
+            final offset, the length of data)
+
+        >>> terms = _PackedTerms(*_pack_terms(['Niall', 'Njáll']))
+        >>> len(terms), terms[1]
+        (2, 'Njáll')
+        """
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self):
+        """Return the number of terms.
+
+        :returns: the number of terms
+        :rtype: int
+        """
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        """Return a term.
+
+        :param int index: the position of the term
+        :returns: the term
+        :rtype: str
+        """
+        start, stop = self.offsets[index], self.offsets[index+1]
+        return self.data[start:stop].tobytes().decode('utf-8')
+
+
+def _pack_terms(terms):
+    """Return terms as the arrays of a _PackedTerms object.
+
+    :param list terms: the terms to pack
+    :returns: the concatenated UTF-8 encodings of the terms & their offsets
+    :rtype: tuple
+
+    >>> data, offsets = _pack_terms(['cat', 'hat'])
+    >>> data.tobytes(), offsets.tolist()
+    (b'cathat', [0, 3, 6])
+    """
+    if isinstance(terms, _PackedTerms):
+        return terms.data, terms.offsets
+    encoded = [term.encode('utf-8') for term in terms]
+    offsets = np_zeros(len(encoded)+1, dtype=np_int64)
+    offsets[1:] = np_cumsum([len(term) for term in encoded])
+    data = np_frombuffer(b''.join(encoded), dtype=np_uint8)
+    return data, offsets
+
+
+def _save_arrays(path, kind, arrays):
+    """Save the arrays of an index to a directory.
+
+    :param str path: the directory (created if necessary)
+    :param str kind: the name of the class of the index
+    :param dict arrays: the arrays to save, by name
+    """
+    # read any memory mapped arrays before their files might be overwritten
+    arrays = {name: np_array(array) for name, array in arrays.items()}
+    if not os.path.isdir(path):
+        os.makedirs(path)
+    with open(os.path.join(path, 'kind'), 'wb') as kind_file:
+        kind_file.write(kind.encode('utf-8'))
+    for name, array in arrays.items():
+        np_save(os.path.join(path, name + '.npy'), array)
+
+
+def _load_arrays(path, kind, names, mmap=True):
+    """Load the arrays of an index from a directory.
+
+    :param str path: the directory
+    :param str kind: the name of the class of the index
+    :param list names: the names of the arrays to load
+    :param bool mmap: if True, the arrays are memory mapped (read-only),
+        rather than read into memory
+    :returns: the arrays, by name
+    :rtype: dict
+    """
+    with open(os.path.join(path, 'kind'), 'rb') as kind_file:
+        saved = kind_file.read().decode('utf-8')
+    if saved != kind:
+        raise ValueError(path + ' holds a ' + saved + ', not a ' + kind)
+    return {name: np_load(os.path.join(path, name + '.npy'),
+                          mmap_mode='r' if mmap else None)
+            for name in names}
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
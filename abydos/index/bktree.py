@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.bktree.
+
+The index.bktree module implements the Burkhard-Keller tree
+:cite:`Burkhard:1973`, an index of terms under an integer-valued metric
+(such as levenshtein, damerau_levenshtein, hamming, indel, or bag distance),
+from which the terms within a distance of a query, or the nearest terms to
+it, can be found without comparing the query with every term:
+
+    - BKTree
+"""
+
+from __future__ import unicode_literals
+
+from heapq import heappush, heapreplace
+
+from numpy import array as np_array
+from numpy import cumsum as np_cumsum
+from numpy import int64 as np_int64
+from numpy import zeros as np_zeros
+
+from six.moves import range
+
+from ._storage import _PackedTerms, _load_arrays, _pack_terms, _save_arrays
+from ..distance.levenshtein import levenshtein
+
+__all__ = ['BKTree']
+
+
+class BKTree(object):
+    """BKTree object.
+
+    Each node of a BK-tree is a term, and the children of a node are keyed by
+    their distance from it; a term is added by descending from the root, at
+    each node following (or creating) the child at the term's distance from
+    the node. By the triangle inequality, a term within distance r of a query
+    that is distance d from a node can only be in the subtrees of the node's
+    children at distances from d-r to d+r, so only these are searched.
+
+    The metric must be a true metric (in particular, it must satisfy the
+    triangle inequality), or matches may be missed. Note that Levenshtein
+    distance with unequal insert & delete costs is not symmetric, and Optimal
+    String Alignment distance does not satisfy the triangle inequality.
+    """
+
+    def __init__(self, terms=(), metric=levenshtein):
+        """Initialize BKTree.
+
+        :param iterable terms: the terms to index initially
+        :param function metric: an integer-valued metric of two terms
+
+        >>> tree = BKTree(['Niall', 'Neal', 'Neil', 'Colin', 'Nigel'])
+        >>> tree.range_query('Njall', 1)
+        [('Niall', 1)]
+        >>> tree.knn('Nial', 2)
+        [('Niall', 1), ('Neal', 1)]
+        """
+        self.metric = metric
+        self._terms = []
+        # the children of each node, as a dict from distance to child node
+        self._children = []
+        # the flat (CSR) form of _children, if the tree was loaded from disk
+        self._flat = None
+
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        """Return the number of indexed terms.
+
+        :returns: the number of indexed terms
+        :rtype: int
+        """
+        return len(self._terms)
+
+    def term(self, term_id):
+        """Return an indexed term.
+
+        :param int term_id: the id (the insertion order) of the term
+        :returns: the term
+        :rtype: str
+        """
+        return self._terms[term_id]
+
+    def _thaw(self):
+        """Convert a tree loaded from disk to its modifiable form."""
+        indptr, distances, nodes = self._flat
+        self._terms = [self._terms[term_id] for term_id in
+                       range(len(self._terms))]
+        self._children = [
+            dict(zip(distances[indptr[node]:indptr[node+1]].tolist(),
+                     nodes[indptr[node]:indptr[node+1]].tolist()))
+            for node in range(len(indptr) - 1)]
+        self._flat = None
+
+    def _edges(self, node):
+        """Return the children of a node.
+
+        :param int node: the node
+        :returns: (distance, child) pairs
+        :rtype: iterable
+        """
+        if self._flat is None:
+            return self._children[node].items()
+        indptr, distances, nodes = self._flat
+        start, stop = indptr[node], indptr[node+1]
+        return zip(distances[start:stop].tolist(), nodes[start:stop].tolist())
+
+    def add(self, term):
+        """Add a term to the tree.
+
+        :param str term: the term to add
+        :returns: the id of the term
+        :rtype: int
+
+        >>> tree = BKTree()
+        >>> tree.add('Niall'), tree.add('Neil')
+        (0, 1)
+        """
+        if self._flat is not None:
+            self._thaw()
+
+        term_id = len(self._terms)
+        self._terms.append(term)
+        self._children.append({})
+        if term_id == 0:
+            return term_id
+
+        node = 0
+        while True:
+            distance = self.metric(term, self._terms[node])
+            child = self._children[node].get(distance)
+            if child is None:
+                self._children[node][distance] = term_id
+                return term_id
+            node = child
+
+    def range_query(self, query, radius):
+        """Return the terms within a distance of a query.
+
+        :param str query: the query term
+        :param int radius: the greatest distance of the terms returned
+        :returns: (term, distance) pairs, nearest first; ties are ordered as
+            the terms were added
+        :rtype: list
+
+        >>> tree = BKTree(['cat', 'hat', 'bat', 'bats', 'dog'])
+        >>> tree.range_query('rat', 1)
+        [('cat', 1), ('hat', 1), ('bat', 1)]
+        """
+        if not self._terms:
+            return []
+
+        matches = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = self.metric(query, self._terms[node])
+            if distance <= radius:
+                matches.append((distance, node))
+            for edge, child in self._edges(node):
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+
+        matches.sort()
+        return [(self._terms[node], distance) for distance, node in matches]
+
+    def knn(self, query, k=1):
+        """Return the nearest terms to a query.
+
+        :param str query: the query term
+        :param int k: the number of terms to return
+        :returns: (term, distance) pairs, nearest first; ties are ordered as
+            the terms were added
+        :rtype: list
+
+        >>> tree = BKTree(['cat', 'hat', 'bat', 'bats', 'dog'])
+        >>> tree.knn('bars', 2)
+        [('bats', 1), ('bat', 2)]
+        """
+        if not self._terms or k < 1:
+            return []
+
+        # heap holds the (-distance, -node) of the k nearest found, farthest
+        # on top; stack holds each node to search & the least distance from
+        # the query of any term in its subtree
+        heap = []
+        stack = [(0, 0)]
+        radius = float('inf')
+        while stack:
+            bound, node = stack.pop()
+            if bound > radius:
+                continue
+            distance = self.metric(query, self._terms[node])
+            item = (-distance, -node)
+            if len(heap) < k:
+                heappush(heap, item)
+            elif item > heap[0]:
+                heapreplace(heap, item)
+            if len(heap) == k:
+                radius = -heap[0][0]
+
+            # push the children nearest the query's distance last, so they are
+            # searched first & shrink the radius soonest
+            children = [(abs(distance - edge), child) for edge, child in
+                        self._edges(node) if abs(distance - edge) <= radius]
+            children.sort(reverse=True)
+            stack.extend(children)
+
+        return [(self._terms[-node], -distance) for distance, node in
+                sorted(heap, reverse=True)]
+
+    def save(self, path):
+        """Save the tree to a directory.
+
+        The tree is saved as NumPy arrays, which load() can memory map, so
+        that several processes can share one copy of it.
+
+        :param str path: the directory to save the tree in
+        """
+        if self._flat is not None:
+            indptr, distances, nodes = self._flat
+        else:
+            indptr = np_zeros(len(self._children)+1, dtype=np_int64)
+            indptr[1:] = np_cumsum([len(children) for children in
+                                    self._children])
+            edges = [sorted(children.items()) for children in self._children]
+            distances = np_array([edge for children in edges for edge, _ in
+                                  children], dtype=np_int64)
+            nodes = np_array([child for children in edges for _, child in
+                              children], dtype=np_int64)
+
+        data, offsets = _pack_terms(self._terms)
+        _save_arrays(path, 'BKTree', {'data': data, 'offsets': offsets,
+                                      'indptr': indptr,
+                                      'distances': distances, 'nodes': nodes})
+
+    @classmethod
+    def load(cls, path, metric=levenshtein, mmap=True):
+        """Load a tree saved by save().
+
+        :param str path: the directory the tree was saved in
+        :param function metric: the metric the tree was built with
+        :param bool mmap: if True, the tree is memory mapped, rather than read
+            into memory (adding a term reads it into memory)
+        :returns: the tree
+        :rtype: BKTree
+        """
+        arrays = _load_arrays(path, 'BKTree', ('data', 'offsets', 'indptr',
+                                               'distances', 'nodes'), mmap)
+        tree = cls(metric=metric)
+        tree._terms = _PackedTerms(arrays['data'], arrays['offsets'])
+        tree._flat = (arrays['indptr'], arrays['distances'], arrays['nodes'])
+        return tree
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.lsh.
+
+The index.lsh module implements MinHash locality-sensitive hashing
+:cite:`Broder:1997,Leskovec:2014`, an index of terms from which the terms
+likely to have a q-gram Jaccard similarity with a query of at least some
+threshold can be found without comparing the query with every term:
+
+    - MinHashLSH
+"""
+
+from __future__ import division, unicode_literals
+
+from zlib import crc32
+
+from numpy import array as np_array
+from numpy import full as np_full
+from numpy import uint32 as np_uint32
+from numpy import uint64 as np_uint64
+from numpy.random import RandomState
+
+from six import text_type
+from six.moves import range
+
+from ..distance.token import sim_jaccard
+from ..tokenizer.qgram import QGrams
+
+__all__ = ['MinHashLSH']
+
+# the Mersenne prime 2**61-1, modulo which q-gram hashes are permuted; the
+# hashes & the permutations' coefficients are below 2**32, so that a*x+b is
+# exact in 64-bit arithmetic
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _bands(num_perm, threshold):
+    """Return the number of bands & rows per band for a Jaccard threshold.
+
+    A pair of terms with Jaccard similarity s shares all of the r rows of at
+    least one of b bands with probability :math:`1-(1-s^r)^b`, which rises
+    most steeply at about :math:`s = (1/b)^{1/r}`. The bands & rows whose
+    threshold is closest to the desired threshold are chosen, using as many
+    of the num_perm hashes as possible.
+
+    :param int num_perm: the number of hashes in each signature
+    :param float threshold: the Jaccard similarity threshold
+    :returns: the number of bands & the number of rows in each
+    :rtype: tuple
+
+    >>> _bands(128, 0.5)
+    (25, 5)
+    >>> _bands(128, 0.8)
+    (11, 11)
+    """
+    best = None
+    for rows in range(1, num_perm+1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHashLSH(object):
+    """MinHashLSH object.
+
+    Each term added to the index is tokenized into q-grams (each occurrence
+    of a repeated q-gram being distinct, so that the sets compared have the
+    multiset Jaccard similarity of sim_jaccard), and its MinHash signature
+    :cite:`Broder:1997` is computed: for each of num_perm random permutations
+    of the q-gram hashes, the least permuted hash. The probability that two
+    signatures agree at any position is the Jaccard similarity of the terms.
+
+    The signatures are divided into bands of consecutive hashes, and each
+    term is stored in a bucket for each band, keyed by its hashes in that
+    band :cite:`Leskovec:2014`. The candidates for a query are the terms
+    sharing a bucket with it in any band, which are likely to include every
+    term similar to it (above the threshold for which the bands were chosen)
+    and few others.
+    """
+
+    def __init__(self, terms=(), qval=2, num_perm=128, threshold=0.5,
+                 bands=None, seed=0):
+        """Initialize MinHashLSH.
+
+        :param iterable terms: the terms to index initially
+        :param int qval: the length of each q-gram
+        :param int num_perm: the number of hashes in each signature
+        :param float threshold: the Jaccard similarity above which terms are
+            meant to be found as candidates (used to choose bands, and as the
+            default threshold of queries)
+        :param tuple bands: the number of bands & the number of rows in each;
+            by default, chosen for threshold
+        :param int seed: the seed of the random permutations; indices can
+            only be compared if their seeds & num_perm agree
+
+        >>> lsh = MinHashLSH(['Niall', 'Neil', 'Nigel', 'Colin'], qval=1,
+        ...                  threshold=0.4)
+        >>> len(lsh)
+        4
+        >>> lsh.search('Neal')
+        [('Neil', 0.6), ('Niall', 0.5), ('Nigel', 0.5)]
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError('threshold must be between 0 and 1')
+        if bands is None:
+            bands = _bands(num_perm, threshold)
+        if bands[0] * bands[1] > num_perm:
+            raise ValueError('bands times rows must be at most num_perm')
+
+        self.qval = qval
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = bands
+
+        random = RandomState(seed)
+        self._mult = random.randint(1, _MAX_HASH + 1, num_perm,
+                                    dtype=np_uint64)[None, :]
+        self._add = random.randint(0, _MAX_HASH + 1, num_perm,
+                                   dtype=np_uint64)[None, :]
+
+        self._terms = []
+        self._signatures = []
+        self._buckets = [{} for _ in range(self.bands)]
+
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        """Return the number of indexed terms.
+
+        :returns: the number of indexed terms
+        :rtype: int
+        """
+        return len(self._terms)
+
+    def term(self, term_id):
+        """Return an indexed term.
+
+        :param int term_id: the id of the term
+        :returns: the term
+        :rtype: str
+        """
+        return self._terms[term_id]
+
+    def signature(self, term):
+        """Return the MinHash signature of a term.
+
+        :param str term: the term
+        :returns: the least permuted hash of the term's q-grams, for each
+            permutation
+        :rtype: numpy.ndarray
+
+        >>> lsh = MinHashLSH(num_perm=16)
+        >>> sig1, sig2 = lsh.signature('Niall'), lsh.signature('Njall')
+        >>> len(sig1), 0 < (sig1 == sig2).sum() < 16
+        (16, True)
+        """
+        occurrences = {}
+        hashes = []
+        for qgram in QGrams(term, self.qval, '$#').ordered_list:
+            occurrence = occurrences.get(qgram, 0)
+            occurrences[qgram] = occurrence + 1
+            hashes.append(crc32((qgram + '\x00' + text_type(occurrence))
+                                .encode('utf-8')) & _MAX_HASH)
+        if not hashes:
+            return np_full(self.num_perm, _MAX_HASH, dtype=np_uint32)
+
+        hashes = np_array(hashes, dtype=np_uint64)[:, None]
+        permuted = ((hashes * self._mult + self._add) % _PRIME) & _MAX_HASH
+        return permuted.min(axis=0).astype(np_uint32)
+
+    def _keys(self, signature):
+        """Return the bucket key of a signature for each band.
+
+        :param numpy.ndarray signature: a MinHash signature
+        :returns: the key of each band
+        :rtype: list
+        """
+        rows = self.rows
+        return [signature[band*rows:(band+1)*rows].tobytes()
+                for band in range(self.bands)]
+
+    def add(self, term):
+        """Add a term to the index.
+
+        :param str term: the term to add
+        :returns: the id of the term
+        :rtype: int
+
+        >>> lsh = MinHashLSH()
+        >>> lsh.add('Niall'), lsh.add('Neil')
+        (0, 1)
+        """
+        term_id = len(self._terms)
+        signature = self.signature(term)
+        for buckets, key in zip(self._buckets, self._keys(signature)):
+            buckets.setdefault(key, []).append(term_id)
+        self._terms.append(term)
+        self._signatures.append(signature)
+        return term_id
+
+    def query(self, term, threshold=None):
+        """Return the candidate matches of a term.
+
+        :param str term: the query term
+        :param float threshold: if set, only the candidates whose Jaccard
+            similarity with term, as estimated by their signatures, is at least
+            this are returned; if 0, every term sharing a bucket with the query
+            is returned (by default, the threshold of the index)
+        :returns: the ids of the candidates, in ascending order
+        :rtype: list
+
+        >>> lsh = MinHashLSH(['Niall', 'Neil', 'Nigel', 'Colin'], qval=1,
+        ...                  threshold=0.4)
+        >>> [lsh.term(term_id) for term_id in lsh.query('Neal')]
+        ['Niall', 'Neil', 'Nigel']
+        """
+        if threshold is None:
+            threshold = self.threshold
+        signature = self.signature(term)
+
+        candidates = set()
+        for buckets, key in zip(self._buckets, self._keys(signature)):
+            candidates.update(buckets.get(key, ()))
+
+        if threshold > 0:
+            minimum = threshold * self.num_perm
+            candidates = [term_id for term_id in candidates if
+                          (self._signatures[term_id] == signature).sum() >=
+                          minimum]
+        return sorted(candidates)
+
+    def search(self, term, threshold=None, metric=sim_jaccard, **kwargs):
+        """Return the matches of a term, as scored by a similarity measure.
+
+        The candidates found by query() are scored exactly by metric.
+
+        :param str term: the query term
+        :param float threshold: the least score of the matches returned, which
+            is also the estimated Jaccard similarity of the candidates scored
+            (by default, the threshold of the index)
+        :param function metric: a similarity function; by default,
+            sim_jaccard with the q-gram length of the index
+        :param kwargs: any additional arguments to metric
+        :returns: (match, score) pairs, best first; ties are ordered as the
+            matches were added
+        :rtype: list
+
+        >>> lsh = MinHashLSH(['Niall', 'Neil', 'Nigel', 'Colin'],
+        ...                  threshold=0.2)
+        >>> lsh.search('Njall')
+        [('Niall', 0.5), ('Neil', 0.2222222222222222)]
+        """
+        if threshold is None:
+            threshold = self.threshold
+        if metric is sim_jaccard:
+            kwargs.setdefault('qval', self.qval)
+
+        matches = []
+        for term_id in self.query(term, threshold):
+            score = metric(term, self._terms[term_id], **kwargs)
+            if score >= threshold:
+                matches.append((-score, term_id))
+        matches.sort()
+        return [(self._terms[term_id], -score) for score, term_id in matches]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
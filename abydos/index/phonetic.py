@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.phonetic.
+
+The index.phonetic module implements phonetic blocking indices, which map
+the codes of a phonetic algorithm to the records whose words have those
+codes, so that the records sounding like a query can be found without
+comparing the query with every record:
+
+    - PhoneticIndex
+    - union_lookup
+"""
+
+from __future__ import unicode_literals
+
+from array import array
+from bisect import bisect_left
+
+from six import string_types
+
+__all__ = ['PhoneticIndex', 'union_lookup']
+
+
+class PhoneticIndex(object):
+    """PhoneticIndex object.
+
+    Each code is mapped to its postings: the ids of the records with that
+    code, held in ascending order in a compact array of machine integers.
+
+    Encoders with several codes per word are supported: the codes of a word
+    are the members of a set (as from dm_soundex), tuple, or list (as from
+    double_metaphone), or the space-separated parts of a string (as from
+    bmpm), excluding empty codes.
+    """
+
+    def __init__(self, encoder, **kwargs):
+        """Initialize PhoneticIndex.
+
+        :param function encoder: a phonetic algorithm, such as soundex
+        :param kwargs: any additional arguments to encoder
+
+        >>> from abydos.phonetic.metaphone import double_metaphone
+        >>> index = PhoneticIndex(double_metaphone)
+        >>> for record_id, name in enumerate(['Smith', 'Schmidt', 'Smyth',
+        ...                                   'Jones']):
+        ...     _ = index.add(record_id, name)
+        >>> index.lookup('Smythe')
+        [0, 1, 2]
+        >>> index.codes('Smythe')
+        ('SM0', 'XMT')
+        """
+        self.encoder = encoder
+        self.kwargs = kwargs
+        self._postings = {}
+
+    def __len__(self):
+        """Return the number of distinct codes in the index.
+
+        :returns: the number of codes
+        :rtype: int
+        """
+        return len(self._postings)
+
+    def codes(self, word):
+        """Return the codes of a word.
+
+        :param str word: the word to encode
+        :returns: the word's distinct non-empty codes, in the order the
+            encoder returned them (sorted, for sets)
+        :rtype: tuple
+
+        >>> from abydos.phonetic.dm import dm_soundex
+        >>> PhoneticIndex(dm_soundex).codes('Schwarzenegger')
+        ('474659', '479465')
+        """
+        encoded = self.encoder(word, **self.kwargs)
+        if isinstance(encoded, string_types):
+            encoded = encoded.split()
+        elif isinstance(encoded, (set, frozenset)):
+            encoded = sorted(encoded)
+        elif not isinstance(encoded, (tuple, list)):
+            encoded = (encoded,)
+
+        codes = []
+        for code in encoded:
+            if code != '' and code not in codes:
+                codes.append(code)
+        return tuple(codes)
+
+    def postings(self, code):
+        """Return the ids of the records with a code.
+
+        :param str code: the code
+        :returns: the record ids, in ascending order
+        :rtype: list
+        """
+        return list(self._postings.get(code, ()))
+
+    def add(self, record_id, word):
+        """Add a record to the index.
+
+        :param int record_id: the id of the record
+        :param str word: the word to encode & index the record by
+        :returns: the codes the record was indexed by
+        :rtype: tuple
+
+        >>> from abydos.phonetic.soundex import soundex
+        >>> index = PhoneticIndex(soundex)
+        >>> index.add(7, 'Niall')
+        ('N400',)
+        """
+        codes = self.codes(word)
+        for code in codes:
+            postings = self._postings.get(code)
+            if postings is None:
+                self._postings[code] = array('l', (record_id,))
+                continue
+            pos = bisect_left(postings, record_id)
+            if pos == len(postings) or postings[pos] != record_id:
+                postings.insert(pos, record_id)
+        return codes
+
+    def remove(self, record_id, word):
+        """Remove a record from the index.
+
+        :param int record_id: the id of the record
+        :param str word: the word the record was added with
+        :returns: the codes the record was removed from
+        :rtype: tuple
+
+        >>> from abydos.phonetic.soundex import soundex
+        >>> index = PhoneticIndex(soundex)
+        >>> index.add(7, 'Niall')
+        ('N400',)
+        >>> index.remove(7, 'Niall')
+        ('N400',)
+        >>> index.lookup('Niall')
+        []
+        """
+        removed = []
+        for code in self.codes(word):
+            postings = self._postings.get(code)
+            if postings is None:
+                continue
+            pos = bisect_left(postings, record_id)
+            if pos < len(postings) and postings[pos] == record_id:
+                del postings[pos]
+                removed.append(code)
+                if not postings:
+                    del self._postings[code]
+        return tuple(removed)
+
+    def lookup(self, word):
+        """Return the records sharing a code with a word.
+
+        :param str word: the query word
+        :returns: the ids of the records with any of the word's codes, in
+            ascending order
+        :rtype: list
+
+        >>> from abydos.phonetic.bmpm import bmpm
+        >>> index = PhoneticIndex(bmpm)
+        >>> index.add(0, 'Niall')
+        ('nial', 'niol')
+        >>> index.lookup('Nial')
+        [0]
+        """
+        return union_lookup(word, (self,))
+
+
+def union_lookup(word, indices):
+    """Return the records sharing a code with a word in any of several indices.
+
+    :param str word: the query word
+    :param iterable indices: the PhoneticIndex objects, which should index
+        the same records by different encoders
+    :returns: the ids of the records with any of the word's codes in any of
+        the indices, in ascending order
+    :rtype: list
+
+    >>> from abydos.phonetic.nysiis import nysiis
+    >>> from abydos.phonetic.soundex import soundex
+    >>> names = ['Niall', 'Knight', 'Nihal', 'Kneale']
+    >>> indices = PhoneticIndex(soundex), PhoneticIndex(nysiis)
+    >>> for index in indices:
+    ...     for record_id, name in enumerate(names):
+    ...         _ = index.add(record_id, name)
+    >>> indices[0].lookup('Neil'), indices[1].lookup('Neil')
+    ([0, 2], [0, 3])
+    >>> union_lookup('Neil', indices)
+    [0, 2, 3]
+    """
+    postings = [index._postings[code] for index in indices
+                for code in index.codes(word) if code in index._postings]
+    if len(postings) == 1:
+        return list(postings[0])
+    return sorted(set().union(*postings))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
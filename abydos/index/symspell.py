@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.symspell.
+
+The index.symspell module implements the symmetric delete index of SymSpell
+:cite:`Garbe:2012`, an index of terms from which the terms within a small
+edit distance (typically 1 or 2) of a query can be found without comparing
+the query with every term, as for spelling correction:
+
+    - SymSpell
+"""
+
+from __future__ import unicode_literals
+
+from six.moves import range
+
+from ..distance.levenshtein import damerau_levenshtein
+
+__all__ = ['SymSpell']
+
+
+def _deletes(term, max_distance):
+    """Return the strings made by deleting up to max_distance characters.
+
+    :param str term: the term
+    :param int max_distance: the greatest number of characters to delete
+    :returns: the deletes, including term itself
+    :rtype: set
+
+    >>> sorted(_deletes('cat', 1))
+    ['at', 'ca', 'cat', 'ct']
+    """
+    deletes = {term}
+    level = deletes
+    for _ in range(max_distance):
+        level = {variant[:pos] + variant[pos+1:] for variant in level
+                 for pos in range(len(variant))} - deletes
+        if not level:
+            break
+        deletes |= level
+    return deletes
+
+
+class SymSpell(object):
+    """SymSpell object.
+
+    Each term added to the index is stored under every string made by
+    deleting up to max_distance of its characters. If a query is within edit
+    distance d of a term, some string made by deleting at most d characters of
+    the query is also made by deleting at most d characters of the term, so
+    the candidates for a query are the terms stored under its own deletes.
+    Each candidate is then verified with the metric.
+
+    The number of deletes of a term of length n grows as :math:`n^d`, so the
+    index is suited to small max_distance.
+    """
+
+    def __init__(self, terms=(), max_distance=2, corpus=None,
+                 metric=damerau_levenshtein):
+        """Initialize SymSpell.
+
+        :param iterable terms: the terms to index initially; if no terms are
+            given, the words of corpus are indexed
+        :param int max_distance: the greatest edit distance of lookups
+        :param NGramCorpus corpus: if set, matches at equal distances are
+            ranked by their term frequency (tf) in this corpus
+        :param function metric: the edit distance with which candidates are
+            verified, which must accept a max_distance argument (levenshtein
+            or damerau_levenshtein)
+
+        >>> index = SymSpell(['Niall', 'Neal', 'Neil', 'Colin', 'Nigel'])
+        >>> index.lookup('Nial')
+        [('Niall', 1), ('Neal', 1), ('Neil', 2), ('Nigel', 2)]
+        >>> index.lookup('Nial', 1)
+        [('Niall', 1), ('Neal', 1)]
+        """
+        self.max_distance = max_distance
+        self.corpus = corpus
+        self.metric = metric
+
+        self._terms = []
+        self._weights = []
+        self._ids = {}
+        self._deletes = {}
+
+        if not terms and corpus is not None:
+            terms = sorted(word for word in corpus.ngcorpus
+                           if word is not None and corpus.get_count(word))
+        for term in terms:
+            self.add(term)
+
+    def __len__(self):
+        """Return the number of indexed terms.
+
+        :returns: the number of indexed terms
+        :rtype: int
+        """
+        return len(self._terms)
+
+    def __contains__(self, term):
+        """Return whether a term is indexed.
+
+        :param str term: the term
+        :returns: True if the term is indexed
+        :rtype: bool
+        """
+        return term in self._ids
+
+    def term(self, term_id):
+        """Return an indexed term.
+
+        :param int term_id: the id of the term
+        :returns: the term
+        :rtype: str
+        """
+        return self._terms[term_id]
+
+    def add(self, term):
+        """Add a term to the index.
+
+        :param str term: the term to add
+        :returns: the id of the term (its existing id, if already indexed)
+        :rtype: int
+
+        >>> index = SymSpell()
+        >>> index.add('Niall'), index.add('Neil'), index.add('Niall')
+        (0, 1, 0)
+        """
+        if term in self._ids:
+            return self._ids[term]
+
+        term_id = len(self._terms)
+        self._terms.append(term)
+        self._ids[term] = term_id
+        if self.corpus is not None and ' ' not in term:
+            self._weights.append(self.corpus.tf(term))
+        else:
+            self._weights.append(0.0)
+        for delete in _deletes(term, self.max_distance):
+            self._deletes.setdefault(delete, []).append(term_id)
+        return term_id
+
+    def lookup(self, query, max_distance=None, closest=False):
+        """Return the terms within an edit distance of a query.
+
+        :param str query: the query term
+        :param int max_distance: the greatest edit distance of the terms
+            returned, at most the max_distance of the index (by default, the
+            max_distance of the index)
+        :param bool closest: if True, only the nearest terms are returned
+        :returns: (term, distance) pairs, nearest first; ties are ranked by
+            term frequency in the corpus, then as the terms were added
+        :rtype: list
+
+        >>> from abydos.corpus.corpus import Corpus
+        >>> from abydos.corpus.ngram import NGramCorpus
+        >>> corpus = NGramCorpus(Corpus('the cat sat on the mat and the cat '
+        ...                                 'ate the rat'))
+        >>> index = SymSpell(max_distance=1, corpus=corpus)
+        >>> index.lookup('bat')
+        [('cat', 1), ('mat', 1), ('rat', 1), ('sat', 1)]
+        >>> index.lookup('thw', closest=True)
+        [('the', 1)]
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError('max_distance must be at most the max_distance ' +
+                             'of the index, ' + str(self.max_distance))
+
+        candidates = set()
+        for delete in _deletes(query, max_distance):
+            candidates.update(self._deletes.get(delete, ()))
+
+        matches = []
+        for term_id in candidates:
+            term = self._terms[term_id]
+            if abs(len(term) - len(query)) > max_distance:
+                continue
+            distance = self.metric(query, term, max_distance=max_distance)
+            if distance <= max_distance:
+                matches.append((distance, -self._weights[term_id], term_id))
+        matches.sort()
+
+        if closest and matches:
+            matches = [match for match in matches if match[0] == matches[0][0]]
+        return [(self._terms[term_id], distance) for distance, _, term_id in
+                matches]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
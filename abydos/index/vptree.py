@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.index.vptree.
+
+The index.vptree module implements the vantage-point tree
+:cite:`Yianilos:1993`, an index of terms under a real-valued metric (such as
+euclidean distance), from which the terms within a distance of a query, or
+the nearest terms to it, can be found without comparing the query with every
+term:
+
+    - VPTree
+"""
+
+from __future__ import division, unicode_literals
+
+from heapq import heappush, heapreplace
+
+from numpy import array as np_array
+from numpy import float64 as np_float64
+from numpy import int64 as np_int64
+from numpy.random import RandomState
+
+from ._storage import _PackedTerms, _load_arrays, _pack_terms, _save_arrays
+from ..distance.minkowski import euclidean
+
+__all__ = ['VPTree']
+
+
+class VPTree(object):
+    r"""VPTree object.
+
+    Each node of a vantage-point tree is a term (the vantage point), with the
+    median distance mu of the terms in its subtree from it; the subtree's
+    terms nearer than mu are in its inside child, and the rest in its outside
+    child. By the triangle inequality, a term within distance r of a query
+    that is distance d from a vantage point can only be inside if
+    :math:`d - r < mu`, and outside if :math:`d + r \geq mu`, so the other
+    child need not be searched.
+
+    The metric must be a true metric (in particular, it must satisfy the
+    triangle inequality), or matches may be missed. Note that the normalized
+    distances of the distance package (e.g. dist_euclidean) and the
+    Jaro-Winkler distance do not strictly satisfy it, so may be used only
+    where missing some matches is acceptable.
+
+    A VP-tree is built from all of its terms at once; terms cannot be added
+    later.
+    """
+
+    def __init__(self, terms=(), metric=euclidean, seed=0):
+        """Initialize VPTree.
+
+        :param iterable terms: the terms to index
+        :param function metric: a metric of two terms
+        :param int seed: the seed of the random choice of vantage points
+
+        >>> tree = VPTree(['Niall', 'Neal', 'Neil', 'Colin', 'Nigel'])
+        >>> tree.range_query('Njall', 2)
+        [('Niall', 2.0)]
+        >>> tree.knn('Nial', 2)
+        [('Niall', 1.0), ('Neal', 2.0)]
+        """
+        self.metric = metric
+        self._terms = list(terms)
+        self._build(RandomState(seed))
+
+    def __len__(self):
+        """Return the number of indexed terms.
+
+        :returns: the number of indexed terms
+        :rtype: int
+        """
+        return len(self._terms)
+
+    def term(self, term_id):
+        """Return an indexed term.
+
+        :param int term_id: the id (the position in terms) of the term
+        :returns: the term
+        :rtype: str
+        """
+        return self._terms[term_id]
+
+    def _build(self, random):
+        """Build the tree.
+
+        The nodes are held in four arrays: the vantage point (term id) of each
+        node, its mu, and its inside & outside children (-1 if none).
+
+        :param numpy.random.RandomState random: the source of the random
+            choice of vantage points
+        """
+        vantage, mu, inside, outside = [], [], [], []
+        terms = self._terms
+        # each subtree to build: its term ids, & the node & list (inside or
+        # outside) that link to it
+        stack = [(list(range(len(terms))), None, None)]
+        while stack:
+            term_ids, parent, links = stack.pop()
+            if not term_ids:
+                continue
+            node = len(vantage)
+            if parent is not None:
+                links[parent] = node
+
+            pick = random.randint(len(term_ids))
+            term_ids[pick], term_ids[-1] = term_ids[-1], term_ids[pick]
+            point = term_ids.pop()
+            distances = [self.metric(terms[term_id], terms[point])
+                         for term_id in term_ids]
+            median = sorted(distances)[len(distances) // 2] if distances \
+                else 0.0
+
+            vantage.append(point)
+            mu.append(median)
+            inside.append(-1)
+            outside.append(-1)
+            stack.append(([term_id for term_id, distance in
+                           zip(term_ids, distances) if distance >= median],
+                          node, outside))
+            stack.append(([term_id for term_id, distance in
+                           zip(term_ids, distances) if distance < median],
+                          node, inside))
+
+        self._vantage = np_array(vantage, dtype=np_int64)
+        self._mu = np_array(mu, dtype=np_float64)
+        self._inside = np_array(inside, dtype=np_int64)
+        self._outside = np_array(outside, dtype=np_int64)
+
+    def range_query(self, query, radius):
+        """Return the terms within a distance of a query.
+
+        :param str query: the query term
+        :param float radius: the greatest distance of the terms returned
+        :returns: (term, distance) pairs, nearest first; ties are ordered by
+            term id
+        :rtype: list
+
+        >>> tree = VPTree(['cat', 'hat', 'bat', 'bats', 'dog'])
+        >>> tree.range_query('rat', 2)
+        [('cat', 2.0), ('hat', 2.0), ('bat', 2.0)]
+        """
+        if not self._terms:
+            return []
+
+        matches = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            term_id = int(self._vantage[node])
+            distance = self.metric(query, self._terms[term_id])
+            if distance <= radius:
+                matches.append((distance, term_id))
+            mu = self._mu[node]
+            if self._inside[node] >= 0 and distance - radius < mu:
+                stack.append(int(self._inside[node]))
+            if self._outside[node] >= 0 and distance + radius >= mu:
+                stack.append(int(self._outside[node]))
+
+        matches.sort()
+        return [(self._terms[term_id], distance) for distance, term_id in
+                matches]
+
+    def knn(self, query, k=1):
+        """Return the nearest terms to a query.
+
+        :param str query: the query term
+        :param int k: the number of terms to return
+        :returns: (term, distance) pairs, nearest first; ties are ordered by
+            term id
+        :rtype: list
+
+        >>> tree = VPTree(['cat', 'hat', 'bat', 'bats', 'dog'])
+        >>> tree.knn('bars', 2)
+        [('bats', 2.0), ('bat', 2.23606797749979)]
+        """
+        if not self._terms or k < 1:
+            return []
+
+        # heap holds the (-distance, -term_id) of the k nearest found,
+        # farthest on top; stack holds each node to search & the least
+        # distance from the query of any term in its subtree
+        heap = []
+        stack = [(0.0, 0)]
+        radius = float('inf')
+        while stack:
+            bound, node = stack.pop()
+            if bound > radius:
+                continue
+            term_id = int(self._vantage[node])
+            distance = self.metric(query, self._terms[term_id])
+            item = (-distance, -term_id)
+            if len(heap) < k:
+                heappush(heap, item)
+            elif item > heap[0]:
+                heapreplace(heap, item)
+            if len(heap) == k:
+                radius = -heap[0][0]
+
+            mu = self._mu[node]
+            children = []
+            if self._inside[node] >= 0:
+                children.append((max(distance - mu, 0.0),
+                                 int(self._inside[node])))
+            if self._outside[node] >= 0:
+                children.append((max(mu - distance, 0.0),
+                                 int(self._outside[node])))
+            # search the child the query is on first
+            children.sort(reverse=True)
+            stack.extend(child for child in children if child[0] <= radius)
+
+        return [(self._terms[-term_id], -distance) for distance, term_id in
+                sorted(heap, reverse=True)]
+
+    def save(self, path):
+        """Save the tree to a directory.
+
+        The tree is saved as NumPy arrays, which load() can memory map, so
+        that several processes can share one copy of it.
+
+        :param str path: the directory to save the tree in
+        """
+        data, offsets = _pack_terms(self._terms)
+        _save_arrays(path, 'VPTree', {'data': data, 'offsets': offsets,
+                                      'vantage': self._vantage,
+                                      'mu': self._mu,
+                                      'inside': self._inside,
+                                      'outside': self._outside})
+
+    @classmethod
+    def load(cls, path, metric=euclidean, mmap=True):
+        """Load a tree saved by save().
+
+        :param str path: the directory the tree was saved in
+        :param function metric: the metric the tree was built with
+        :param bool mmap: if True, the tree is memory mapped, rather than read
+            into memory
+        :returns: the tree
+        :rtype: VPTree
+        """
+        arrays = _load_arrays(path, 'VPTree', ('data', 'offsets', 'vantage',
+                                               'mu', 'inside', 'outside'),
+                              mmap)
+        tree = cls(metric=metric)
+        tree._terms = _PackedTerms(arrays['data'], arrays['offsets'])
+        tree._vantage = arrays['vantage']
+        tree._mu = arrays['mu']
+        tree._inside = arrays['inside']
+        tree._outside = arrays['outside']
+        return tree
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
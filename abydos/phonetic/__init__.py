@@ -59,16 +59,19 @@ The phonetic module implements phonetic algorithms including:
     - SoundexBR
     - NRL English-to-phoneme
     - Beider-Morse Phonetic Matching
+
+The phonetic.batch module applies these to whole collections of words
+(encode_many), encoding each distinct word only once.
 """
 
 from __future__ import unicode_literals
 
 from itertools import groupby
 
-__all__ = ['alpha_sis', 'bmpm', 'caverphone', 'davidson', 'de', 'dm', 'dolby',
-           'es', 'eudex', 'fr', 'hybrid', 'metaphone', 'mra', 'nrl', 'nysiis',
-           'parmar_kumbharana', 'phonet', 'pt', 'roger_root', 'russell',
-           'sound_d', 'soundex', 'spfc', 'statistics_canada', 'sv']
+__all__ = ['alpha_sis', 'batch', 'bmpm', 'caverphone', 'davidson', 'de', 'dm',
+           'dolby', 'es', 'eudex', 'fr', 'hybrid', 'metaphone', 'mra', 'nrl',
+           'nysiis', 'parmar_kumbharana', 'phonet', 'pt', 'roger_root',
+           'russell', 'sound_d', 'soundex', 'spfc', 'statistics_canada', 'sv']
 
 
 def _delete_consecutive_repeats(word):
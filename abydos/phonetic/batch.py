@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.phonetic.batch.
+
+The phonetic.batch module implements batch encoding, which applies any of
+the phonetic algorithms of the phonetic module to a whole collection of
+words:
+
+    - encode_many
+
+Each distinct word is encoded only once, and the codes are then scattered
+back to the positions of its duplicates.
+"""
+
+from __future__ import unicode_literals
+
+from unicodedata import normalize as unicode_normalize
+
+from numpy import array as np_array
+from numpy import empty as np_empty
+from numpy import intp as np_intp
+
+from six import text_type
+
+from .alpha_sis import alpha_sis
+from .de import haase_phonetik, koelner_phonetik, koelner_phonetik_alpha
+from .dm import dm_soundex
+from .dolby import dolby
+from .es import phonetic_spanish
+from .fr import fonem, henry_early
+from .pt import soundex_br
+from .roger_root import roger_root
+from .russell import russell_index, russell_index_alpha
+from .sound_d import sound_d
+from .soundex import fuzzy_soundex, lein, phonex, phonix, pshp_soundex_first, \
+    pshp_soundex_last, refined_soundex, soundex
+from .statistics_canada import statistics_canada
+
+__all__ = ['encode_many']
+
+# the algorithms whose first use of a word is to take its NFKD normalized
+# upper case, so that words with the same normalized upper case have the
+# same code
+_NFKD_UPPER = frozenset((
+    alpha_sis, dm_soundex, dolby, fonem, fuzzy_soundex, haase_phonetik,
+    henry_early, koelner_phonetik, koelner_phonetik_alpha, lein,
+    phonetic_spanish, phonex, phonix, pshp_soundex_first, pshp_soundex_last,
+    refined_soundex, roger_root, russell_index, russell_index_alpha,
+    sound_d, soundex, soundex_br, statistics_canada))
+
+_OUTPUTS = frozenset(('list', 'object', 'bytes'))
+
+
+def _nfkd_upper(word):
+    r"""Return the NFKD normalized upper case of a word.
+
+    :param str word: the word to normalize
+    :returns: the normalized word
+    :rtype: str
+
+    >>> _nfkd_upper('Müller')
+    'MU\u0308LLER'
+    """
+    return unicode_normalize('NFKD', text_type(word.upper()))
+
+
+def encode_many(words, algorithm, output='list', **kwargs):
+    """Return the codes of many words.
+
+    The words are deduplicated, so that each distinct word is encoded once.
+    For the algorithms that begin by taking the NFKD normalized upper case of
+    a word (such as soundex & dm_soundex), the words are normalized first,
+    so that words differing only in case or composition are also encoded
+    once.
+
+    :param iterable words: the words to encode
+    :param function algorithm: a phonetic algorithm, such as soundex
+    :param str output: the type of the result: 'list' (default), 'object'
+        (a NumPy array of objects), or 'bytes' (a NumPy array of fixed-width
+        bytes, the UTF-8 encodings of the codes, which must be strings)
+    :param kwargs: any additional arguments to algorithm
+    :returns: the code of each word, in order (duplicate words share their
+        code objects)
+    :rtype: list or numpy.ndarray
+
+    >>> from abydos.phonetic.soundex import soundex
+    >>> encode_many(['Smith', 'Smyth', 'SMITH', 'Schmidt'], soundex)
+    ['S530', 'S530', 'S530', 'S530']
+    >>> encode_many(['Niall', 'Neil', 'Niall'], soundex, 'bytes',
+    ...             max_length=6)
+    array([b'N40000', b'N40000', b'N40000'], dtype='|S6')
+    >>> from abydos.phonetic.metaphone import double_metaphone
+    >>> encode_many(['Smith', 'Smyth'], double_metaphone, 'object')
+    array([('SM0', 'XMT'), ('SM0', 'XMT')], dtype=object)
+    """
+    if output not in _OUTPUTS:
+        raise ValueError('output must be one of ' +
+                         ', '.join(sorted(_OUTPUTS)))
+
+    # the position of each distinct key (word, or normalized word), & the
+    # position of each word's key
+    keys = {}
+    inverse = []
+    if algorithm in _NFKD_UPPER:
+        normalized = {}
+        for word in words:
+            key = normalized.get(word)
+            if key is None:
+                key = _nfkd_upper(word)
+                # the few words whose normalization is not idempotent (such
+                # as those with compatibility characters) are encoded as is
+                if _nfkd_upper(key) != key:
+                    key = word
+                normalized[word] = key
+            inverse.append(keys.setdefault(key, len(keys)))
+    else:
+        for word in words:
+            inverse.append(keys.setdefault(word, len(keys)))
+    distinct = sorted(keys, key=keys.get)
+
+    codes = [algorithm(word, **kwargs) for word in distinct]
+
+    if output == 'list':
+        return [codes[pos] for pos in inverse]
+    inverse = np_array(inverse, dtype=np_intp)
+    if output == 'object':
+        unique_codes = np_empty(len(codes), dtype=object)
+        for pos, code in enumerate(codes):
+            unique_codes[pos] = code
+        return unique_codes[inverse]
+
+    if not all(isinstance(code, text_type) for code in codes):
+        raise ValueError('bytes output requires an algorithm that returns ' +
+                         'strings')
+    return np_array([code.encode('utf-8') for code in codes] or [b''])[inverse]
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()
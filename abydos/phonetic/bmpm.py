@@ -28,36 +28,36 @@ algorithm.
 
 from __future__ import unicode_literals
 
-from re import search
+from collections import OrderedDict
+from re import compile as re_compile
 from unicodedata import normalize
 
 from six import PY3, text_type
 from six.moves import range
 
-from ._bmdata import BMDATA, L_ANY, L_ARABIC, L_CYRILLIC, L_CZECH, L_DUTCH, \
-    L_ENGLISH, L_FRENCH, L_GERMAN, L_GREEK, L_GREEKLATIN, L_HEBREW, \
-    L_HUNGARIAN, L_ITALIAN, L_LATVIAN, L_NONE, L_POLISH, L_PORTUGUESE, \
-    L_ROMANIAN, L_RUSSIAN, L_SPANISH, L_TURKISH
+
+__all__ = ['bmpm', 'bmpm_cache_info', 'clear_bmpm_cache', 'set_bmpm_cache']
 
 if PY3:
     long = int
 
-_LANG_DICT = {'any': L_ANY, 'arabic': L_ARABIC, 'cyrillic': L_CYRILLIC,
-              'czech': L_CZECH, 'dutch': L_DUTCH, 'english': L_ENGLISH,
-              'french': L_FRENCH, 'german': L_GERMAN, 'greek': L_GREEK,
-              'greeklatin': L_GREEKLATIN, 'hebrew': L_HEBREW,
-              'hungarian': L_HUNGARIAN, 'italian': L_ITALIAN,
-              'latvian': L_LATVIAN, 'polish': L_POLISH,
-              'portuguese': L_PORTUGUESE, 'romanian': L_ROMANIAN,
-              'russian': L_RUSSIAN, 'spanish': L_SPANISH, 'turkish': L_TURKISH}
-
-BMDATA['gen']['discards'] = {'da ', 'dal ', 'de ', 'del ', 'dela ', 'de la ',
-                             'della ', 'des ', 'di ', 'do ', 'dos ', 'du ',
-                             'van ', 'von ', 'd\''}
-BMDATA['sep']['discards'] = {'al', 'el', 'da', 'dal', 'de', 'del', 'dela',
-                             'de la', 'della', 'des', 'di', 'do', 'dos', 'du',
-                             'van', 'von'}
-BMDATA['ash']['discards'] = {'bar', 'ben', 'da', 'de', 'van', 'von'}
+# the language flags, as in _bmdata, which is only imported on first use
+_L_NONE = 0
+_L_ANY = 2**0
+
+_LANG_DICT = {'any': 2**0, 'arabic': 2**1, 'cyrillic': 2**2, 'czech': 2**3,
+              'dutch': 2**4, 'english': 2**5, 'french': 2**6, 'german': 2**7,
+              'greek': 2**8, 'greeklatin': 2**9, 'hebrew': 2**10,
+              'hungarian': 2**11, 'italian': 2**12, 'latvian': 2**13,
+              'polish': 2**14, 'portuguese': 2**15, 'romanian': 2**16,
+              'russian': 2**17, 'spanish': 2**18, 'turkish': 2**19}
+
+_DISCARDS = {'gen': {'da ', 'dal ', 'de ', 'del ', 'dela ', 'de la ', 'della ',
+                     'des ', 'di ', 'do ', 'dos ', 'du ', 'van ', 'von ',
+                     'd\''},
+             'sep': {'al', 'el', 'da', 'dal', 'de', 'del', 'dela', 'de la',
+                     'della', 'des', 'di', 'do', 'dos', 'du', 'van', 'von'},
+             'ash': {'bar', 'ben', 'da', 'de', 'van', 'von'}}
 
 # format of rules array
 _PATTERN_POS = 0
@@ -65,6 +65,200 @@ _LCONTEXT_POS = 1
 _RCONTEXT_POS = 2
 _PHONETIC_POS = 3
 
+# format of compiled rules array
+_PATTERN_LENGTH_POS = 1
+_LCONTEXT_RE_POS = 2
+_RCONTEXT_RE_POS = 3
+_COMPILED_PHONETIC_POS = 4
+
+# compiled rule tables, by (name_mode, rule set, language) key
+_COMPILED_RULES = {}
+
+# the BMPM data, once loaded by _bm_data()
+_BMDATA = {}
+
+
+class _BMCache(object):
+    """A bounded least-recently-used cache of per-word BMPM encodings."""
+
+    def __init__(self, maxsize=0):
+        """Initialize _BMCache.
+
+        :param int maxsize: the maximum number of encodings to keep; 0
+            disables the cache
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return a cached encoding (or None), counting a hit or miss.
+
+        :param tuple key: the arguments of the encoding
+        :returns: the encoding, if cached
+        :rtype: str
+        """
+        value = self.entries.pop(key, None)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.entries[key] = value  # now the most recently used
+        return value
+
+    def put(self, key, value):
+        """Add an encoding to the cache, evicting the least recently used.
+
+        :param tuple key: the arguments of the encoding
+        :param str value: the encoding
+        """
+        self.entries[key] = value
+        self.resize(self.maxsize)
+
+    def resize(self, maxsize):
+        """Set the maximum size, evicting the least recently used as needed.
+
+        :param int maxsize: the maximum number of encodings to keep
+        """
+        self.maxsize = maxsize
+        while len(self.entries) > maxsize:
+            self.entries.popitem(last=False)
+
+
+_BM_CACHE = _BMCache()
+
+
+def set_bmpm_cache(maxsize=4096):
+    """Enable, resize, or disable the cache of per-word BMPM encodings.
+
+    Caching is off by default. When it is on, the encoding of each word
+    (including each word of a multi-word name & each part of a name with a
+    discarded prefix) is kept, keyed by the word, name mode, match mode,
+    language, & concatenation mode, so that repeated words are encoded only
+    once.
+
+    :param int maxsize: the maximum number of encodings to keep (the least
+        recently used are discarded first); 0 disables & empties the cache
+
+    >>> set_bmpm_cache(100)
+    >>> bmpm('Smith Smith')
+    'zmit zmit'
+    >>> bmpm('Niall Smith')
+    'nial niol zmit'
+    >>> sorted(bmpm_cache_info().items())
+    [('hits', 2), ('maxsize', 100), ('misses', 4), ('size', 4)]
+    >>> set_bmpm_cache(0)
+    """
+    if maxsize < 0:
+        raise ValueError('maxsize must be 0 or greater')
+    _BM_CACHE.resize(maxsize)
+    if not maxsize:
+        clear_bmpm_cache()
+
+
+def clear_bmpm_cache():
+    """Empty the cache of per-word BMPM encodings & reset its statistics.
+
+    >>> clear_bmpm_cache()
+    >>> bmpm_cache_info()['size']
+    0
+    """
+    _BM_CACHE.entries.clear()
+    _BM_CACHE.hits = 0
+    _BM_CACHE.misses = 0
+
+
+def bmpm_cache_info():
+    """Return statistics of the cache of per-word BMPM encodings.
+
+    :returns: the number of cache hits & misses, the maximum size of the cache
+        (0 if it is disabled), and the number of encodings it holds
+    :rtype: dict
+
+    >>> sorted(bmpm_cache_info())
+    ['hits', 'maxsize', 'misses', 'size']
+    """
+    return {'hits': _BM_CACHE.hits, 'misses': _BM_CACHE.misses,
+            'maxsize': _BM_CACHE.maxsize, 'size': len(_BM_CACHE.entries)}
+
+
+def _bm_data():
+    """Return the BMPM data, loading it on first use.
+
+    The rules in _bmdata are large, so they are imported only once BMPM is
+    actually used, rather than whenever this module is imported.
+
+    :returns: the BMPM data, by name mode
+    :rtype: dict
+    """
+    if not _BMDATA:
+        from ._bmdata import BMDATA
+        _BMDATA.update(BMDATA)
+    return _BMDATA
+
+
+def _bm_compile_rules(rules):
+    """Compile a rule table & index it by the first character of each pattern.
+
+    Each rule becomes a tuple of its pattern, the pattern's length, its left &
+    right contexts as compiled regexps (or None, where there is no context),
+    and its phonetic value. Since a rule can only match at a position where
+    the term has the pattern's first character, only the rules indexed by
+    that character need be tried; within each index, rules keep their
+    original order.
+
+    :param tuple rules: a set of phonetic transform rules from BMDATA
+    :returns: the compiled rules, indexed by first pattern character
+    :rtype: dict
+    """
+    index = {}
+    for rule in rules:
+        pattern = rule[_PATTERN_POS]
+        lcontext = rule[_LCONTEXT_POS]
+        rcontext = rule[_RCONTEXT_POS]
+        index.setdefault(pattern[0], []).append(
+            (pattern, len(pattern),
+             re_compile(lcontext+'$') if lcontext else None,
+             re_compile('^'+rcontext) if rcontext else None,
+             rule[_PHONETIC_POS]))
+    return {char: tuple(char_rules) for char, char_rules in index.items()}
+
+
+def _bm_rules(name_mode, rule_set, language):
+    """Return a compiled rule table, compiling it on first use.
+
+    :param str name_mode: the name mode of the algorithm: 'gen' (default),
+        'ash' (Ashkenazi), or 'sep' (Sephardic)
+    :param str rule_set: 'rules' (the initial rules), 'approx', or 'exact'
+        (the final rules)
+    :param language: the language index of the rules, or 'common'
+    :returns: the compiled rules, as returned by _bm_compile_rules()
+    :rtype: dict
+    """
+    key = (name_mode, rule_set, language)
+    if key not in _COMPILED_RULES:
+        _COMPILED_RULES[key] = _bm_compile_rules(
+            _bm_data()[name_mode][rule_set][language])
+    return _COMPILED_RULES[key]
+
+
+def _bm_language_rules(name_mode):
+    """Return the language guessing rules, compiling them on first use.
+
+    :param str name_mode: the name mode of the algorithm: 'gen' (default),
+        'ash' (Ashkenazi), or 'sep' (Sephardic)
+    :returns: (compiled regexp, languages, accept) rules
+    :rtype: tuple
+    """
+    key = (name_mode, 'language_rules', None)
+    if key not in _COMPILED_RULES:
+        _COMPILED_RULES[key] = tuple(
+            (re_compile(letters), languages, accept) for
+            letters, languages, accept in
+            _bm_data()[name_mode]['language_rules'])
+    return _COMPILED_RULES[key]
+
 
 def _bm_language(name, name_mode):
     """Return the best guess language ID for the word and language choices.
@@ -74,23 +268,23 @@ def _bm_language(name, name_mode):
                 'ash' (Ashkenazi), or 'sep' (Sephardic)
     """
     name = name.strip().lower()
-    rules = BMDATA[name_mode]['language_rules']
-    all_langs = sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages'])-1
+    rules = _bm_language_rules(name_mode)
+    all_langs = sum(_LANG_DICT[_] for _ in
+                    _bm_data()[name_mode]['languages'])-1
     choices_remaining = all_langs
     for rule in rules:
         letters, languages, accept = rule
-        if search(letters, name) is not None:
+        if letters.search(name) is not None:
             if accept:
                 choices_remaining &= languages
             else:
                 choices_remaining &= (~languages) % (all_langs+1)
-    if choices_remaining == L_NONE:
-        choices_remaining = L_ANY
+    if choices_remaining == _L_NONE:
+        choices_remaining = _L_ANY
     return choices_remaining
 
 
-def _bm_redo_language(term, name_mode, rules, final_rules1, final_rules2,
-                      concat):
+def _bm_redo_language(term, name_mode, match_mode, rules_language, concat):
     """Reassess the language of the terms and call the phonetic encoder.
 
     Uses a split multi-word term.
@@ -98,49 +292,73 @@ def _bm_redo_language(term, name_mode, rules, final_rules1, final_rules2,
     :param str term: the term to encode via Beider-Morse
     :param str name_mode: the name mode of the algorithm: 'gen' (default),
         'ash' (Ashkenazi), or 'sep' (Sephardic)
-    :param tuple rules: the set of initial phonetic transform regexps
-    :param tuple final_rules1: the common set of final phonetic transform
-        regexps
-    :param tuple final_rules2: the specific set of final phonetic transform
-        regexps
+    :param str match_mode: matching mode: 'approx' or 'exact'
+    :param int rules_language: the language index of the rule tables
     :param bool concat: a flag to indicate concatenation
     """
     language_arg = _bm_language(term, name_mode)
-    return _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
-                        language_arg, concat)
+    return _bm_phonetic_cached(term, name_mode, match_mode, rules_language,
+                               language_arg, concat)
+
 
+def _bm_phonetic_cached(term, name_mode, match_mode, rules_language,
+                        language_arg, concat):
+    """Return the Beider-Morse encoding(s) of a term, cached if enabled.
 
-def _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
-                 language_arg=0, concat=False):
+    :param str term: the term to encode via Beider-Morse
+    :param str name_mode: the name mode of the algorithm: 'gen' (default),
+        'ash' (Ashkenazi), or 'sep' (Sephardic)
+    :param str match_mode: matching mode: 'approx' or 'exact'
+    :param int rules_language: the language index of the rule tables
+    :param int language_arg: an integer representing the target language of the
+        phonetic encoding
+    :param bool concat: a flag to indicate concatenation
+    """
+    if not _BM_CACHE.maxsize:
+        return _bm_phonetic(term, name_mode, match_mode, rules_language,
+                            language_arg, concat)
+
+    key = (term, name_mode, match_mode, rules_language, language_arg, concat)
+    phonetic = _BM_CACHE.get(key)
+    if phonetic is None:
+        phonetic = _bm_phonetic(term, name_mode, match_mode, rules_language,
+                                language_arg, concat)
+        _BM_CACHE.put(key, phonetic)
+    return phonetic
+
+
+def _bm_phonetic(term, name_mode, match_mode, rules_language, language_arg=0,
+                 concat=False):
     """Return the Beider-Morse encoding(s) of a term.
 
     :param str term: the term to encode via Beider-Morse
     :param str name_mode: the name mode of the algorithm: 'gen' (default),
         ash' (Ashkenazi), or 'sep' (Sephardic)
-    :param tuple rules: the set of initial phonetic transform regexps
-    :param tuple final_rules1: the common set of final phonetic transform
-        regexps
-    :param tuple final_rules2: the specific set of final phonetic transform
-        regexps
+    :param str match_mode: matching mode: 'approx' or 'exact'
+    :param int rules_language: the language index of the rule tables (the
+        initial rules & the specific final rules)
     :param int language_arg: an integer representing the target language of the
         phonetic encoding
     :param bool concat: a flag to indicate concatenation
     """
+    rules = _bm_rules(name_mode, 'rules', rules_language)
+    final_rules1 = _bm_rules(name_mode, match_mode, 'common')
+    final_rules2 = _bm_rules(name_mode, match_mode, rules_language)
+
     term = term.replace('-', ' ').strip()
 
     if name_mode == 'gen':  # generic case
         # discard and concatenate certain words if at the start of the name
-        for pfx in BMDATA['gen']['discards']:
+        for pfx in _DISCARDS['gen']:
             if term.startswith(pfx):
                 remainder = term[len(pfx):]
                 combined = pfx[:-1]+remainder
-                result = (_bm_redo_language(remainder, name_mode, rules,
-                                            final_rules1, final_rules2,
+                result = (_bm_redo_language(remainder, name_mode,
+                                            match_mode, rules_language,
                                             concat) +
                           '-' +
-                          _bm_redo_language(combined, name_mode, rules,
-                                            final_rules1, final_rules2,
-                                            concat))
+                          _bm_redo_language(combined, name_mode, match_mode,
+                                            rules_language, concat))
                 return result
 
     words = term.split()  # create array of the individual words in the name
@@ -158,12 +376,12 @@ def _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
 
         for word in words:
             word = word[word.rfind('\'')+1:]
-            if word not in BMDATA['sep']['discards']:
+            if word not in _DISCARDS['sep']:
                 words2.append(word)
 
     elif name_mode == 'ash':  # Ashkenazic case
         # discard certain words if at the start of the name
-        if len(words) > 1 and words[0] in BMDATA['ash']['discards']:
+        if len(words) > 1 and words[0] in _DISCARDS['ash']:
             words2 = words[1:]
         else:
             words2 = list(words)
@@ -179,9 +397,8 @@ def _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
     else:
         # encode each word in a multi-word name separately
         # (normally used for approx matches)
-        result = '-'.join([_bm_redo_language(w, name_mode, rules,
-                                             final_rules1, final_rules2,
-                                             concat)
+        result = '-'.join([_bm_redo_language(w, name_mode, match_mode,
+                                             rules_language, concat)
                            for w in words2])
         return result
 
@@ -195,11 +412,11 @@ def _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
             skip -= 1
             continue
         found = False
-        for rule in rules:
+        for rule in rules.get(term[i], ()):
             pattern = rule[_PATTERN_POS]
-            pattern_length = len(pattern)
-            lcontext = rule[_LCONTEXT_POS]
-            rcontext = rule[_RCONTEXT_POS]
+            pattern_length = rule[_PATTERN_LENGTH_POS]
+            left = rule[_LCONTEXT_RE_POS]
+            right = rule[_RCONTEXT_RE_POS]
 
             # check to see if next sequence in input matches the string in the
             # rule
@@ -207,22 +424,19 @@ def _bm_phonetic(term, name_mode, rules, final_rules1, final_rules2,
                  (term[i:i+pattern_length] != pattern))):  # no match
                 continue
 
-            right = '^'+rcontext
-            left = lcontext+'$'
-
             # check that right context is satisfied
-            if rcontext != '':
-                if not search(right, term[i+pattern_length:]):
+            if right is not None:
+                if not right.search(term[i+pattern_length:]):
                     continue
 
-            # check that left context is satisfied
-            if lcontext != '':
-                if not search(left, term[:i]):
+            # check that left context is satisfied (within term[:i])
+            if left is not None:
+                if not left.search(term, 0, i):
                     continue
 
             # check for incompatible attributes
-            candidate = _bm_apply_rule_if_compat(phonetic, rule[_PHONETIC_POS],
-                                                 language_arg)
+            candidate = _bm_apply_rule_if_compat(
+                phonetic, rule[_COMPILED_PHONETIC_POS], language_arg)
             # The below condition shouldn't ever be false
             if candidate is not None:  # pragma: no branch
                 phonetic = candidate
@@ -249,7 +463,8 @@ def _bm_apply_final_rules(phonetic, final_rules, language_arg, strip):
     """Apply a set of final rules to the phonetic encoding.
 
     :param str phonetic: the term to which to apply the final rules
-    :param tuple final_rules: the set of final phonetic transform regexps
+    :param dict final_rules: the set of final phonetic transform rules, as
+        compiled by _bm_compile_rules()
     :param int language_arg: an integer representing the target language of the
         phonetic encoding
     :param bool strip: flag to indicate whether to normalize the language
@@ -283,14 +498,11 @@ def _bm_apply_final_rules(phonetic, final_rules, language_arg, strip):
                     i += 1
                 continue
 
-            for rule in final_rules:
+            for rule in final_rules.get(phoneticx[i:i+1], ()):
                 pattern = rule[_PATTERN_POS]
-                pattern_length = len(pattern)
-                lcontext = rule[_LCONTEXT_POS]
-                rcontext = rule[_RCONTEXT_POS]
-
-                right = '^'+rcontext
-                left = lcontext+'$'
+                pattern_length = rule[_PATTERN_LENGTH_POS]
+                left = rule[_LCONTEXT_RE_POS]
+                right = rule[_RCONTEXT_RE_POS]
 
                 # check to see if next sequence in phonetic matches the string
                 # in the rule
@@ -299,19 +511,18 @@ def _bm_apply_final_rules(phonetic, final_rules, language_arg, strip):
                     continue
 
                 # check that right context is satisfied
-                if rcontext != '':
-                    if not search(right, phoneticx[i + pattern_length:]):
+                if right is not None:
+                    if not right.search(phoneticx[i + pattern_length:]):
                         continue
 
-                # check that left context is satisfied
-                if lcontext != '':
-                    if not search(left, phoneticx[:i]):
+                # check that left context is satisfied (within phoneticx[:i])
+                if left is not None:
+                    if not left.search(phoneticx, 0, i):
                         continue
 
                 # check for incompatible attributes
-                candidate = _bm_apply_rule_if_compat(phonetic2,
-                                                     rule[_PHONETIC_POS],
-                                                     language_arg)
+                candidate = _bm_apply_rule_if_compat(
+                    phonetic2, rule[_COMPILED_PHONETIC_POS], language_arg)
                 # The below condition shouldn't ever be false
                 if candidate is not None:  # pragma: no branch
                     phonetic2 = candidate
@@ -535,10 +746,11 @@ def _bm_language_index_from_code(code, name_mode):
     """
     if (code < 1 or
             code > sum(_LANG_DICT[_] for _ in
-                       BMDATA[name_mode]['languages'])):  # code out of range
-        return L_ANY
+                       _bm_data()[name_mode]['languages'])):
+        # code out of range
+        return _L_ANY
     if (code & (code - 1)) != 0:  # choice was more than one language; use any
-        return L_ANY
+        return _L_ANY
     return code
 
 
@@ -623,7 +835,8 @@ def bmpm(word, language_arg=0, name_mode='gen', match_mode='approx',
 
     # Translate the supplied language_arg value into an integer representing
     # a set of languages
-    all_langs = sum(_LANG_DICT[_] for _ in BMDATA[name_mode]['languages'])-1
+    all_langs = sum(_LANG_DICT[_] for _ in
+                    _bm_data()[name_mode]['languages'])-1
     lang_choices = 0
     if isinstance(language_arg, (int, float, long)):
         lang_choices = int(language_arg)
@@ -643,12 +856,8 @@ def bmpm(word, language_arg=0, name_mode='gen', match_mode='approx',
         language_arg = lang_choices
     language_arg2 = _bm_language_index_from_code(language_arg, name_mode)
 
-    rules = BMDATA[name_mode]['rules'][language_arg2]
-    final_rules1 = BMDATA[name_mode][match_mode]['common']
-    final_rules2 = BMDATA[name_mode][match_mode][language_arg2]
-
-    result = _bm_phonetic(word, name_mode, rules, final_rules1,
-                          final_rules2, language_arg, concat)
+    result = _bm_phonetic_cached(word, name_mode, match_mode, language_arg2,
+                                 language_arg, concat)
     result = _bm_phonetic_numbers(result)
 
     return result
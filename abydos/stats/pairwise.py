@@ -24,16 +24,345 @@ The clustering module implements clustering algorithms such as:
 
 from __future__ import division, unicode_literals
 
+from importlib import import_module
+from math import ceil, sqrt
+from multiprocessing import Pool, cpu_count
+
 from six.moves import range
 
-from .mean import amean, hmean, std
+from .mean import amean, gmean, hmean, qmean, std
 from ..distance import sim
 
 __all__ = ['mean_pairwise_similarity', 'pairwise_similarity_statistics']
 
+# the collections compared by each worker process, set by _init_worker
+_WORKER_COLLECTIONS = None
+
+
+class _PairwiseSummary(object):
+    """A mergeable summary of a stream of pairwise similarities.
+
+    Count, min, max, and the Welford :cite:`Welford:1962` running mean & sum
+    of squared deviations are kept in constant space, along with the sums
+    needed by the streamable mean functions (amean, gmean, hmean, & qmean).
+    Summaries of disjoint streams are combined by merge(), following
+    :cite:`Chan:1979`. For any other mean function, the values themselves
+    must be kept.
+
+    Optionally, a fixed-bin histogram of the values over [0, 1] is also kept,
+    from which quantiles can be estimated.
+    """
+
+    def __init__(self, keep_values=False, bins=None):
+        """Initialize _PairwiseSummary.
+
+        :param bool keep_values: if True, every value added is also retained
+        :param int bins: if set, the number of equal-width bins over [0, 1] of
+            a histogram of the values; values outside [0, 1] are counted in
+            the first or last bin
+        """
+        self.count = 0
+        self.min = float('inf')
+        self.max = float('-inf')
+        self.total = 0
+        self.product = 1
+        self.sq_total = 0
+        self.recip_total = 0
+        self.zeros = 0
+        self.welford_mean = 0.0
+        self.welford_m2 = 0.0
+        self.values = [] if keep_values else None
+        self.histogram = [0] * bins if bins else None
+
+    def add(self, value):
+        """Add a value to the summary.
+
+        :param float value: a similarity value
+        """
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.total += value
+        self.product *= value
+        self.sq_total += value**2
+        if value == 0:
+            self.zeros += 1
+        else:
+            self.recip_total += 1/value
+        delta = value - self.welford_mean
+        self.welford_mean += delta/self.count
+        self.welford_m2 += delta*(value - self.welford_mean)
+        if self.values is not None:
+            self.values.append(value)
+        if self.histogram is not None:
+            bins = len(self.histogram)
+            self.histogram[min(max(int(value*bins), 0), bins-1)] += 1
+
+    def merge(self, other):
+        """Merge the summary of a disjoint stream into this summary.
+
+        :param _PairwiseSummary other: another summary
+        """
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.welford_mean - self.welford_mean
+        self.welford_mean += delta*other.count/count
+        self.welford_m2 += (other.welford_m2 +
+                            delta**2*self.count*other.count/count)
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+        self.product *= other.product
+        self.sq_total += other.sq_total
+        self.recip_total += other.recip_total
+        self.zeros += other.zeros
+        if self.values is not None:
+            self.values.extend(other.values)
+        if self.histogram is not None:
+            self.histogram = [freq + other_freq for freq, other_freq in
+                              zip(self.histogram, other.histogram)]
+
+    def mean(self, mean_func):
+        """Return the mean of the values, according to mean_func.
+
+        :param function mean_func: a mean function
+        :returns: the mean
+        :rtype: float
+        """
+        if mean_func is amean:
+            return self.total/self.count
+        if mean_func is gmean:
+            return self.product**(1/self.count)
+        if mean_func is qmean:
+            return (self.sq_total/self.count)**0.5
+        if mean_func is hmean:
+            if self.min == self.max:
+                return self.min
+            if self.zeros:
+                return float('nan') if self.zeros > 1 else 0
+            return self.count/self.recip_total
+        return mean_func(self.values)
+
+    def std(self, mean_func):
+        """Return the (population) standard deviation about the mean.
+
+        :param function mean_func: a mean function
+        :returns: the standard deviation
+        :rtype: float
+        """
+        # the squared deviations about any center c sum to
+        # M2 + n * (arithmetic mean - c)**2
+        center = self.mean(mean_func)
+        return ((self.welford_m2 +
+                 self.count*(self.welford_mean-center)**2)/self.count)**0.5
+
+    def quantile(self, prob):
+        """Return an estimate of a quantile of the values, from the histogram.
+
+        Values are assumed to be spread evenly within each bin, so the error
+        is at most the width of one bin.
+
+        :param float prob: the probability of the quantile, in [0, 1]
+        :returns: the estimated quantile
+        :rtype: float
+        """
+        width = 1/len(self.histogram)
+        target = prob*self.count
+        cumulative = 0
+        for idx, freq in enumerate(self.histogram):
+            if freq and cumulative + freq >= target:
+                estimate = (idx + (target-cumulative)/freq) * width
+                return min(max(estimate, self.min), self.max)
+            cumulative += freq
+        return self.max
+
+
+def _streamable(mean_func):
+    """Return True if mean_func can be computed by a _PairwiseSummary.
+
+    :param function mean_func: a mean function
+    :returns: True if mean_func is streamable
+    :rtype: bool
+
+    >>> _streamable(amean)
+    True
+    >>> _streamable(max)
+    False
+    """
+    return mean_func in {amean, gmean, hmean, qmean}
+
+
+def _metric_name(metric):
+    """Return the module & name by which a worker can find a metric.
+
+    :param function metric: a similarity metric function
+    :returns: the metric's module name & function name
+    :rtype: tuple
+
+    >>> _metric_name(sim)
+    ('abydos.distance', 'sim')
+    """
+    module = getattr(metric, '__module__', None)
+    name = getattr(metric, '__name__', None)
+    if (module is None or name is None or
+            getattr(import_module(module), name, None) is not metric):
+        raise ValueError('metric must be a module-level function when ' +
+                         'n_jobs is not 1')
+    return module, name
+
+
+def _n_workers(n_jobs):
+    """Return the number of worker processes to use.
+
+    :param int n_jobs: the number of jobs requested; negative values count
+        back from the number of CPUs (-1 for all CPUs)
+    :returns: the number of worker processes
+    :rtype: int
+
+    >>> _n_workers(4)
+    4
+    """
+    if n_jobs < 0:
+        n_jobs = cpu_count() + 1 + n_jobs
+    return max(1, n_jobs)
+
+
+def _tiles(src_len, tar_len, n_jobs, triangle=False):
+    """Return the tiles into which a pair space is divided.
+
+    :param int src_len: the number of source terms
+    :param int tar_len: the number of target terms
+    :param int n_jobs: the number of worker processes
+    :param bool triangle: if True, only tiles containing pairs (i, j) with
+        i < j are returned
+    :returns: (src_start, src_stop, tar_start, tar_stop) tuples
+    :rtype: list
+
+    >>> _tiles(4, 4, 1, triangle=True)
+    [(0, 2, 0, 2), (0, 2, 2, 4), (2, 4, 2, 4)]
+    """
+    # about four tiles per worker, so that uneven tiles balance out
+    splits = int(ceil(sqrt(4*n_jobs)))
+    src_step = int(ceil(src_len/splits)) or 1
+    tar_step = int(ceil(tar_len/splits)) or 1
+    tiles = []
+    for src_start in range(0, src_len, src_step):
+        for tar_start in range(0, tar_len, tar_step):
+            if triangle and tar_start+tar_step <= src_start:
+                continue
+            tiles.append((src_start, min(src_start+src_step, src_len),
+                          tar_start, min(tar_start+tar_step, tar_len)))
+    return tiles
+
+
+def _init_worker(src_collection, tar_collection):
+    """Store the collections to compare in a worker process.
+
+    :param list src_collection: the source terms
+    :param list tar_collection: the target terms
+    """
+    global _WORKER_COLLECTIONS
+    _WORKER_COLLECTIONS = (src_collection, tar_collection)
+
+
+def _summarize(src_collection, tar_collection, metric, tile, triangle,
+               symmetric, keep_values, bins):
+    """Return the summary of the similarities within a tile.
+
+    :param list src_collection: the source terms
+    :param list tar_collection: the target terms
+    :param function metric: a similarity metric function
+    :param tuple tile: the (src_start, src_stop, tar_start, tar_stop) of the
+        tile
+    :param bool triangle: if True, only pairs (i, j) with i < j are compared
+    :param bool symmetric: set to True if all pairwise similarities should be
+        calculated in both directions
+    :param bool keep_values: if True, the values themselves are kept
+    :param int bins: the number of histogram bins, if any
+    :returns: the summary of the tile
+    :rtype: _PairwiseSummary
+    """
+    src_start, src_stop, tar_start, tar_stop = tile
+
+    summary = _PairwiseSummary(keep_values, bins)
+    for i in range(src_start, src_stop):
+        src = src_collection[i]
+        for j in range(max(tar_start, i+1) if triangle else tar_start,
+                       tar_stop):
+            tar = tar_collection[j]
+            summary.add(metric(src, tar))
+            if symmetric:
+                summary.add(metric(tar, src))
+    return summary
+
+
+def _summarize_tile(task):
+    """Return the summary of the similarities within a tile, in a worker.
+
+    :param tuple task: the metric's module & name, followed by the remaining
+        arguments to _summarize()
+    :returns: the summary of the tile
+    :rtype: _PairwiseSummary
+    """
+    (module, name) = task[0]
+    metric = getattr(import_module(module), name)
+    return _summarize(_WORKER_COLLECTIONS[0], _WORKER_COLLECTIONS[1], metric,
+                      *task[1:])
+
+
+def _pairwise_summary(src_collection, tar_collection, metric, mean_func,
+                      symmetric, n_jobs, bins=None, triangle=False):
+    """Return the summary of all pairwise similarities.
+
+    The similarities are summarized as they are computed, so they are never
+    collected (unless mean_func is not streamable). With more than one job,
+    the pair space is divided into tiles, each summarized by a worker process,
+    and the summaries are merged here.
+
+    :param list src_collection: the source terms
+    :param list tar_collection: the target terms
+    :param function metric: a similarity metric function
+    :param function mean_func: a mean function
+    :param bool symmetric: set to True if all pairwise similarities should be
+        calculated in both directions
+    :param int n_jobs: the number of worker processes
+    :param int bins: the number of histogram bins, if any
+    :param bool triangle: if True, only pairs (i, j) with i < j are compared
+    :returns: the summary of the pairwise similarities
+    :rtype: _PairwiseSummary
+    """
+    keep_values = not _streamable(mean_func)
+    if n_jobs == 1:
+        summary = _summarize(src_collection, tar_collection, metric,
+                             (0, len(src_collection), 0, len(tar_collection)),
+                             triangle, symmetric, keep_values, bins)
+    else:
+        name = _metric_name(metric)
+        tasks = [(name, tile, triangle, symmetric, keep_values, bins) for
+                 tile in _tiles(len(src_collection), len(tar_collection),
+                                n_jobs, triangle)]
+
+        summary = _PairwiseSummary(keep_values, bins)
+        pool = Pool(n_jobs, _init_worker, (src_collection, tar_collection))
+        try:
+            # tiles are merged in a fixed order, so results are repeatable
+            for tile_summary in pool.imap(_summarize_tile, tasks):
+                summary.merge(tile_summary)
+        finally:
+            pool.close()
+            pool.join()
+
+    if not summary.count:
+        raise ValueError('there are no pairs to compare')
+    return summary
+
 
 def mean_pairwise_similarity(collection, metric=sim,
-                             mean_func=hmean, symmetric=False):
+                             mean_func=hmean, symmetric=False, n_jobs=1):
     """Calculate the mean pairwise similarity of a collection of strings.
 
     Takes the mean of the pairwise similarity between each member of a
@@ -46,6 +375,9 @@ def mean_pairwise_similarity(collection, metric=sim,
         returns a float
     :param bool symmetric: set to True if all pairwise similarities should be
         calculated in both directions
+    :param int n_jobs: the number of worker processes among which to divide
+        the comparisons; -1 uses one per CPU. If this is not 1, metric must be
+        a module-level function, since workers find it by name.
     :returns: the mean pairwise similarity of a collection of strings
     :rtype: float
 
@@ -69,6 +401,12 @@ def mean_pairwise_similarity(collection, metric=sim,
 
     collection = list(collection)
 
+    n_jobs = _n_workers(n_jobs)
+    if n_jobs > 1:
+        return _pairwise_summary(collection, collection, metric, mean_func,
+                                 symmetric, n_jobs, triangle=True).mean(
+                                     mean_func)
+
     pairwise_values = []
 
     for i in range(len(collection)):
@@ -81,7 +419,9 @@ def mean_pairwise_similarity(collection, metric=sim,
 
 
 def pairwise_similarity_statistics(src_collection, tar_collection, metric=sim,
-                                   mean_func=amean, symmetric=False):
+                                   mean_func=amean, symmetric=False,
+                                   n_jobs=1, stream=False, bins=None,
+                                   quantiles=None):
     """Calculate the pairwise similarity statistics a collection of strings.
 
     Calculate pairwise similarities among members of two collections,
@@ -89,6 +429,13 @@ def pairwise_similarity_statistics(src_collection, tar_collection, metric=sim,
     arithmetic mean, by default), and (population) standard deviation
     of those similarities.
 
+    In streaming mode, these are accumulated as each similarity is computed,
+    in constant memory, rather than over a list of every similarity. This is
+    possible for the amean, gmean, hmean, & qmean mean functions; any other
+    mean_func still requires the list. Optionally, a fixed-bin histogram of
+    the similarities and approximate quantiles (estimated from the histogram)
+    can also be returned.
+
     :param list src_collection: a collection of terms or a string that can be
         split
     :param list tar_collection: a collection of terms or a string that can be
@@ -98,12 +445,31 @@ def pairwise_similarity_statistics(src_collection, tar_collection, metric=sim,
         returns a float
     :param bool symmetric: set to True if all pairwise similarities should be
         calculated in both directions
-    :returns: the max, min, mean, and standard deviation of similarities
+    :param int n_jobs: the number of worker processes among which to divide
+        the comparisons; -1 uses one per CPU. If this is not 1, metric must be
+        a module-level function, since workers find it by name.
+    :param bool stream: set to True to accumulate the statistics in constant
+        memory, as the similarities are computed (implied by n_jobs, bins, &
+        quantiles)
+    :param int bins: if set, the number of equal-width bins over [0, 1] of a
+        histogram of the similarities
+    :param list quantiles: if set, the probabilities (in [0, 1]) of the
+        quantiles to estimate; these are estimated from a histogram of bins
+        (100 by default) bins, to within the width of one bin
+    :returns: the max, min, mean, and standard deviation of similarities,
+        followed by the histogram (a list of bin counts), if bins is set, and
+        the estimated quantiles, if quantiles is set
     :rtype: tuple
 
     >>> tuple(round(_, 12) for _ in pairwise_similarity_statistics(
     ... ['Christopher', 'Kristof', 'Christobal'], ['Niall', 'Neal', 'Neil']))
     (0.2, 0.0, 0.118614718615, 0.075070477184)
+    >>> pairwise_similarity_statistics(['Christopher', 'Kristof',
+    ... 'Christobal'], ['Niall', 'Neal', 'Neil'], bins=4)[4]
+    [9, 0, 0, 0]
+    >>> [round(_, 12) for _ in pairwise_similarity_statistics(['Niall',
+    ... 'Neal', 'Neil'], ['Njall', 'Nigel'], quantiles=(0, 0.5, 1))[4]]
+    [0.4, 0.41, 0.8]
     """
     if not callable(mean_func):
         raise ValueError('mean_func must be a function')
@@ -123,6 +489,24 @@ def pairwise_similarity_statistics(src_collection, tar_collection, metric=sim,
     src_collection = list(src_collection)
     tar_collection = list(tar_collection)
 
+    if bins is not None and bins < 1:
+        raise ValueError('bins must be a positive integer')
+    histogram = bins is not None
+    if quantiles is not None and not histogram:
+        bins = 100
+
+    n_jobs = _n_workers(n_jobs)
+    if n_jobs > 1 or stream or bins:
+        summary = _pairwise_summary(src_collection, tar_collection, metric,
+                                    mean_func, symmetric, n_jobs, bins)
+        stats = (summary.max, summary.min, summary.mean(mean_func),
+                 summary.std(mean_func))
+        if histogram:
+            stats += (summary.histogram,)
+        if quantiles is not None:
+            stats += ([summary.quantile(prob) for prob in quantiles],)
+        return stats
+
     pairwise_values = []
 
     for src in src_collection:
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.test_distance.batch.
+
+This module contains unit tests for abydos.distance.batch
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from abydos.distance.batch import cdist, qgram_cdist, top_k
+from abydos.distance.editex import dist_editex, editex, sim_editex
+from abydos.distance.levenshtein import dist_levenshtein, levenshtein, \
+    sim_levenshtein
+from abydos.distance.minkowski import dist_manhattan
+from abydos.distance.sequence import dist_lcsseq, sim_lcsseq
+from abydos.distance.token import dist_cosine, dist_dice, dist_jaccard, \
+    dist_overlap, dist_tversky, sim_cosine, sim_dice, sim_jaccard, \
+    sim_overlap, sim_tanimoto, sim_tversky
+
+from numpy import nonzero as np_nonzero
+from numpy import zeros as np_zeros
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+NAMES = ('Niall', 'Neal', 'Neil', 'Njall', 'Nigel', 'Nele', 'Nyle', 'Nile',
+         'Neel', 'Nial', 'Nil', 'Nell', 'Noll', 'Nuala', 'Colin', 'Coiln',
+         'Christopher', 'Kristof', 'aluminum', 'Catalan', 'ATCG', 'TAGC',
+         'a', '', 'Niall Little', 'Neil Little')
+
+METRICS = ((sim_levenshtein, {}),
+           (levenshtein, {}),
+           (levenshtein, {'mode': 'osa'}),
+           (levenshtein, {'cost': (1, 2, 3, 1)}),
+           (levenshtein, {'max_distance': 2}),
+           (dist_levenshtein, {'max_distance': 0.5}),
+           (sim_jaccard, {}),
+           (sim_cosine, {'qval': 0}),
+           (dist_manhattan, {'qval': 1}),
+           (sim_editex, {}),
+           (editex, {'local': True}),
+           (dist_editex, {'cost': (1, 3, 5)}),
+           (sim_lcsseq, {}),
+           (dist_lcsseq, {}))
+
+
+class CdistTestCases(unittest.TestCase):
+    """Test cdist function.
+
+    abydos.distance.batch.cdist
+    """
+
+    def test_cdist(self):
+        """Test abydos.distance.batch.cdist."""
+        self.assertEqual(cdist([], NAMES).shape, (0, len(NAMES)))
+        self.assertEqual(cdist(NAMES, []).shape, (len(NAMES), 0))
+        self.assertEqual(cdist('Niall Neil', 'Nigel').tolist(),
+                         [[sim_levenshtein('Niall', 'Nigel')],
+                          [sim_levenshtein('Neil', 'Nigel')]])
+        self.assertRaises(ValueError, cdist, NAMES, NAMES, 'levenshtein')
+
+        # every cell must equal the pairwise metric
+        for metric, kwargs in METRICS:
+            scores = cdist(NAMES, NAMES, metric, **kwargs)
+            for i, query in enumerate(NAMES):
+                for j, cand in enumerate(NAMES):
+                    self.assertAlmostEqual(scores[i, j],
+                                           metric(query, cand, **kwargs))
+
+
+class QGramCdistTestCases(unittest.TestCase):
+    """Test qgram_cdist function.
+
+    abydos.distance.batch.qgram_cdist
+    """
+
+    def test_qgram_cdist(self):
+        """Test abydos.distance.batch.qgram_cdist."""
+        self.assertEqual(qgram_cdist([], NAMES).shape, (0, len(NAMES)))
+        self.assertEqual(qgram_cdist(NAMES, []).shape, (len(NAMES), 0))
+        self.assertEqual(qgram_cdist('Niall Neil').tolist(),
+                         cdist('Niall Neil', 'Niall Neil',
+                               sim_jaccard).tolist())
+        self.assertRaises(ValueError, qgram_cdist, NAMES, NAMES,
+                          sim_levenshtein)
+        self.assertRaises(ValueError, qgram_cdist, NAMES, NAMES, sim_tversky,
+                          alpha=-1)
+        rows, cols, scores = qgram_cdist(NAMES, ['Xavier'], threshold=0.5)
+        self.assertEqual((len(rows), len(cols), len(scores)), (0, 0, 0))
+
+        # terms are repeated, & some have q-grams occurring repeatedly
+        names = NAMES + ('Niall', 'AATTATAT', 'ATATATAT', 'llama', 'Nialll')
+        metrics = ((sim_tversky, {'alpha': 0.3, 'beta': 2}),
+                   (dist_tversky, {'alpha': 0.5, 'beta': 1.5, 'bias': 0.2}),
+                   (sim_dice, {}), (dist_dice, {'qval': 3}),
+                   (sim_jaccard, {'qval': 1}), (dist_jaccard, {}),
+                   (sim_tanimoto, {'qval': 0}), (sim_cosine, {}),
+                   (dist_cosine, {'qval': 1}), (sim_overlap, {}),
+                   (dist_overlap, {'qval': 0}))
+        for metric, kwargs in metrics:
+            distance = metric.__name__.startswith('dist')
+            expected = np_zeros((len(names), len(names)))
+            for i, src in enumerate(names):
+                for j, tar in enumerate(names[::-1]):
+                    try:
+                        expected[i, j] = metric(src, tar, **kwargs)
+                    except ZeroDivisionError:
+                        # cosine & overlap of a term with no q-grams
+                        expected[i, j] = float(distance)
+            for block_size in (None, 1, 7):
+                matrix = qgram_cdist(names, names[::-1], metric,
+                                     block_size=block_size, **kwargs)
+                self.assertEqual(matrix.shape, expected.shape)
+                for i in range(len(names)):
+                    for j in range(len(names)):
+                        self.assertAlmostEqual(matrix[i, j], expected[i, j])
+
+            for threshold in (0.0, 0.4, 1.0):
+                rows, cols, scores = qgram_cdist(names, names[::-1], metric,
+                                                 threshold, 5, **kwargs)
+                passing = (expected <= threshold if distance else
+                           expected >= threshold)
+                self.assertEqual(list(zip(rows.tolist(), cols.tolist())),
+                                 [tuple(cell) for cell in
+                                  zip(*passing.nonzero())])
+                for row, col, score in zip(rows, cols, scores):
+                    self.assertAlmostEqual(score, expected[row, col])
+
+    @unittest.skipIf(tracemalloc is None, 'tracemalloc is unavailable')
+    def test_qgram_cdist_threshold_memory(self):
+        """Test abydos.distance.batch.qgram_cdist's memory with a threshold."""
+        # every term shares q-grams with every other, so the postings of the
+        # frequent q-grams exceed a block's cells
+        terms = ['N{:04d}'.format(i) for i in range(2000)]
+        dense_bytes = len(terms) * len(terms) * 8
+
+        tracemalloc.start()
+        try:
+            rows, cols, scores = qgram_cdist(terms, metric=dist_jaccard,
+                                             threshold=0.4, block_size=10)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        # the matrix of scores would not fit in the memory allowed
+        self.assertLess(peak, dense_bytes // 8)
+
+        matrix = qgram_cdist(terms, metric=dist_jaccard)
+        expected_rows, expected_cols = np_nonzero(matrix <= 0.4)
+        self.assertEqual(rows.tolist(), expected_rows.tolist())
+        self.assertEqual(cols.tolist(), expected_cols.tolist())
+        self.assertEqual(scores.tolist(),
+                         matrix[expected_rows, expected_cols].tolist())
+
+
+class TopKTestCases(unittest.TestCase):
+    """Test top_k function.
+
+    abydos.distance.batch.top_k
+    """
+
+    def _brute_force(self, query, metric, k, threshold, largest, kwargs):
+        """Return top_k's expected result by scoring & sorting every name."""
+        scored = [(idx, cand, metric(query, cand, **kwargs))
+                  for idx, cand in enumerate(NAMES)]
+        if threshold is not None:
+            scored = [item for item in scored if
+                      (item[2] >= threshold if largest else
+                       item[2] <= threshold)]
+        scored.sort(key=lambda item: (-item[2] if largest else item[2],
+                                      item[0]))
+        if k is not None:
+            scored = scored[:k]
+        return [(cand, score) for _, cand, score in scored]
+
+    def test_top_k(self):
+        """Test abydos.distance.batch.top_k."""
+        self.assertEqual(top_k('Niall', NAMES, k=0), [])
+        self.assertEqual(top_k('Niall', [], k=3), [])
+        self.assertEqual(top_k('Niall', iter(NAMES), k=1), [('Niall', 1.0)])
+        self.assertEqual(top_k('Niall', NAMES, levenshtein, k=3,
+                               largest=False),
+                         [('Niall', 0), ('Njall', 1), ('Nial', 1)])
+        self.assertRaises(ValueError, top_k, 'Niall', NAMES, 'levenshtein')
+
+        # whether greater scores are better is inferred for known measures
+        self.assertEqual(top_k('Niall', NAMES, levenshtein, k=3),
+                         [('Niall', 0), ('Njall', 1), ('Nial', 1)])
+        self.assertEqual(top_k('Niall', NAMES, dist_jaccard, k=1),
+                         [('Niall', 0.0)])
+        self.assertEqual(top_k('Niall', NAMES, sim_tanimoto, k=1),
+                         [('Niall', 1.0)])
+        self.assertRaises(ValueError, top_k, 'Niall', NAMES,
+                          lambda src, tar: len(src) - len(tar))
+        self.assertEqual(top_k('Niall', NAMES,
+                               lambda src, tar: abs(len(src) - len(tar)),
+                               k=2, largest=False),
+                         [('Niall', 0), ('Njall', 0)])
+
+        for metric, kwargs in METRICS:
+            largest = metric in {sim_levenshtein, sim_jaccard, sim_cosine,
+                                 sim_editex, sim_lcsseq}
+            for query in ('Niall', 'Colin', 'ATCG', '', 'Niall Little'):
+                for k in (1, 3, None):
+                    for threshold in (None, 0.5, 2):
+                        expected = self._brute_force(query, metric, k,
+                                                     threshold, largest,
+                                                     kwargs)
+                        result = top_k(query, NAMES, metric, k, threshold,
+                                       largest, **kwargs)
+                        self.assertEqual([cand for cand, _ in result],
+                                         [cand for cand, _ in expected])
+                        self.assertEqual(top_k(query, NAMES, metric, k,
+                                               threshold, **kwargs), result)
+                        for (_, score), (_, exp_score) in zip(result,
+                                                              expected):
+                            self.assertAlmostEqual(score, exp_score)
+
+
+if __name__ == '__main__':
+    unittest.main()
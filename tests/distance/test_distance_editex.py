@@ -25,7 +25,9 @@ from __future__ import division, unicode_literals
 
 import unittest
 
-from abydos.distance.editex import dist_editex, editex, sim_editex
+# noinspection PyProtectedMember
+from abydos.distance.editex import _EDITEX_GROUP_MASKS, _editex_normalize, \
+    dist_editex, editex, editex_many, sim_editex
 
 
 class EditexTestCases(unittest.TestCase):
@@ -66,6 +68,42 @@ class EditexTestCases(unittest.TestCase):
         self.assertEqual(editex('neal', 'nihl', local=True), 3)
         self.assertEqual(editex('nihl', 'neal', local=True), 3)
 
+    def test_editex_normalized(self):
+        """Test abydos.distance.editex (pre-normalized input)."""
+        self.assertEqual(editex('NELSON', 'NEILSEN', normalized=True), 2)
+        self.assertEqual(editex('STRASSE', 'Straße'), 0)
+        self.assertEqual(editex('STRASSE', 'Straße', normalized=True), 10)
+        self.assertEqual(editex('', 'NEAL', normalized=True), 8)
+        for src, tar in (('nelson', 'neilsen'), ('Straße', 'strasse'),
+                         ('', 'neal'), ('niall', 'nihal')):
+            for func in (dist_editex, sim_editex):
+                self.assertEqual(func(_editex_normalize(src),
+                                      _editex_normalize(tar),
+                                      normalized=True), func(src, tar))
+        self.assertEqual(dist_editex('STRASSE', 'Straße', normalized=True),
+                         10 / 14)
+        self.assertEqual(sim_editex('STRASSE', 'Straße', normalized=True),
+                         1 - 10 / 14)
+
+        # C shares a group with K & one with S, but K & S share none
+        self.assertTrue(_EDITEX_GROUP_MASKS['C'] & _EDITEX_GROUP_MASKS['K'])
+        self.assertTrue(_EDITEX_GROUP_MASKS['C'] & _EDITEX_GROUP_MASKS['S'])
+        self.assertFalse(_EDITEX_GROUP_MASKS['K'] & _EDITEX_GROUP_MASKS['S'])
+        self.assertNotIn('H', _EDITEX_GROUP_MASKS)
+
+    def test_editex_many(self):
+        """Test abydos.distance.editex_many."""
+        names = ['nelson', 'neilsen', '', 'niall', 'NEAL', 'nihal', 'Straße',
+                 'ab', 'c']
+        self.assertEqual(editex_many('neal', []), [])
+        for query in ('neal', 'nihl', '', 'ab'):
+            for kwargs in ({}, {'local': True}, {'cost': (1, 3, 5)}):
+                self.assertEqual(editex_many(query, names, **kwargs),
+                                 [editex(query, name, **kwargs)
+                                  for name in names])
+        self.assertEqual(editex_many('NEAL', ['NIALL', 'NIHL'],
+                                     normalized=True), [1, 3])
+
     def test_sim_editex(self):
         """Test abydos.distance.sim_editex."""
         self.assertEqual(sim_editex('', ''), 1)
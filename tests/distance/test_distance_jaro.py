@@ -26,7 +26,7 @@ from __future__ import division, unicode_literals
 import unittest
 
 from abydos.distance.jaro import dist_jaro_winkler, dist_strcmp95, \
-    sim_jaro_winkler, sim_strcmp95
+    jaro_winkler_many, sim_jaro_winkler, sim_strcmp95
 
 
 class JaroWinklerTestCases(unittest.TestCase):
@@ -169,6 +169,23 @@ class JaroWinklerTestCases(unittest.TestCase):
 
         self.assertAlmostEqual(dist_jaro_winkler('ABCD', 'EFGH'), 1.0)
 
+    def test_jaro_winkler_many(self):
+        """Test abydos.distance.jaro_winkler_many."""
+        names = ['MARTHA', 'MARHTA', 'DWAYNE', 'DUANE', 'DIXON', 'DICKSONX',
+                 '', ' MARTHA ', 'ABCD', 'MARTHA']
+        self.assertEqual(jaro_winkler_many('MARTHA', []), [])
+        for query in ('MARTHA', 'DIXON', '', 'ABCD '):
+            for kwargs in ({}, {'mode': 'jaro'}, {'qval': 2},
+                           {'long_strings': True, 'scaling_factor': 0.2}):
+                self.assertEqual(jaro_winkler_many(query, names, **kwargs),
+                                 [sim_jaro_winkler(query, name, **kwargs)
+                                  for name in names])
+
+        self.assertRaises(ValueError, jaro_winkler_many, 'abcd', ['dcba'],
+                          boost_threshold=2)
+        self.assertRaises(ValueError, jaro_winkler_many, 'abcd', ['dcba'],
+                          scaling_factor=-1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -25,9 +25,9 @@ from __future__ import division, unicode_literals
 
 import unittest
 
-from abydos.distance.levenshtein import damerau_levenshtein, dist_damerau, \
-    dist_indel, dist_levenshtein, levenshtein, sim_damerau, sim_indel, \
-    sim_levenshtein
+from abydos.distance.levenshtein import _levenshtein_bitparallel, \
+    damerau_levenshtein, dist_damerau, dist_indel, dist_levenshtein, \
+    levenshtein, sim_damerau, sim_indel, sim_levenshtein
 
 
 class LevenshteinTestCases(unittest.TestCase):
@@ -120,10 +120,119 @@ class LevenshteinTestCases(unittest.TestCase):
         self.assertEqual(levenshtein('cab', 'cba', 'dam',
                                      cost=(5, 5, 10, 5)), 5)
 
+        # test fractional costs
+        self.assertEqual(levenshtein('ab', 'ac', 'lev',
+                                     cost=(1, 1, 0.5, 1)), 0.5)
+        self.assertEqual(levenshtein('abc', 'bac', 'osa',
+                                     cost=(1, 1, 1, 0.25)), 0.25)
+
         # test exception
         self.assertRaises(ValueError, levenshtein, 'ab', 'ba', 'dam',
                           cost=(10, 10, 10, 5))
 
+    def test_levenshtein_bitparallel(self):
+        """Test abydos.distance._levenshtein_bitparallel."""
+        self.assertEqual(_levenshtein_bitparallel('', ''), 0)
+        self.assertEqual(_levenshtein_bitparallel('', 'abc'), 3)
+        self.assertEqual(_levenshtein_bitparallel('abc', ''), 3)
+        self.assertEqual(_levenshtein_bitparallel('CA', 'ABC', True), 3)
+        self.assertEqual(_levenshtein_bitparallel('abc', 'bac', True), 1)
+        self.assertEqual(_levenshtein_bitparallel('abc', 'bac'), 2)
+
+        # the unit cost engine must agree with the weighted DP
+        pairs = (('abcdefg', 'xabxcdxxefxgx'), ('sturgeon', 'urgently'),
+                 ('levenshtein', 'frankenstein'), ('ATCG', 'TAGC'),
+                 ('ACTG', 'TAGC'), ('CA', 'ABC'), ('Niall', 'Neil'),
+                 ('java was neat', 'scala is great'),
+                 ('ab'*40, 'ba'*45), ('abcdefghij'*10, 'bacdefhgij'*9))
+        for src, tar in pairs:
+            for mode in ('lev', 'osa'):
+                self.assertEqual(_levenshtein_bitparallel(src, tar,
+                                                          mode == 'osa'),
+                                 levenshtein(src, tar, mode,
+                                             cost=(2, 2, 2, 2))//2)
+                self.assertEqual(_levenshtein_bitparallel(tar, src,
+                                                          mode == 'osa'),
+                                 levenshtein(tar, src, mode,
+                                             cost=(2, 2, 2, 2))//2)
+
+    def test_levenshtein_max_distance(self):
+        """Test abydos.distance.levenshtein (with max_distance)."""
+        # length difference alone exceeds the bound
+        self.assertEqual(levenshtein('', 'abc', max_distance=2), 3)
+        self.assertEqual(levenshtein('abcdef', 'ab', max_distance=1), 2)
+        self.assertEqual(levenshtein('abcdef', 'ab', 'dam', max_distance=1), 2)
+        self.assertEqual(levenshtein('a', 'abc', cost=(3, 1, 1, 1),
+                                     max_distance=5), 6)
+        self.assertEqual(levenshtein('', 'ab', max_distance=2), 2)
+        self.assertEqual(levenshtein('abc', 'abc', max_distance=0), 0)
+
+        pairs = (('abcdefg', 'xabxcdxxefxgx'), ('sturgeon', 'urgently'),
+                 ('levenshtein', 'frankenstein'), ('ATCG', 'TAGC'),
+                 ('ACTG', 'TAGC'), ('CA', 'ABC'), ('Niall', 'Neil'),
+                 ('java was neat', 'scala is great'), ('abc', 'bac'),
+                 ('distance', 'difference'), ('a', 'b'), ('ab'*40, 'ba'*45))
+        costs = ((1, 1, 1, 1), (2, 3, 4, 3), (1, 1, 2, 1), (5, 7, 10, 10))
+        for src, tar in pairs:
+            for cost in costs:
+                for mode in ('lev', 'osa', 'dam'):
+                    full = levenshtein(src, tar, mode, cost)
+                    for max_distance in range(0, 12):
+                        self.assertEqual(
+                            levenshtein(src, tar, mode, cost, max_distance),
+                            (full if full <= max_distance else
+                             max_distance + 1))
+
+    def test_levenshtein_numpy(self):
+        """Test abydos.distance.levenshtein (with engine='numpy')."""
+        self.assertEqual(levenshtein('', '', engine='numpy'), 0)
+        self.assertEqual(levenshtein('', 'abc', cost=(2, 1, 1, 1),
+                                     engine='numpy'), 6)
+        self.assertEqual(levenshtein('abc', '', cost=(2, 1, 1, 1),
+                                     engine='numpy'), 3)
+        self.assertRaises(ValueError, levenshtein, 'ab', 'ba',
+                          cost=(1, 1, 2, 1), engine='cython')
+        # the engine is checked even where the DP is not run
+        self.assertRaises(ValueError, levenshtein, 'cat', 'hat',
+                          engine='fortran')
+        self.assertRaises(ValueError, levenshtein, 'cat', 'cat',
+                          engine='fortran')
+        self.assertRaises(ValueError, dist_levenshtein, 'cat', 'cat',
+                          engine='fortran')
+        self.assertRaises(ValueError, sim_levenshtein, 'cat', 'hat',
+                          engine='fortran')
+
+        pairs = (('abcdefg', 'xabxcdxxefxgx'), ('sturgeon', 'urgently'),
+                 ('levenshtein', 'frankenstein'), ('ATCG', 'TAGC'),
+                 ('ACTG', 'TAGC'), ('CA', 'ABC'), ('Niall', 'Neil'),
+                 ('java was neat', 'scala is great'), ('abc', 'bac'),
+                 ('ab'*40, 'ba'*45), ('abcdefghij'*10, 'bacdefhgij'*9))
+        costs = ((2, 3, 4, 3), (1, 1, 0.5, 1), (1, 2, 1.5, 0.7),
+                 (5, 7, 10, 10))
+        for src, tar in pairs:
+            for cost in costs:
+                for mode in ('lev', 'osa'):
+                    self.assertAlmostEqual(
+                        levenshtein(src, tar, mode, cost, engine='numpy'),
+                        levenshtein(src, tar, mode, cost))
+                    self.assertAlmostEqual(
+                        levenshtein(tar, src, mode, cost, engine='numpy'),
+                        levenshtein(tar, src, mode, cost))
+                self.assertEqual(levenshtein(src, tar, 'osa', cost, 3,
+                                             'numpy'),
+                                 levenshtein(src, tar, 'osa', cost, 3))
+
+        self.assertAlmostEqual(dist_levenshtein('sturgeon', 'urgently',
+                                                cost=(1, 1, 0.5, 1),
+                                                engine='numpy'),
+                               dist_levenshtein('sturgeon', 'urgently',
+                                                cost=(1, 1, 0.5, 1)))
+        self.assertAlmostEqual(sim_levenshtein('sturgeon', 'urgently',
+                                               cost=(1, 1, 0.5, 1),
+                                               engine='numpy'),
+                               sim_levenshtein('sturgeon', 'urgently',
+                                               cost=(1, 1, 0.5, 1)))
+
     def test_dist_levenshtein(self):
         """Test abydos.distance.dist_levenshtein."""
         self.assertEqual(dist_levenshtein('', ''), 0)
@@ -138,6 +247,14 @@ class LevenshteinTestCases(unittest.TestCase):
         self.assertAlmostEqual(dist_levenshtein('abbc', 'ac'), 1/2)
         self.assertAlmostEqual(dist_levenshtein('abbc', 'abc'), 1/4)
 
+        self.assertEqual(dist_levenshtein('abbc', 'ac', max_distance=0.4), 1)
+        self.assertAlmostEqual(dist_levenshtein('abbc', 'ac',
+                                                max_distance=0.5), 1/2)
+        self.assertAlmostEqual(dist_levenshtein('abbc', 'ac', 'osa',
+                                                (2, 2, 1, 1), 0.5), 1/2)
+        self.assertEqual(dist_levenshtein('abbc', 'ac', 'dam',
+                                          max_distance=0.25), 1)
+
     def test_sim_levenshtein(self):
         """Test abydos.distance.sim_levenshtein."""
         self.assertEqual(sim_levenshtein('', ''), 1)
@@ -183,6 +300,16 @@ class DamerauLevenshteinTestCases(unittest.TestCase):
         self.assertRaises(ValueError, damerau_levenshtein, 'ab', 'ba',
                           cost=(10, 10, 10, 5))
 
+        self.assertEqual(damerau_levenshtein('CA', 'ABC', max_distance=2), 2)
+        self.assertEqual(damerau_levenshtein('CA', 'ABC', max_distance=1), 2)
+        self.assertEqual(damerau_levenshtein('', 'ABC', max_distance=1), 2)
+        self.assertEqual(damerau_levenshtein('abcdef', 'badcfe',
+                                             max_distance=3), 3)
+        self.assertEqual(damerau_levenshtein('abcdef', 'badcfe',
+                                             max_distance=2), 3)
+        self.assertEqual(damerau_levenshtein('abcdefghij', 'zyxwvutsrq',
+                                             max_distance=2), 3)
+
     def test_dist_damerau(self):
         """Test abydos.distance.dist_damerau."""
         self.assertEqual(dist_damerau('', ''), 0)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.test_distance.profile.
+
+This module contains unit tests for abydos.distance.profile
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from abydos.distance import minkowski as minkowski_module
+from abydos.distance import token
+from abydos.distance.profile import QGramProfileStore
+
+NAMES = ('Niall', 'Neal', 'Neil', 'Njall', 'Nigel', 'Nele', 'Nyle', 'Nile',
+         'Neel', 'Nial', 'Nil', 'Nell', 'Noll', 'Nuala', 'Colin', 'Coiln',
+         'Christopher', 'Kristof', 'aluminum', 'Catalan', 'ATCG', 'TAGC',
+         'a', '', 'Niall Little', 'AATTATAT', 'Neil Little', 'Nyall',
+         'TTAGCA')
+
+METRICS = (('sim_tversky', {}),
+           ('sim_tversky', {'alpha': 0.3, 'beta': 2}),
+           ('dist_tversky', {'alpha': 0.5, 'beta': 1.5, 'bias': 0.2}),
+           ('sim_dice', {}),
+           ('dist_dice', {}),
+           ('sim_jaccard', {}),
+           ('dist_jaccard', {}),
+           ('sim_tanimoto', {}),
+           ('tanimoto', {}),
+           ('sim_cosine', {}),
+           ('dist_cosine', {}),
+           ('minkowski', {}),
+           ('minkowski', {'pval': 3, 'normalized': True}),
+           ('minkowski', {'pval': 0, 'normalized': True}),
+           ('minkowski', {'normalized': True, 'alphabet': 'ACGT'}),
+           ('dist_minkowski', {'pval': 2}),
+           ('sim_minkowski', {}),
+           ('manhattan', {}),
+           ('dist_manhattan', {}),
+           ('sim_manhattan', {'alphabet': 30}),
+           ('euclidean', {}),
+           ('dist_euclidean', {}),
+           ('sim_euclidean', {}),
+           ('chebyshev', {}),
+           ('chebyshev', {'normalized': True}))
+
+
+def _function(metric):
+    """Return the function of the token or minkowski module for a metric."""
+    if hasattr(token, metric):
+        return getattr(token, metric)
+    return getattr(minkowski_module, metric)
+
+
+class QGramProfileStoreTestCases(unittest.TestCase):
+    """Test QGramProfileStore class.
+
+    abydos.distance.profile.QGramProfileStore
+    """
+
+    def test_store(self):
+        """Test abydos.distance.profile.QGramProfileStore."""
+        store = QGramProfileStore()
+        self.assertEqual(len(store), 0)
+        self.assertEqual(store.add('cat'), 0)
+        self.assertEqual(store.add('hat'), 1)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.term(0), 'cat')
+        self.assertEqual(sorted(store.vocabulary),
+                         ['$c', '$h', 'at', 'ca', 'ha', 't#'])
+
+        ids, counts = store.profile(0)
+        self.assertEqual(list(ids), sorted(ids))
+        self.assertEqual(list(counts), [1, 1, 1, 1])
+
+        # preparing a term does not extend the vocabulary
+        query = store.prepare('bat')
+        self.assertEqual(len(store.vocabulary), 6)
+        self.assertEqual(query[3], 4)
+        self.assertEqual(store.sim_jaccard(query, 1), 0.3333333333333333)
+        self.assertEqual(store.sim_jaccard(query, store.prepare('bat')), 1.0)
+        self.assertEqual(store.sim_jaccard(store.prepare('bats'),
+                                           store.prepare('bat')),
+                         token.sim_jaccard('bats', 'bat'))
+        self.assertEqual(store.sim_jaccard('bats', 'bat'),
+                         token.sim_jaccard('bats', 'bat'))
+
+        self.assertRaises(ValueError, store.sim_tversky, 0, 1, -1)
+        self.assertRaises(ValueError, store.scores, 'cat', 'add')
+        self.assertEqual(store.scores('bat', 'sim_dice'),
+                         [token.sim_dice('bat', 'cat'),
+                          token.sim_dice('bat', 'hat')])
+
+        # a profile prepared before its q-grams are added is resolved again
+        store = QGramProfileStore(['abc'])
+        query = store.prepare('xyz')
+        term_id = store.add('xyzw')
+        self.assertEqual(store.sim_jaccard(query, term_id),
+                         token.sim_jaccard('xyz', 'xyzw'))
+        self.assertEqual(store.scores(query),
+                         [token.sim_jaccard('xyz', 'abc'),
+                          token.sim_jaccard('xyz', 'xyzw')])
+        self.assertEqual(store.minkowski(query, term_id),
+                         minkowski_module.minkowski('xyz', 'xyzw'))
+        self.assertEqual(store.sim_jaccard(query, 0), 0.0)
+
+    def test_store_metrics(self):
+        """Test abydos.distance.profile.QGramProfileStore's metrics."""
+        # the last few names are not stored, so have q-grams absent from the
+        # vocabulary
+        stored = len(NAMES) - 3
+        for qval in (1, 2, 3, 0):
+            store = QGramProfileStore(NAMES[:stored], qval=qval)
+            for metric, kwargs in METRICS:
+                method = getattr(store, metric)
+                function = _function(metric)
+                for i, src in enumerate(NAMES):
+                    src_key = i if i < stored else store.prepare(src)
+                    for j, tar in enumerate(NAMES):
+                        tar_key = j if j < stored else tar
+                        try:
+                            expected = function(src, tar, qval=qval,
+                                                **kwargs)
+                        except ZeroDivisionError:
+                            # e.g. the cosine of a term with no q-grams
+                            self.assertRaises(ZeroDivisionError, method,
+                                              src_key, tar_key, **kwargs)
+                            continue
+                        self.assertAlmostEqual(
+                            method(src_key, tar_key, **kwargs), expected)
+                        self.assertAlmostEqual(method(src, tar, **kwargs),
+                                               expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,10 +23,15 @@ This module contains unit tests for abydos.distance.seqalign
 
 from __future__ import division, unicode_literals
 
+import random
 import unittest
 
-from abydos.distance.seqalign import gotoh, needleman_wunsch, sim_matrix, \
-    smith_waterman
+import abydos.distance.seqalign as seqalign
+from abydos.distance.basic import sim_ident
+from abydos.distance.seqalign import gotoh, gotoh_alignment, \
+    needleman_wunsch, needleman_wunsch_alignment, sim_matrix, \
+    smith_waterman, smith_waterman_alignment
+from abydos.distance.substitution import SubstitutionMatrix
 
 from six.moves import range
 
@@ -79,6 +84,11 @@ class MatrixSimTestCases(unittest.TestCase):
         self.assertRaises(ValueError, sim_matrix, 'abc', 'ba', alphabet='ab')
         self.assertRaises(ValueError, sim_matrix, 'ab', 'cba', alphabet='ab')
 
+        sm = SubstitutionMatrix('ab', [[1, -2], [-3, 4]])
+        self.assertEqual(sim_matrix('a', 'b', sm), -2)
+        self.assertEqual(sim_matrix('b', 'a', sm), -3)
+        self.assertRaises(ValueError, sim_matrix, 'a', 'c', sm)
+
 
 class NeedlemanWunschTestCases(unittest.TestCase):
     """Test Needleman-Wunsch functions.
@@ -153,6 +163,8 @@ class GotohTestCases(unittest.TestCase):
     def test_gotoh(self):
         """Test abydos.distance.needleman_wunsch_affine."""
         self.assertEqual(gotoh('', ''), 0)
+        self.assertAlmostEqual(gotoh('abc', ''), -1.8)
+        self.assertAlmostEqual(gotoh('', 'abc'), -1.8)
 
         # https://en.wikipedia.org/wiki/Needleman–Wunsch_algorithm
         self.assertEqual(gotoh('GATTACA', 'GCATGCU', 1, 1, _sim_nw), 0)
@@ -198,5 +210,221 @@ class GotohTestCases(unittest.TestCase):
                                                      _sim_nw))
 
 
+class AlignmentTestCases(unittest.TestCase):
+    """Test alignment functions.
+
+    abydos.distance.needleman_wunsch_alignment, .smith_waterman_alignment, &
+    .gotoh_alignment
+    """
+
+    pairs = (('', ''), ('abc', ''), ('', 'abc'), ('cat', 'hat'),
+             ('Niall', 'Neil'), ('aluminum', 'Catalan'), ('ATCG', 'TAGC'),
+             ('GATTACA', 'GCATGCU'), ('AGACTAGTTAC', 'CGAGACGT'),
+             ('CGATATCAG', 'TGACGSTGC'), ('AGACTAGTTAC', 'TGACGSTGC'))
+
+    def setUp(self):
+        """Add long random pairs & force the divide & conquer path."""
+        rng = random.Random(1)
+        self.pairs = self.pairs + tuple(
+            (''.join(rng.choice('ACGT') for _ in range(rng.randint(20, 60))),
+             ''.join(rng.choice('ACGT') for _ in range(rng.randint(20, 60))))
+            for _ in range(10))
+        self.full_cells = seqalign._ALIGN_FULL_CELLS
+        seqalign._ALIGN_FULL_CELLS = 0
+
+    def tearDown(self):
+        """Restore the full matrix cutoff."""
+        seqalign._ALIGN_FULL_CELLS = self.full_cells
+
+    def _check_alignment(self, src, tar, alignment):
+        """Check that an alignment is consistent with its strings."""
+        _, src_aligned, tar_aligned, ops = alignment
+        self.assertEqual(len(src_aligned), len(ops))
+        self.assertEqual(len(tar_aligned), len(ops))
+        self.assertTrue(src.endswith(''.join(
+            c for c, op in zip(src_aligned, ops) if op != 'I')))
+        self.assertTrue(tar.endswith(''.join(
+            c for c, op in zip(tar_aligned, ops) if op != 'D')))
+        for src_char, tar_char, op in zip(src_aligned, tar_aligned, ops):
+            if op == '=':
+                self.assertEqual(src_char, tar_char)
+            elif op == 'X':
+                self.assertNotEqual(src_char, tar_char)
+            elif op == 'D':
+                self.assertEqual(tar_char, '-')
+            else:
+                self.assertEqual(op, 'I')
+                self.assertEqual(src_char, '-')
+
+    def test_needleman_wunsch_alignment(self):
+        """Test abydos.distance.needleman_wunsch_alignment."""
+        self.assertEqual(needleman_wunsch_alignment('', ''),
+                         (0.0, '', '', ''))
+        self.assertEqual(needleman_wunsch_alignment('abc', ''),
+                         (-3.0, 'abc', '---', 'DDD'))
+        self.assertEqual(needleman_wunsch_alignment('', 'ab', gap='_'),
+                         (-2.0, '__', 'ab', 'II'))
+        self.assertEqual(needleman_wunsch_alignment('cat', 'at'),
+                         (1.0, 'cat', '-at', 'D=='))
+
+        for src, tar in self.pairs:
+            for gap_cost, sim_func in ((1, sim_ident), (2, _sim_nw),
+                                       (0.5, _sim_nw)):
+                alignment = needleman_wunsch_alignment(src, tar, gap_cost,
+                                                       sim_func)
+                self._check_alignment(src, tar, alignment)
+                self.assertEqual(alignment[1].replace('-', ''), src)
+                self.assertAlmostEqual(alignment[0],
+                                       needleman_wunsch(src, tar, gap_cost,
+                                                        sim_func))
+        self.assertAlmostEqual(
+            needleman_wunsch_alignment('AGACTAGTTAC', 'CGAGACGT', 5,
+                                       _sim_wikipedia)[0], 16)
+
+    def test_smith_waterman_alignment(self):
+        """Test abydos.distance.smith_waterman_alignment."""
+        self.assertEqual(smith_waterman_alignment('', ''), (0.0, '', '', ''))
+        self.assertEqual(smith_waterman_alignment('xxcat', 'yhat'),
+                         (2.0, 'at', 'at', '=='))
+
+        for src, tar in self.pairs:
+            for gap_cost, sim_func in ((1, sim_ident), (2, _sim_nw),
+                                       (0.5, _sim_nw)):
+                alignment = smith_waterman_alignment(src, tar, gap_cost,
+                                                     sim_func)
+                self._check_alignment(src, tar, alignment)
+                self.assertAlmostEqual(alignment[0],
+                                       smith_waterman(src, tar, gap_cost,
+                                                      sim_func))
+        self.assertAlmostEqual(
+            smith_waterman_alignment('AGACTAGTTAC', 'CGAGACGT', 5,
+                                     _sim_wikipedia)[0], 26)
+
+    def test_gotoh_alignment(self):
+        """Test abydos.distance.gotoh_alignment."""
+        self.assertEqual(gotoh_alignment('', ''), (0.0, '', '', ''))
+        alignment = gotoh_alignment('abc', '')
+        self.assertAlmostEqual(alignment[0], -1.8)
+        self.assertEqual(alignment[1:], ('abc', '---', 'DDD'))
+        alignment = gotoh_alignment('abcdef', 'af', 1, 0.1)
+        self.assertAlmostEqual(alignment[0], 0.7)
+        self.assertEqual(alignment[1:], ('abcdef', 'a----f', '=DDDD='))
+
+        for src, tar in self.pairs:
+            for gap_open, gap_ext, sim_func in ((1, 0.4, sim_ident),
+                                                (2, 1, _sim_nw),
+                                                (5, 2, _sim_nw),
+                                                (1, 1, _sim_nw)):
+                alignment = gotoh_alignment(src, tar, gap_open, gap_ext,
+                                            sim_func)
+                self._check_alignment(src, tar, alignment)
+                self.assertEqual(alignment[1].replace('-', ''), src)
+                self.assertAlmostEqual(alignment[0],
+                                       gotoh(src, tar, gap_open, gap_ext,
+                                             sim_func))
+        self.assertAlmostEqual(
+            gotoh_alignment('AGACTAGTTAC', 'CGAGACGT', 5, 5,
+                            _sim_wikipedia)[0], 16)
+
+
+class SubstitutionMatrixAlignmentTestCases(unittest.TestCase):
+    """Test alignment functions with SubstitutionMatrix similarities.
+
+    abydos.distance.needleman_wunsch, .smith_waterman, .gotoh, &
+    their alignment functions
+    """
+
+    def test_substitution_matrix_alignment(self):
+        """Test abydos.distance.seqalign with SubstitutionMatrix."""
+        wikipedia = SubstitutionMatrix('ACGT', [[10, -3, -1, -4],
+                                                [-3, 9, -5, 0],
+                                                [-1, -5, 7, -3],
+                                                [-4, 0, -3, 8]])
+        skewed = SubstitutionMatrix('ACGT', [[2, -1, 0, -3],
+                                             [-2, 3, -1, 0],
+                                             [1, -4, 1, -1],
+                                             [0, -2, -1, 2]])
+        self.assertFalse(skewed.symmetric)
+
+        self.assertEqual(needleman_wunsch('AGACTAGTTAC', 'CGAGACGT', 5,
+                                          wikipedia), 16)
+        self.assertEqual(smith_waterman('AGACTAGTTAC', 'CGAGACGT', 5,
+                                        wikipedia), 26)
+        self.assertEqual(gotoh('AGACTAGTTAC', 'CGAGACGT', 5, 5, wikipedia),
+                         16)
+
+        pairs = (('', ''), ('ACGT', ''), ('', 'ACGT'), ('ATCG', 'TAGC'),
+                 ('GATTACA', 'GCATGCA'), ('AGACTAGTTAC', 'CGAGACGT'),
+                 ('CGATATCAG', 'TGACGCTGC'), ('AC'*20, 'CAGT'*9))
+        for matrix in (wikipedia, skewed):
+            def sim_func(src, tar, matrix=matrix):
+                return matrix.scores[matrix.index(src), matrix.index(tar)]
+
+            for src, tar in pairs:
+                for func in (needleman_wunsch, smith_waterman):
+                    self.assertEqual(func(src, tar, 2, matrix),
+                                     func(src, tar, 2, sim_func))
+                    self.assertEqual(func(tar, src, 2, matrix),
+                                     func(tar, src, 2, sim_func))
+                self.assertEqual(gotoh(src, tar, 3, 1, matrix),
+                                 gotoh(src, tar, 3, 1, sim_func))
+                self.assertEqual(
+                    needleman_wunsch_alignment(src, tar, 2, matrix),
+                    needleman_wunsch_alignment(src, tar, 2, sim_func))
+                self.assertEqual(
+                    smith_waterman_alignment(src, tar, 2, matrix),
+                    smith_waterman_alignment(src, tar, 2, sim_func))
+                self.assertEqual(gotoh_alignment(src, tar, 3, 1, matrix),
+                                 gotoh_alignment(src, tar, 3, 1, sim_func))
+
+        self.assertRaises(ValueError, needleman_wunsch, 'ACGU', 'ACGT', 1,
+                          wikipedia)
+        self.assertRaises(ValueError, gotoh, 'ACGT', 'ACGU', 1, 0.5,
+                          wikipedia)
+
+
+class NumpyEngineTestCases(unittest.TestCase):
+    """Test sequence alignment scores with engine='numpy'.
+
+    abydos.distance.needleman_wunsch, .smith_waterman, & .gotoh
+    """
+
+    def test_numpy_engine(self):
+        """Test abydos.distance.seqalign (with engine='numpy')."""
+        wikipedia = SubstitutionMatrix('ACGT', [[10, -3, -1, -4],
+                                                [-3, 9, -5, 0],
+                                                [-1, -5, 7, -3],
+                                                [-4, 0, -3, 8]])
+        self.assertEqual(needleman_wunsch('AGACTAGTTAC', 'CGAGACGT', 5,
+                                          wikipedia, 'numpy'), 16)
+        self.assertEqual(smith_waterman('AGACTAGTTAC', 'CGAGACGT', 5,
+                                        wikipedia, 'numpy'), 26)
+        self.assertEqual(gotoh('AGACTAGTTAC', 'CGAGACGT', 5, 5, wikipedia,
+                               'numpy'), 16)
+        self.assertRaises(ValueError, needleman_wunsch, 'ACGU', 'ACGT', 1,
+                          _sim_wikipedia, 'numpy')
+        self.assertRaises(ValueError, gotoh, 'ACGT', 'ACGT', 1, 0.4,
+                          sim_ident, 'fortran')
+
+        pairs = (('', ''), ('ACGT', ''), ('', 'ACGT'), ('ATCG', 'TAGC'),
+                 ('GATTACA', 'GCATGCA'), ('AGACTAGTTAC', 'CGAGACGT'),
+                 ('CGATATCAG', 'TGACGCTGC'), ('AC'*20, 'CAGT'*9))
+        for sim_func in (sim_ident, _sim_nw, _sim_wikipedia, wikipedia):
+            for src, tar in pairs:
+                for func in (needleman_wunsch, smith_waterman):
+                    self.assertAlmostEqual(func(src, tar, 2, sim_func,
+                                                'numpy'),
+                                           func(src, tar, 2, sim_func))
+                    self.assertAlmostEqual(func(tar, src, 2, sim_func,
+                                                'numpy'),
+                                           func(tar, src, 2, sim_func))
+                self.assertAlmostEqual(gotoh(src, tar, 3, 1, sim_func,
+                                             'numpy'),
+                                       gotoh(src, tar, 3, 1, sim_func))
+                self.assertAlmostEqual(gotoh(tar, src, 1, 0.4, sim_func,
+                                             'numpy'),
+                                       gotoh(tar, src, 1, 0.4, sim_func))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -23,12 +23,14 @@ This module contains unit tests for abydos.distance.sequence
 
 from __future__ import division, unicode_literals
 
+import random
 import unittest
 from difflib import SequenceMatcher
 
-from abydos.distance.sequence import dist_lcsseq, dist_lcsstr, \
-    dist_ratcliff_obershelp, lcsseq, lcsstr, sim_lcsseq, sim_lcsstr, \
-    sim_ratcliff_obershelp
+# noinspection PyProtectedMember
+from abydos.distance.sequence import _lcsseq_length, _lcsstr_stl, \
+    _lcsstr_stl_dp, dist_lcsseq, dist_lcsstr, dist_ratcliff_obershelp, \
+    lcsseq, lcsstr, sim_lcsseq, sim_lcsstr, sim_ratcliff_obershelp
 
 from .. import _corpus_file
 
@@ -74,6 +76,24 @@ class LcsseqTestCases(unittest.TestCase):
         self.assertEqual(lcsseq('cc', 'bbbbcccccc'), 'cc')
         self.assertEqual(lcsseq('ccc', 'bcbb'), 'c')
 
+    def test_lcsseq_length(self):
+        """Test abydos.distance.sequence._lcsseq_length."""
+        self.assertEqual(_lcsseq_length('', ''), 0)
+        self.assertEqual(_lcsseq_length('ABCD', ''), 0)
+        self.assertEqual(_lcsseq_length('', 'ABCD'), 0)
+        self.assertEqual(_lcsseq_length('XMJYAUZ', 'MZJAWXU'), 4)
+        self.assertEqual(_lcsseq_length('ab'*100, 'ba'*100), 199)
+
+        # the bit-parallel length must match the DP's subsequence
+        rand = random.Random(3)
+        for _ in range(200):
+            alphabet = rand.choice(('ab', 'acgt', 'abcdefghijklmnop'))
+            src = ''.join(rand.choice(alphabet) for _ in
+                          range(rand.randint(0, 80)))
+            tar = ''.join(rand.choice(alphabet) for _ in
+                          range(rand.randint(0, 80)))
+            self.assertEqual(_lcsseq_length(src, tar), len(lcsseq(src, tar)))
+
     def test_sim_lcsseq(self):
         """Test abydos.distance.sim_lcsseq."""
         self.assertEqual(sim_lcsseq('', ''), 1)
@@ -196,6 +216,30 @@ GAGGTGAGGCTCCCTCCCCTGCTCCGACCCGGGCTCCTCGCCCGCCCGGACCCAC', 'AAGCGCCGCGCAGTCTGGG\
 CTCCGCACACTTCTGGTCCAGTCCGACTGAGAAGGAACCACCATGGTGCTGTCTCCCGCTGACAAGACCAACATCAAG\
 ACTGCCTGGGAAAAGATCGGCAGCCACGGTGGCGAGTATGGCGCCGAGGCCGT'), 'TGGCGAGTATGG')
 
+        # long strings, which are matched with a suffix automaton
+        self.assertEqual(lcsstr('ab'*200 + 'abc', 'c' + 'ab'*150 + 'c'),
+                         'ab'*150 + 'c')
+        self.assertEqual(lcsstr('x'*300, 'y'*300), '')
+        self.assertEqual(lcsstr('ab'*200 + 'xyz', 'xyz' + 'ba'*200),
+                         'ab'*199 + 'a')
+
+    def test_lcsstr_stl(self):
+        """Test abydos.distance.sequence._lcsstr_stl."""
+        # the suffix automaton & DP must agree, including on ties
+        rand = random.Random(4)
+        for _ in range(100):
+            alphabet = rand.choice(('ab', 'abc', 'acgt', 'abcdefghij '))
+            src = ''.join(rand.choice(alphabet) for _ in
+                          range(rand.randint(0, 60)))
+            tar = ''.join(rand.choice(alphabet) for _ in
+                          range(rand.randint(0, 60)))
+            src_start = rand.randint(0, len(src))
+            tar_start = rand.randint(0, len(tar))
+            self.assertEqual(_lcsstr_stl(src, tar, src_start, len(src),
+                                         tar_start, len(tar)),
+                             _lcsstr_stl_dp(src, tar, src_start, len(src),
+                                            tar_start, len(tar)))
+
     def test_sim_lcsstr(self):
         """Test abydos.distance.sim_lcsstr."""
         self.assertEqual(sim_lcsstr('', ''), 1)
@@ -322,6 +366,15 @@ class RatcliffObershelpTestCases(unittest.TestCase):
                                        SequenceMatcher(None, word1,
                                                        word2).ratio())
 
+        # long strings, without SequenceMatcher's junk heuristic
+        rand = random.Random(8)
+        for _ in range(10):
+            word1 = ''.join(rand.choice('acgt') for _ in range(500))
+            word2 = ''.join(rand.choice('acgt') for _ in range(400))
+            self.assertAlmostEqual(sim_ratcliff_obershelp(word1, word2),
+                                   SequenceMatcher(None, word1, word2,
+                                                   False).ratio())
+
     def test_dist_ratcliff_obershelp(self):
         """Test abydos.distance.dist_ratcliff_obershelp."""
         # https://github.com/rockymadden/stringmetric/blob/master/core/src/test/scala/com/rockymadden/stringmetric/similarity/RatcliffObershelpMetricSpec.scala
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2014-2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.test_distance.substitution.
+
+This module contains unit tests for abydos.distance.substitution
+"""
+
+from __future__ import division, unicode_literals
+
+import os
+import shutil
+import tempfile
+import unittest
+from io import open
+
+from abydos.distance.seqalign import sim_matrix
+from abydos.distance.substitution import SubstitutionMatrix
+from abydos.phones import cmp_features, ipa_to_features
+
+BLOSUM62_EXCERPT = """#  Matrix made by matblas from blosum62.iij
+#  * column uses minimum score
+   A  R  N  D  C
+A  4 -1 -2 -2  0
+R -1  5  0 -2 -3
+N -2  0  6  1 -3
+D -2 -2  1  6 -3
+C  0 -3 -3 -3  9
+"""
+
+
+class SubstitutionMatrixTestCases(unittest.TestCase):
+    """Test SubstitutionMatrix class.
+
+    abydos.distance.substitution.SubstitutionMatrix
+    """
+
+    def test_substitution_matrix(self):
+        """Test abydos.distance.substitution.SubstitutionMatrix."""
+        sm = SubstitutionMatrix('ACGT')
+        self.assertEqual(len(sm), 4)
+        self.assertEqual(sm.alphabet, ('A', 'C', 'G', 'T'))
+        self.assertEqual(sm.scores.tolist(), [[1, 0, 0, 0], [0, 1, 0, 0],
+                                              [0, 0, 1, 0], [0, 0, 0, 1]])
+        self.assertTrue(sm.symmetric)
+        for src in 'ACGT':
+            for tar in 'ACGT':
+                self.assertEqual(sm(src, tar), sim_matrix(src, tar))
+        self.assertEqual(sm.index('T'), 3)
+        self.assertEqual(sm.encode('').tolist(), [])
+        self.assertEqual(sm.row('G', sm.encode('GATTACA')),
+                         [1, 0, 0, 0, 0, 0, 0])
+        self.assertRaises(ValueError, sm, 'A', 'U')
+        self.assertRaises(ValueError, sm.encode, 'GAUU')
+
+        sm = SubstitutionMatrix(['ch', 'k'], [[2, -1], [-3, 4]])
+        self.assertFalse(sm.symmetric)
+        self.assertEqual(sm('ch', 'k'), -1)
+        self.assertEqual(sm('k', 'ch'), -3)
+        self.assertEqual(sm.encode(['k', 'ch', 'k']).tolist(), [1, 0, 1])
+
+        self.assertRaises(ValueError, SubstitutionMatrix, 'ABA')
+        self.assertRaises(ValueError, SubstitutionMatrix, 'AB', [[1, 0]])
+
+    def test_substitution_matrix_from_dict(self):
+        """Test abydos.distance.substitution.SubstitutionMatrix.from_dict."""
+        nw_matrix = {('A', 'A'): 10, ('G', 'G'): 7, ('C', 'C'): 9,
+                     ('T', 'T'): 8, ('A', 'G'): -1, ('A', 'C'): -3,
+                     ('A', 'T'): -4, ('G', 'C'): -5, ('G', 'T'): -3,
+                     ('C', 'T'): 0}
+        sm = SubstitutionMatrix.from_dict(nw_matrix)
+        self.assertEqual(sm.alphabet, ('A', 'C', 'G', 'T'))
+        self.assertTrue(sm.symmetric)
+        for src in 'ACGT':
+            for tar in 'ACGT':
+                self.assertEqual(sm(src, tar),
+                                 sim_matrix(src, tar, nw_matrix))
+
+        mat = {('a', 'b'): 2, ('b', 'a'): -2}
+        for symmetric in (True, False):
+            sm = SubstitutionMatrix.from_dict(mat, 'abc', -1, 3, symmetric)
+            for src in 'abc':
+                for tar in 'abc':
+                    self.assertEqual(sm(src, tar),
+                                     sim_matrix(src, tar, mat, -1, 3,
+                                                symmetric))
+        sm = SubstitutionMatrix.from_dict({('a', 'b'): 2}, symmetric=False)
+        self.assertEqual((sm('a', 'b'), sm('b', 'a')), (2, 0))
+
+    def test_substitution_matrix_from_text(self):
+        """Test abydos.distance.substitution.SubstitutionMatrix.from_text."""
+        sm = SubstitutionMatrix.from_text(BLOSUM62_EXCERPT)
+        self.assertEqual(sm.alphabet, ('A', 'R', 'N', 'D', 'C'))
+        self.assertTrue(sm.symmetric)
+        self.assertEqual(sm('C', 'C'), 9)
+        self.assertEqual(sm('N', 'D'), 1)
+        self.assertEqual(sm('D', 'R'), -2)
+        self.assertEqual(
+            SubstitutionMatrix.from_text(BLOSUM62_EXCERPT.splitlines()).
+            scores.tolist(), sm.scores.tolist())
+
+        # rows need not be in the order of the columns
+        sm = SubstitutionMatrix.from_text(' x y\ny 1 2\nx 3 4\n')
+        self.assertEqual(sm.scores.tolist(), [[3, 4], [1, 2]])
+
+        self.assertRaises(ValueError, SubstitutionMatrix.from_text, '')
+        self.assertRaises(ValueError, SubstitutionMatrix.from_text,
+                          ' x y\nx 1 2\n')
+        self.assertRaises(ValueError, SubstitutionMatrix.from_text,
+                          ' x y\nx 1 2\ny 3\n')
+        self.assertRaises(ValueError, SubstitutionMatrix.from_text,
+                          ' x y\nx 1 2\nz 3 4\n')
+
+    def test_substitution_matrix_from_file(self):
+        """Test abydos.distance.substitution.SubstitutionMatrix.from_file."""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, 'BLOSUM62')
+            with open(filename, 'w', encoding='utf-8') as matrix_file:
+                matrix_file.write(BLOSUM62_EXCERPT)
+            self.assertEqual(
+                SubstitutionMatrix.from_file(filename).scores.tolist(),
+                SubstitutionMatrix.from_text(BLOSUM62_EXCERPT).scores.
+                tolist())
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_substitution_matrix_from_phones(self):
+        """Test abydos.distance.substitution.SubstitutionMatrix.from_phones."""
+        phones = 'pbmtdnlszik'
+        sm = SubstitutionMatrix.from_phones(phones)
+        self.assertTrue(sm.symmetric)
+        for src in phones:
+            self.assertEqual(sm(src, src), 1)
+            for tar in phones:
+                self.assertEqual(sm(src, tar),
+                                 cmp_features(ipa_to_features(src)[0],
+                                              ipa_to_features(tar)[0]))
+
+        # symbols without a single feature bundle are unknown
+        sm = SubstitutionMatrix.from_phones(['l', 'ts', '@'])
+        self.assertEqual(sm('l', 'l'), 1)
+        self.assertEqual(sm('l', 'ts'), -1)
+        self.assertEqual(sm('@', 'l'), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
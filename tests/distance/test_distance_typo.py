@@ -25,7 +25,9 @@ from __future__ import division, unicode_literals
 
 import unittest
 
-from abydos.distance.typo import dist_typo, sim_typo, typo
+# noinspection PyProtectedMember
+from abydos.distance.typo import _KEYBOARD_COORDS, _typo_substitution_costs, \
+    dist_typo, sim_typo, typo
 
 
 class TypoTestCases(unittest.TestCase):
@@ -55,6 +57,54 @@ class TypoTestCases(unittest.TestCase):
                                0.54930615)
 
         self.assertRaises(ValueError, typo, 'asdf', 'Ösdf')
+        self.assertRaises(ValueError, typo, 'Ösdf', 'asdf')
+        self.assertRaises(ValueError, typo, 'asdf', 'äsdf', layout='QWERTY')
+        self.assertEqual(typo('asdf', 'äsdf', layout='QWERTZ'), 2)
+
+    def test_typo_numpy(self):
+        """Test abydos.distance.typo (with engine='numpy')."""
+        self.assertEqual(typo('', '', engine='numpy'), 0)
+        self.assertEqual(typo('', 'typo', engine='numpy'), 4)
+        self.assertEqual(typo('asdf', 'qsdf', engine='numpy'), 0.5)
+        self.assertRaises(ValueError, typo, 'asdf', 'Ösdf', engine='numpy')
+        self.assertRaises(ValueError, typo, 'asdf', 'qsdf', engine='C')
+
+        pairs = (('Niall', 'Neil'), ('aluminum', 'Catalan'),
+                 ('ATCG', 'TAGC'), ('typewriter', 'tpyewritre'),
+                 ('thequickbrownfox', 'tehquikcborwnfxo'*3))
+        for src, tar in pairs:
+            for metric in ('euclidean', 'manhattan', 'log-euclidean',
+                           'log-manhattan'):
+                self.assertAlmostEqual(typo(src, tar, metric,
+                                            engine='numpy'),
+                                       typo(src, tar, metric))
+                self.assertAlmostEqual(typo(tar, src, metric,
+                                            engine='numpy'),
+                                       typo(tar, src, metric))
+            self.assertAlmostEqual(sim_typo(src, tar, engine='numpy'),
+                                   sim_typo(src, tar))
+            self.assertAlmostEqual(dist_typo(src, tar, engine='numpy'),
+                                   dist_typo(src, tar))
+
+    def test_typo_tables(self):
+        """Test abydos.distance.typo's keyboard & substitution tables."""
+        coords = _KEYBOARD_COORDS['QWERTY']
+        self.assertEqual(coords['`'], (0, 0, 0))
+        self.assertEqual(coords['a'], (2, 1, 0))
+        self.assertEqual(coords['|'], (1, 13, 1))
+        self.assertNotIn('', coords)
+        self.assertEqual(_KEYBOARD_COORDS['Dvorak']['z'], (3, 10, 0))
+        self.assertEqual(_KEYBOARD_COORDS['AZERTY']['W'], (1, 2, 1))
+
+        index, costs = _typo_substitution_costs('QWERTY', 'manhattan', 1, 0)
+        self.assertIs(costs, _typo_substitution_costs('QWERTY', 'manhattan',
+                                                      1, 0)[1])
+        self.assertEqual(len(costs), len(coords))
+        self.assertEqual(costs[index['q']][index['p']], 9)
+        self.assertEqual(costs[index['p']][index['q']], 9)
+        self.assertEqual(costs[index['a']][index['a']], 0)
+        index, costs = _typo_substitution_costs('QWERTY', 'euclidean', 2, 1)
+        self.assertAlmostEqual(costs[index['a']][index['W']], 2*(2**0.5+1))
 
     def test_sim_typo(self):
         """Test abydos.distance.sim_typo."""
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+
+"""abydos.tests.index.
+
+This module contains unit tests for abydos.index
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+
+def _brute_range(terms, metric, query, radius):
+    """Return the terms within radius of query, as an index's range_query.
+
+    :param tuple terms: the terms
+    :param function metric: the metric
+    :param str query: the query term
+    :param float radius: the greatest distance of the terms returned
+    :return: (term, distance) pairs, nearest first; ties are ordered by term id
+    """
+    matches = sorted((metric(query, term), term_id) for term_id, term in
+                     enumerate(terms) if metric(query, term) <= radius)
+    return [(terms[term_id], distance) for distance, term_id in matches]
+
+
+def _brute_knn(terms, metric, query, k):
+    """Return the k nearest terms to query, as an index's knn.
+
+    :param tuple terms: the terms
+    :param function metric: the metric
+    :param str query: the query term
+    :param int k: the number of terms to return
+    :return: (term, distance) pairs, nearest first; ties are ordered by term id
+    """
+    matches = sorted((metric(query, term), term_id) for term_id, term in
+                     enumerate(terms))[:k]
+    return [(terms[term_id], distance) for distance, term_id in matches]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_bktree.
+
+This module contains unit tests for abydos.index.bktree
+"""
+
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import unittest
+
+from abydos.distance.hamming import hamming
+from abydos.distance.levenshtein import damerau_levenshtein, indel, \
+    levenshtein
+from abydos.distance.token import bag
+from abydos.index.bktree import BKTree
+from abydos.index.vptree import VPTree
+
+from . import _brute_knn, _brute_range
+from .. import COLIN, NIALL
+
+
+class BKTreeTestCases(unittest.TestCase):
+    """Test BKTree class.
+
+    abydos.index.bktree.BKTree
+    """
+
+    terms = NIALL + COLIN + ('aluminum', 'Catalan', 'ATCG', 'TAGC', '', 'a',
+                             'AATTATAT', 'ATATATAT', 'Niall')
+    queries = ('Niall', 'Nigel', 'Colin', 'Nobody', 'ATGC', '', 'aluminium',
+               'Q')
+    fixed = ('cat', 'hat', 'bat', 'cot', 'dog', 'dig', 'ATG', 'TAG', 'CCC',
+             'aaa', 'abc', 'cba')
+
+    def test_bktree(self):
+        """Test abydos.index.bktree.BKTree."""
+        self.assertEqual(BKTree().range_query('Niall', 5), [])
+        self.assertEqual(BKTree().knn('Niall', 5), [])
+
+        for metric in (levenshtein, damerau_levenshtein, indel, bag):
+            tree = BKTree(self.terms, metric)
+            self.assertEqual(len(tree), len(self.terms))
+            self.assertEqual(tree.term(0), self.terms[0])
+            for query in self.queries:
+                for radius in (0, 1, 2, 4):
+                    self.assertEqual(tree.range_query(query, radius),
+                                     _brute_range(self.terms, metric, query,
+                                                  radius))
+                for k in (0, 1, 3, 10, 100):
+                    self.assertEqual(tree.knn(query, k),
+                                     _brute_knn(self.terms, metric, query, k))
+
+        # hamming distance is a metric on terms of equal length
+        tree = BKTree(self.fixed, hamming)
+        for query in ('rat', 'ATC', 'ccc'):
+            for radius in (0, 1, 2):
+                self.assertEqual(tree.range_query(query, radius),
+                                 _brute_range(self.fixed, hamming, query,
+                                              radius))
+            self.assertEqual(tree.knn(query, 4),
+                             _brute_knn(self.fixed, hamming, query, 4))
+
+    def test_bktree_save_load(self):
+        """Test abydos.index.bktree.BKTree.save & .load."""
+        path, copy = tempfile.mkdtemp(), tempfile.mkdtemp()
+        try:
+            tree = BKTree(self.terms)
+            tree.save(path)
+            for mmap in (True, False):
+                loaded = BKTree.load(path, mmap=mmap)
+                self.assertEqual(len(loaded), len(tree))
+                for query in self.queries:
+                    self.assertEqual(loaded.range_query(query, 2),
+                                     tree.range_query(query, 2))
+                    self.assertEqual(loaded.knn(query, 5), tree.knn(query, 5))
+
+            # a loaded tree can be saved again, and added to
+            BKTree.load(path).save(copy)
+            BKTree.load(copy).save(copy)
+            loaded = BKTree.load(copy)
+            self.assertEqual(loaded.add('Nyall'), len(self.terms))
+            self.assertEqual(loaded.range_query('Nyall', 1),
+                             _brute_range(self.terms + ('Nyall',),
+                                          levenshtein, 'Nyall', 1))
+            self.assertEqual(loaded.knn('Colin', 1), tree.knn('Colin', 1))
+
+            self.assertRaises(ValueError, VPTree.load, path)
+        finally:
+            shutil.rmtree(path)
+            shutil.rmtree(copy)
+
+
+if __name__ == '__main__':
+    unittest.main()
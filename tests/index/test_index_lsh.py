@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_lsh.
+
+This module contains unit tests for abydos.index.lsh
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+from zlib import crc32
+
+from abydos.distance.levenshtein import sim_levenshtein
+from abydos.distance.token import sim_jaccard
+from abydos.index.lsh import MinHashLSH, _MAX_HASH, _PRIME, _bands
+
+from six.moves import range
+
+from .. import COLIN, NIALL
+
+
+class MinHashLSHTestCases(unittest.TestCase):
+    """Test MinHashLSH class.
+
+    abydos.index.lsh.MinHashLSH
+    """
+
+    terms = NIALL + COLIN + ('aluminum', 'Catalan', 'ATCG', 'TAGC', '', 'a',
+                             'AATTATAT', 'ATATATAT')
+
+    def test_bands(self):
+        """Test abydos.index.lsh._bands."""
+        for num_perm in (16, 64, 128, 256):
+            for threshold in (0.1, 0.3, 0.5, 0.7, 0.9):
+                bands, rows = _bands(num_perm, threshold)
+                self.assertLessEqual(bands * rows, num_perm)
+                self.assertAlmostEqual((1 / bands) ** (1 / rows), threshold,
+                                       delta=0.1)
+
+    def test_minhash_lsh(self):
+        """Test abydos.index.lsh.MinHashLSH."""
+        self.assertRaises(ValueError, MinHashLSH, threshold=1.5)
+        self.assertRaises(ValueError, MinHashLSH, num_perm=16, bands=(5, 4))
+
+        lsh = MinHashLSH(self.terms, threshold=0.3)
+        self.assertEqual(len(lsh), len(self.terms))
+        self.assertEqual(lsh.term(0), 'Niall')
+        self.assertEqual(lsh.add('Nyall'), len(self.terms))
+
+        # signatures are deterministic & estimate the Jaccard similarity
+        self.assertEqual(lsh.signature('Niall').tolist(),
+                         MinHashLSH(seed=0).signature('Niall').tolist())
+        self.assertNotEqual(lsh.signature('Niall').tolist(),
+                            MinHashLSH(seed=1).signature('Niall').tolist())
+        self.assertEqual((lsh.signature('Colin') ==
+                          lsh.signature('Colin')).sum(), 128)
+        self.assertGreater((lsh.signature('AATTATAT') ==
+                            lsh.signature('ATATATAT')).mean(), 0.2)
+        self.assertEqual(lsh.signature('a').tolist(),
+                         lsh.signature('').tolist())
+
+        # the permutations are computed exactly, as with Python's integers
+        mult, add = lsh._mult[0].tolist(), lsh._add[0].tolist()
+        hashes = [crc32(('{}\x00{}'.format(qgram, occurrence))
+                        .encode('utf-8')) & _MAX_HASH
+                  for qgram, occurrence in (('$N', 0), ('Ni', 0), ('ia', 0),
+                                            ('al', 0), ('ll', 0), ('l#', 0))]
+        self.assertEqual(lsh.signature('Niall').tolist(),
+                         [min((value * a + b) % _PRIME & _MAX_HASH
+                              for value in hashes)
+                          for a, b in zip(mult, add)])
+
+        # every term is a candidate for itself
+        for term_id, term in enumerate(self.terms):
+            self.assertIn(term_id, lsh.query(term, 0))
+            self.assertIn(term_id, lsh.query(term))
+        self.assertEqual(lsh.query('Xyzzy'), [])
+
+        # matches are exactly scored & sorted
+        for term in self.terms:
+            matches = lsh.search(term, 0.5)
+            scores = [score for _, score in matches]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+            for match, score in matches:
+                self.assertEqual(score, sim_jaccard(term, match))
+                self.assertGreaterEqual(score, 0.5)
+        self.assertEqual(lsh.search('Niall', 0.5, sim_levenshtein)[0],
+                         ('Niall', 1.0))
+        candidates = [lsh.term(term_id) for term_id in
+                      lsh.query('Neal', 0.4)]
+        self.assertEqual(lsh.search('Neal', 0.4, sim_jaccard, qval=1),
+                         [(term, score) for term, score in
+                          sorted(((term, sim_jaccard('Neal', term, 1))
+                                  for term in candidates),
+                                 key=lambda item: -item[1])
+                          if score >= 0.4])
+
+    def test_minhash_lsh_recall(self):
+        """Test abydos.index.lsh.MinHashLSH's recall."""
+        words = set()
+        for base in ('Christopher', 'Alexandria', 'Bartholomew', 'Gwendolyn',
+                     'Maximilian', 'Persephone', 'Theodosius', 'Wilhelmina'):
+            words.add(base)
+            for pos in range(len(base)):
+                words.add(base[:pos] + base[pos+1:])
+                words.add(base[:pos] + 'x' + base[pos+1:])
+        words = sorted(words)
+        lsh = MinHashLSH(words, threshold=0.5)
+
+        found = expected = 0
+        for query in words[::5]:
+            true_matches = {word for word in words if
+                            sim_jaccard(query, word) >= 0.7}
+            candidates = {lsh.term(term_id) for term_id in lsh.query(query)}
+            expected += len(true_matches)
+            found += len(true_matches & candidates)
+            # far fewer candidates than terms are returned
+            self.assertLess(len(candidates), len(words) / 4)
+        self.assertGreater(found / expected, 0.95)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_phonetic.
+
+This module contains unit tests for abydos.index.phonetic
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from abydos.index.phonetic import PhoneticIndex, union_lookup
+from abydos.phonetic.alpha_sis import alpha_sis
+from abydos.phonetic.bmpm import bmpm
+from abydos.phonetic.dm import dm_soundex
+from abydos.phonetic.eudex import eudex
+from abydos.phonetic.metaphone import double_metaphone
+from abydos.phonetic.nysiis import nysiis
+from abydos.phonetic.soundex import soundex
+
+from .. import COLIN, NIALL
+
+
+class PhoneticIndexTestCases(unittest.TestCase):
+    """Test PhoneticIndex class.
+
+    abydos.index.phonetic.PhoneticIndex
+    """
+
+    names = NIALL + COLIN + ('Smith', 'Schmidt', 'Smyth', 'Schwarzenegger',
+                             'Knight', 'Nate', '')
+    queries = ('Niall', 'Smythe', 'Collins', 'Schwartz', 'Night', 'Zzyzx',
+               '')
+
+    def _brute_lookup(self, index, word, names):
+        """Return the records sharing a code with word, by brute force."""
+        codes = set(index.codes(word))
+        return [record_id for record_id, name in names
+                if codes & set(index.codes(name))]
+
+    def test_phonetic_index_codes(self):
+        """Test abydos.index.phonetic.PhoneticIndex.codes."""
+        self.assertEqual(PhoneticIndex(soundex).codes('Niall'), ('N400',))
+        self.assertEqual(PhoneticIndex(soundex, max_length=6).codes('Niall'),
+                         ('N40000',))
+        self.assertEqual(PhoneticIndex(double_metaphone).codes('Niall'),
+                         ('NL',))
+        self.assertEqual(PhoneticIndex(double_metaphone).codes(''), ())
+        self.assertEqual(PhoneticIndex(dm_soundex).codes('Schwarzenegger'),
+                         tuple(sorted(dm_soundex('Schwarzenegger'))))
+        self.assertEqual(PhoneticIndex(bmpm).codes('Niall'),
+                         tuple(bmpm('Niall').split()))
+        self.assertEqual(PhoneticIndex(eudex).codes('Niall'),
+                         (eudex('Niall'),))
+        self.assertEqual(PhoneticIndex(alpha_sis).codes('Niall'),
+                         alpha_sis('Niall')[:1])
+
+    def test_phonetic_index(self):
+        """Test abydos.index.phonetic.PhoneticIndex."""
+        for encoder in (soundex, nysiis, double_metaphone, dm_soundex, bmpm,
+                        eudex, alpha_sis):
+            index = PhoneticIndex(encoder)
+            self.assertEqual(len(index), 0)
+            self.assertEqual(index.lookup('Niall'), [])
+
+            # add the records out of order, & some twice
+            names = list(enumerate(self.names))
+            for record_id, name in names[::-1] + names[::3]:
+                index.add(record_id, name)
+            for query in self.queries:
+                self.assertEqual(index.lookup(query),
+                                 self._brute_lookup(index, query, names))
+            for code in index.codes('Niall'):
+                self.assertIn(0, index.postings(code))
+            self.assertEqual(index.postings('not a code'), [])
+
+            # remove every other record, & some twice
+            for record_id, name in names[::2] + names[::4]:
+                index.remove(record_id, name)
+            for query in self.queries:
+                self.assertEqual(index.lookup(query),
+                                 self._brute_lookup(index, query,
+                                                    names[1::2]))
+            self.assertEqual(index.remove(0, 'Niall'), ())
+
+            for record_id, name in names[1::2]:
+                self.assertEqual(index.remove(record_id, name),
+                                 index.codes(name))
+            self.assertEqual(len(index), 0)
+
+    def test_union_lookup(self):
+        """Test abydos.index.phonetic.union_lookup."""
+        names = list(enumerate(self.names))
+        indices = (PhoneticIndex(soundex), PhoneticIndex(nysiis),
+                   PhoneticIndex(dm_soundex))
+        for index in indices:
+            for record_id, name in names:
+                index.add(record_id, name)
+
+        self.assertEqual(union_lookup('Niall', ()), [])
+        for query in self.queries:
+            self.assertEqual(union_lookup(query, indices[:1]),
+                             indices[0].lookup(query))
+            self.assertEqual(union_lookup(query, indices),
+                             sorted(set().union(*(index.lookup(query) for
+                                                  index in indices))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_symspell.
+
+This module contains unit tests for abydos.index.symspell
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from abydos.corpus.corpus import Corpus
+from abydos.corpus.ngram import NGramCorpus
+from abydos.distance.levenshtein import damerau_levenshtein, levenshtein
+from abydos.index.symspell import SymSpell, _deletes
+
+from .. import COLIN, NIALL
+
+
+class SymSpellTestCases(unittest.TestCase):
+    """Test SymSpell class.
+
+    abydos.index.symspell.SymSpell
+    """
+
+    terms = NIALL + COLIN + ('aluminum', 'Catalan', 'ATCG', 'TAGC', '', 'a',
+                             'AATTATAT', 'ATATATAT', 'ab', 'ba', 'abc',
+                             'acb', 'bca')
+    queries = ('Niall', 'Nigel', 'Colin', 'Nobody', 'ATGC', '', 'aluminium',
+               'Q', 'ba', 'cab', 'Nial', 'Nieal')
+
+    def test_deletes(self):
+        """Test abydos.index.symspell._deletes."""
+        self.assertEqual(_deletes('', 2), {''})
+        self.assertEqual(_deletes('cat', 0), {'cat'})
+        self.assertEqual(_deletes('aab', 1), {'aab', 'ab', 'aa'})
+        self.assertEqual(_deletes('cat', 5),
+                         {'cat', 'at', 'ct', 'ca', 'c', 'a', 't', ''})
+
+    def test_symspell(self):
+        """Test abydos.index.symspell.SymSpell."""
+        index = SymSpell(self.terms + ('Niall',))
+        self.assertEqual(len(index), len(self.terms))
+        self.assertEqual(index.term(0), self.terms[0])
+        self.assertIn('Colin', index)
+        self.assertNotIn('Nyall', index)
+        self.assertEqual(index.add('Colin'), self.terms.index('Colin'))
+        self.assertRaises(ValueError, index.lookup, 'Niall', 3)
+        self.assertEqual(SymSpell().lookup('Niall'), [])
+
+        # lookups find exactly the terms within max_distance
+        for metric in (levenshtein, damerau_levenshtein):
+            for max_distance in (0, 1, 2):
+                index = SymSpell(self.terms, max_distance, metric=metric)
+                for query in self.queries:
+                    for distance in range(max_distance+1):
+                        expected = sorted(
+                            (metric(query, term), term_id) for term_id, term
+                            in enumerate(self.terms)
+                            if metric(query, term) <= distance)
+                        self.assertEqual(
+                            index.lookup(query, distance),
+                            [(self.terms[term_id], dist) for dist, term_id in
+                             expected])
+
+        index = SymSpell(self.terms, 2)
+        self.assertEqual(index.lookup('Nieal', closest=True), [('Neal', 1)])
+        self.assertEqual(index.lookup('Nieal', 2, True), [('Neal', 1)])
+        self.assertEqual(index.lookup('cab', 1), [('ab', 1), ('acb', 1)])
+        self.assertEqual(SymSpell(self.terms, 1, metric=levenshtein)
+                         .lookup('cab', 1), [('ab', 1)])
+
+    def test_symspell_corpus(self):
+        """Test abydos.index.symspell.SymSpell with an NGramCorpus."""
+        corpus = NGramCorpus(Corpus('the cat sat on the mat\n'
+                                    'the rat ate the mat\n'
+                                    'a cat ate the rat and the cat sat'))
+        corpus.corpus_importer(Corpus('a bat'), 2)
+
+        index = SymSpell(corpus=corpus)
+        self.assertEqual(len(index), 10)
+        self.assertNotIn('_START_', index)
+        self.assertEqual(index.lookup('hat'),
+                         [('cat', 1), ('mat', 1), ('rat', 1), ('sat', 1),
+                          ('bat', 1), ('a', 2), ('ate', 2)])
+        self.assertEqual(index.lookup('thr', 1, True), [('the', 1)])
+
+        # explicit terms are weighted by the corpus, too
+        index = SymSpell(['bat', 'rat', 'cat', 'vat'], corpus=corpus)
+        self.assertEqual(index.lookup('pat'),
+                         [('cat', 1), ('rat', 1), ('bat', 1), ('vat', 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
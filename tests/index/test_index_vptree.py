@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.index.test_index_vptree.
+
+This module contains unit tests for abydos.index.vptree
+"""
+
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import unittest
+
+from abydos.distance.jaro import dist_jaro_winkler
+from abydos.distance.levenshtein import levenshtein
+from abydos.distance.minkowski import dist_euclidean, euclidean, manhattan
+from abydos.index.bktree import BKTree
+from abydos.index.vptree import VPTree
+
+from . import _brute_knn, _brute_range
+from .. import COLIN, NIALL
+
+
+class VPTreeTestCases(unittest.TestCase):
+    """Test VPTree class.
+
+    abydos.index.vptree.VPTree
+    """
+
+    terms = NIALL + COLIN + ('aluminum', 'Catalan', 'ATCG', 'TAGC', '', 'a',
+                             'AATTATAT', 'ATATATAT', 'Niall')
+    queries = ('Niall', 'Nigel', 'Colin', 'Nobody', 'ATGC', '', 'aluminium',
+               'Q')
+
+    def test_vptree(self):
+        """Test abydos.index.vptree.VPTree."""
+        self.assertEqual(VPTree().range_query('Niall', 5), [])
+        self.assertEqual(VPTree().knn('Niall', 5), [])
+        self.assertEqual(VPTree(['Niall']).knn('Neil'),
+                         [('Niall', euclidean('Neil', 'Niall'))])
+
+        for metric, radii in ((euclidean, (0, 1.5, 2.5, 4)),
+                              (manhattan, (0, 2, 5, 9)),
+                              (levenshtein, (0, 1, 2, 4))):
+            for seed in (0, 1, 2):
+                tree = VPTree(self.terms, metric, seed)
+                self.assertEqual(len(tree), len(self.terms))
+                self.assertEqual(tree.term(0), self.terms[0])
+                for query in self.queries:
+                    for radius in radii:
+                        self.assertEqual(tree.range_query(query, radius),
+                                         _brute_range(self.terms, metric,
+                                                      query, radius))
+                    for k in (0, 1, 3, 10, 100):
+                        self.assertEqual(tree.knn(query, k),
+                                         _brute_knn(self.terms, metric, query,
+                                                    k))
+
+        # with distances that are not metrics, only true matches are found
+        for metric in (dist_euclidean, dist_jaro_winkler):
+            tree = VPTree(self.terms, metric)
+            for query in self.queries:
+                matches = _brute_range(self.terms, metric, query, 0.3)
+                for match in tree.range_query(query, 0.3):
+                    self.assertIn(match, matches)
+                self.assertEqual(len(tree.knn(query, 3)), 3)
+
+    def test_vptree_save_load(self):
+        """Test abydos.index.vptree.VPTree.save & .load."""
+        path = tempfile.mkdtemp()
+        try:
+            tree = VPTree(self.terms)
+            tree.save(path)
+            for mmap in (True, False):
+                loaded = VPTree.load(path, mmap=mmap)
+                self.assertEqual(len(loaded), len(tree))
+                self.assertEqual(loaded.term(4), self.terms[4])
+                for query in self.queries:
+                    self.assertEqual(loaded.range_query(query, 2),
+                                     tree.range_query(query, 2))
+                    self.assertEqual(loaded.knn(query, 5), tree.knn(query, 5))
+
+            # a loaded tree can be saved again, over itself
+            VPTree.load(path).save(path)
+            loaded = VPTree.load(path)
+            self.assertEqual(loaded.knn('Colin', 2), tree.knn('Colin', 2))
+
+            self.assertRaises(ValueError, BKTree.load, path)
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
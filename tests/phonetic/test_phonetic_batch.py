@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 by Christopher C. Little.
+# This file is part of Abydos.
+#
+# Abydos is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Abydos is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Abydos. If not, see <http://www.gnu.org/licenses/>.
+
+"""abydos.tests.phonetic.test_phonetic_batch.
+
+This module contains unit tests for abydos.phonetic.batch
+"""
+
+from __future__ import unicode_literals
+
+import unittest
+
+from abydos.phonetic.alpha_sis import alpha_sis
+from abydos.phonetic.batch import encode_many
+from abydos.phonetic.bmpm import bmpm
+from abydos.phonetic.caverphone import caverphone
+from abydos.phonetic.davidson import davidson
+from abydos.phonetic.de import haase_phonetik, koelner_phonetik, \
+    koelner_phonetik_alpha, phonem, reth_schek_phonetik
+from abydos.phonetic.dm import dm_soundex
+from abydos.phonetic.dolby import dolby
+from abydos.phonetic.es import phonetic_spanish, spanish_metaphone
+from abydos.phonetic.eudex import eudex
+from abydos.phonetic.fr import fonem, henry_early
+from abydos.phonetic.hybrid import metasoundex, onca
+from abydos.phonetic.metaphone import double_metaphone, metaphone
+from abydos.phonetic.mra import mra
+from abydos.phonetic.nrl import nrl
+from abydos.phonetic.nysiis import nysiis
+from abydos.phonetic.parmar_kumbharana import parmar_kumbharana
+from abydos.phonetic.phonet import phonet
+from abydos.phonetic.pt import soundex_br
+from abydos.phonetic.roger_root import roger_root
+from abydos.phonetic.russell import russell_index, russell_index_alpha
+from abydos.phonetic.sound_d import sound_d
+from abydos.phonetic.soundex import fuzzy_soundex, lein, phonex, phonix, \
+    pshp_soundex_first, pshp_soundex_last, refined_soundex, soundex
+from abydos.phonetic.spfc import spfc
+from abydos.phonetic.statistics_canada import statistics_canada
+from abydos.phonetic.sv import norphone, sfinxbis
+
+from numpy import ndarray
+
+from .. import COLIN, NIALL
+
+
+def _canonical(codes):
+    """Return codes, with NaN (as from russell_index('')) replaced by None."""
+    return [None if code != code else code for code in codes]
+
+
+class EncodeManyTestCases(unittest.TestCase):
+    """Test abydos.phonetic.batch.encode_many."""
+
+    algorithms = (
+        alpha_sis, bmpm, caverphone, davidson, double_metaphone, dm_soundex,
+        dolby, eudex, fonem, fuzzy_soundex, haase_phonetik, henry_early,
+        koelner_phonetik, koelner_phonetik_alpha, lein, metaphone,
+        metasoundex, mra, norphone, nrl, nysiis, onca, parmar_kumbharana,
+        phonem, phonet, phonetic_spanish, phonex, phonix, pshp_soundex_first,
+        pshp_soundex_last, refined_soundex, reth_schek_phonetik, roger_root,
+        russell_index, russell_index_alpha, sfinxbis, sound_d, soundex,
+        soundex_br, spanish_metaphone, statistics_canada)
+
+    # words repeated, & differing in case, composition, & by compatibility
+    # characters
+    words = (NIALL + COLIN + NIALL[::2] +
+             ('Smith', 'SMITH', 'smith', 'Müller', 'MÜLLER', 'Müller',
+              'Müller', 'ﬁnch', 'FINCH', 'ªlvarez', 'Alvarez', 'Straße',
+              'STRASSE', 'ǅokić', '', 'Smith'))
+
+    def test_encode_many(self):
+        """Test abydos.phonetic.batch.encode_many."""
+        for algorithm in self.algorithms:
+            expected = _canonical(algorithm(word) for word in self.words)
+            self.assertEqual(_canonical(encode_many(self.words, algorithm)),
+                             expected)
+            self.assertEqual(_canonical(encode_many(iter(self.words),
+                                                    algorithm)), expected)
+            self.assertEqual(_canonical(encode_many(self.words, algorithm,
+                                                    'object')), expected)
+            self.assertEqual(encode_many([], algorithm), [])
+
+        self.assertEqual(encode_many(self.words, soundex, max_length=6),
+                         [soundex(word, max_length=6) for word in self.words])
+        self.assertEqual(encode_many(self.words, bmpm, language_arg='german'),
+                         [bmpm(word, language_arg='german') for word in
+                          self.words])
+
+        names = ('Christopher Smith', 'Niall Smith', 'Christopher Smith')
+        self.assertEqual(encode_many(names, spfc),
+                         [spfc(name) for name in names])
+
+    def test_encode_many_output(self):
+        """Test abydos.phonetic.batch.encode_many's output types."""
+        self.assertRaises(ValueError, encode_many, self.words, soundex,
+                          'tuple')
+
+        codes = encode_many(self.words, soundex, 'object')
+        self.assertIsInstance(codes, ndarray)
+        self.assertEqual(codes.dtype, object)
+        self.assertEqual(codes.shape, (len(self.words),))
+
+        codes = encode_many(self.words, double_metaphone, 'object')
+        self.assertEqual(codes.shape, (len(self.words),))
+        self.assertEqual(codes[0], double_metaphone(self.words[0]))
+        codes = encode_many(self.words, dm_soundex, 'object')
+        self.assertEqual(codes[-1], dm_soundex('Smith'))
+
+        for algorithm in (soundex, nysiis, bmpm, fonem):
+            codes = encode_many(self.words, algorithm, 'bytes')
+            self.assertEqual(codes.dtype.kind, 'S')
+            self.assertEqual([code.decode('utf-8') for code in codes],
+                             [algorithm(word) for word in self.words])
+        self.assertEqual(encode_many(self.words, soundex, 'bytes',
+                                     max_length=8).dtype.itemsize, 8)
+        self.assertEqual(encode_many([], soundex, 'bytes').shape, (0,))
+        self.assertEqual(encode_many([], soundex, 'object').shape, (0,))
+
+        self.assertRaises(ValueError, encode_many, self.words,
+                          double_metaphone, 'bytes')
+        self.assertRaises(ValueError, encode_many, self.words, dm_soundex,
+                          'bytes')
+        self.assertRaises(ValueError, encode_many, self.words, eudex, 'bytes')
+
+
+if __name__ == '__main__':
+    unittest.main()
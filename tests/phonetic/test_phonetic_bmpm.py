@@ -24,17 +24,20 @@ This module contains unit tests for abydos.phonetic.bmpm
 from __future__ import unicode_literals
 
 import codecs
+import subprocess
+import sys
 import unittest
 
 # noinspection PyProtectedMember
-from abydos.phonetic._bmdata import L_ANY, L_CYRILLIC, L_CZECH, L_DUTCH, \
-    L_ENGLISH, L_FRENCH, L_GERMAN, L_GREEK, L_GREEKLATIN, L_HEBREW, \
-    L_HUNGARIAN, L_ITALIAN, L_LATVIAN, L_POLISH, L_PORTUGUESE, L_ROMANIAN, \
-    L_SPANISH, L_TURKISH
-# noinspection PyProtectedMember
-from abydos.phonetic.bmpm import _bm_apply_rule_if_compat, \
+from abydos.phonetic._bmdata import BMDATA, L_ANY, L_CYRILLIC, L_CZECH, \
+    L_DUTCH, L_ENGLISH, L_FRENCH, L_GERMAN, L_GREEK, L_GREEKLATIN, \
+    L_HEBREW, L_HUNGARIAN, L_ITALIAN, L_LATVIAN, L_NONE, L_POLISH, \
+    L_PORTUGUESE, L_ROMANIAN, L_SPANISH, L_TURKISH
+from abydos.phonetic.bmpm import _LANG_DICT, _L_ANY, _L_NONE, \
+    _bm_apply_rule_if_compat, _bm_compile_rules, _bm_data, \
     _bm_expand_alternates, _bm_language, _bm_normalize_lang_attrs, \
-    _bm_phonetic_number, _bm_remove_dupes, bmpm
+    _bm_phonetic_number, _bm_remove_dupes, _bm_rules, bmpm, bmpm_cache_info, \
+    clear_bmpm_cache, set_bmpm_cache
 
 
 from six import text_type
@@ -405,6 +408,51 @@ class BeiderMorseTestCases(unittest.TestCase):
                     self.assertEqual(bmpm(cen_line[0], match_mode='exact',
                                           name_mode='sep'), cen_line[6])
 
+    def test_bmpm_cache(self):
+        """Test abydos.phonetic.bmpm.set_bmpm_cache & .bmpm_cache_info."""
+        names = ('Smith', 'van Smith', 'Smith Jones', 'de la Cruz',
+                 "d'Avila d'Aguilar", 'Jones Smith', 'Smith')
+        settings = ({}, {'name_mode': 'ash'}, {'name_mode': 'sep'},
+                    {'match_mode': 'exact'}, {'language_arg': 'english'},
+                    {'concat': True})
+        expected = [bmpm(name, **kwargs) for kwargs in settings
+                    for name in names]
+        self.assertEqual(bmpm_cache_info(),
+                         {'hits': 0, 'misses': 0, 'maxsize': 0, 'size': 0})
+
+        try:
+            set_bmpm_cache(3)
+            self.assertEqual([bmpm(name, **kwargs) for kwargs in settings
+                              for name in names], expected)
+            info = bmpm_cache_info()
+            self.assertEqual(info['maxsize'], 3)
+            self.assertEqual(info['size'], 3)
+            self.assertGreater(info['hits'], 0)
+
+            set_bmpm_cache(1000)
+            clear_bmpm_cache()
+            self.assertEqual(bmpm('Smith Smith'), 'zmit zmit')
+            self.assertEqual(bmpm_cache_info(),
+                             {'hits': 1, 'misses': 2, 'maxsize': 1000,
+                              'size': 2})
+            self.assertEqual(bmpm('Smith', match_mode='exact'), 'smit zmit')
+            self.assertEqual(bmpm_cache_info()['misses'], 3)
+            self.assertEqual([bmpm(name, **kwargs) for kwargs in settings
+                              for name in names], expected)
+            self.assertEqual([bmpm(name, **kwargs) for kwargs in settings
+                              for name in names], expected)
+
+            # shrinking evicts the least recently used encodings
+            set_bmpm_cache(2)
+            self.assertEqual(bmpm_cache_info()['size'], 2)
+            self.assertRaises(ValueError, set_bmpm_cache, -1)
+        finally:
+            set_bmpm_cache(0)
+        self.assertEqual(bmpm_cache_info(),
+                         {'hits': 0, 'misses': 0, 'maxsize': 0, 'size': 0})
+        self.assertEqual(bmpm('Smith Smith'), 'zmit zmit')
+        self.assertEqual(bmpm_cache_info()['size'], 0)
+
     def test_bm_phonetic_number(self):
         """Test abydos.phonetic.bmpm._bm_phonetic_number."""
         self.assertEqual(_bm_phonetic_number(''), '')
@@ -508,6 +556,48 @@ class BeiderMorseTestCases(unittest.TestCase):
         self.assertEqual(_bm_normalize_lang_attrs('ab[2]c[4]', True), 'abc')
         self.assertEqual(_bm_normalize_lang_attrs('ab[2]c[6]', True), 'abc')
 
+    def test_bm_compile_rules(self):
+        """Test abydos.phonetic.bmpm._bm_compile_rules & ._bm_rules."""
+        compiled = _bm_compile_rules((('ab', '', '', 'x'),
+                                      ('a', 'c', '', 'y'),
+                                      ('b', '', 'd|e', 'z'),
+                                      ('a', '', '', 'w')))
+        self.assertEqual(sorted(compiled), ['a', 'b'])
+        self.assertEqual([rule[0] for rule in compiled['a']],
+                         ['ab', 'a', 'a'])
+        self.assertEqual(compiled['a'][0][1:4], (2, None, None))
+        self.assertTrue(compiled['a'][1][2].search('abc'))
+        self.assertFalse(compiled['a'][1][2].search('cab'))
+        self.assertEqual(compiled['b'][0][3].pattern, '^d|e')
+        self.assertEqual(_bm_compile_rules(()), {})
+
+        # compiled tables are cached & hold every rule
+        rules = _bm_rules('gen', 'rules', 1)
+        self.assertIs(rules, _bm_rules('gen', 'rules', 1))
+        self.assertEqual(sum(len(_) for _ in rules.values()),
+                         len(BMDATA['gen']['rules'][1]))
+        self.assertIs(_bm_rules('ash', 'exact', 'common'),
+                      _bm_rules('ash', 'exact', 'common'))
+
+    def test_bm_data(self):
+        """Test abydos.phonetic.bmpm._bm_data."""
+        self.assertEqual(_bm_data(), BMDATA)
+        self.assertIs(_bm_data(), _bm_data())
+        self.assertEqual((_L_NONE, _L_ANY), (L_NONE, L_ANY))
+        self.assertEqual(_LANG_DICT['cyrillic'], L_CYRILLIC)
+        self.assertEqual(_LANG_DICT['turkish'], L_TURKISH)
+        self.assertEqual(sum(_LANG_DICT.values()), 2**20-1)
+
+        # the rules are loaded by the first encoding, not by the import
+        loaded = subprocess.check_output(
+            [sys.executable, '-c',
+             'import sys\n'
+             'import abydos.phonetic.bmpm as bm\n'
+             'print("abydos.phonetic._bmdata" in sys.modules)\n'
+             'bm.bmpm("Smith")\n'
+             'print("abydos.phonetic._bmdata" in sys.modules)\n'])
+        self.assertEqual(loaded.split(), [b'False', b'True'])
+
 
 if __name__ == '__main__':
     unittest.main()
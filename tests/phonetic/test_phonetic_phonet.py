@@ -26,7 +26,7 @@ from __future__ import unicode_literals
 import codecs
 import unittest
 
-from abydos.phonetic.phonet import phonet
+from abydos.phonetic.phonet import _phonet_tables, phonet
 
 from .. import ALLOW_RANDOM, _corpus_file, _one_in
 
@@ -108,6 +108,30 @@ class PhonetTestCases(unittest.TestCase):
         self.assertEqual(phonet('Brückmann', 2, 'none'), 'BRUECKMAN')
         self.assertEqual(phonet('Krauße', 2, 'none'), 'KRAUSE')
 
+    def test_phonet_tables(self):
+        """Test abydos.phonetic.phonet._phonet_tables."""
+        # tables are built once per language & shared by later calls
+        self.assertIs(_phonet_tables('de'), _phonet_tables('de'))
+        self.assertIs(_phonet_tables('de'), _phonet_tables('en'))
+        self.assertIsNot(_phonet_tables('de'), _phonet_tables('none'))
+
+        (rules, alpha_pos, phonet_hash, phonet_hash_1,
+         phonet_hash_2) = _phonet_tables('de')
+        self.assertEqual(alpha_pos['A'], 2)
+        self.assertEqual(alpha_pos['Z'], 27)
+        self.assertEqual(alpha_pos['Ä'], 1)
+        self.assertNotIn('a', alpha_pos)
+        self.assertEqual(len(phonet_hash_1), 26)
+        self.assertEqual(len(phonet_hash_2[25]), 28)
+        self.assertEqual(rules[phonet_hash['Ä']][0], 'Ä')
+        self.assertTrue(rules[phonet_hash_1[0][0]].startswith('A'))
+
+        # encoding must not alter the tables
+        phonet('Bremerhaven')
+        phonet('Bremerhaven', 2)
+        self.assertEqual(_phonet_tables('de')[3], phonet_hash_1)
+        self.assertEqual(phonet('Bremerhaven'), 'BREMAHAFN')
+
     def test_phonet_nachnamen(self):
         """Test abydos.phonetic.phonet (Nachnamen set)."""
         if not ALLOW_RANDOM:
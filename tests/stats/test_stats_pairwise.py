@@ -21,14 +21,17 @@
 This module contains unit tests for abydos.clustering
 """
 
-from __future__ import unicode_literals
+from __future__ import division, unicode_literals
 
 import unittest
+from math import ceil
 
+from abydos.distance import sim
+from abydos.distance.jaro import sim_jaro_winkler
 from abydos.distance.token import sim_tanimoto
-from abydos.stats.mean import amean, gmean, hmean
-from abydos.stats.pairwise import mean_pairwise_similarity, \
-    pairwise_similarity_statistics
+from abydos.stats.mean import amean, gmean, hmean, median, qmean, std
+from abydos.stats.pairwise import _PairwiseSummary, _tiles, \
+    mean_pairwise_similarity, pairwise_similarity_statistics
 
 NIALL = ('Niall', 'Neal', 'Neil', 'Njall', 'Njáll', 'Nigel', 'Neel', 'Nele',
          'Nigelli', 'Nel', 'Kneale', 'Uí Néill', 'O\'Neill', 'MacNeil',
@@ -99,6 +102,28 @@ class MPSTestCases(unittest.TestCase):
         self.assertAlmostEqual(mean_pairwise_similarity(NIALL),
                                mean_pairwise_similarity(set(NIALL)))
 
+    def test_mean_pairwise_similarity_parallel(self):
+        """Test abydos.stats.pairwise.mean_pairwise_similarity."""
+        for mean_func in (amean, gmean, hmean, qmean, median):
+            for symmetric in (False, True):
+                self.assertAlmostEqual(
+                    mean_pairwise_similarity(NIALL, mean_func=mean_func,
+                                             symmetric=symmetric, n_jobs=2),
+                    mean_pairwise_similarity(NIALL, mean_func=mean_func,
+                                             symmetric=symmetric))
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(NIALL, metric=sim_jaro_winkler,
+                                     mean_func=amean, n_jobs=3),
+            mean_pairwise_similarity(NIALL, metric=sim_jaro_winkler,
+                                     mean_func=amean))
+        self.assertAlmostEqual(
+            mean_pairwise_similarity(NIALL[:2], n_jobs=-1),
+            mean_pairwise_similarity(NIALL[:2]))
+
+        # workers find the metric by name, so it cannot be a lambda
+        self.assertRaises(ValueError, mean_pairwise_similarity, NIALL,
+                          metric=lambda src, tar: 0.5, n_jobs=2)
+
 
 class PSSTestCases(unittest.TestCase):
     """Test pairwise similarity statistics functions.
@@ -180,6 +205,141 @@ class PSSTestCases(unittest.TestCase):
         self.assertRaises(ValueError, pairwise_similarity_statistics, 5, NIALL)
         self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL, 5)
 
+    def test_pairwise_similarity_statistics_parallel(self):
+        """Test abydos.stats.pairwise.pairwise_similarity_statistics."""
+        for tar_collection in (NIALL, NIALL_1WORD[3:], ('Kneal',)):
+            for mean_func in (amean, hmean, median):
+                for symmetric in (False, True):
+                    serial = pairwise_similarity_statistics(
+                        NIALL, tar_collection, mean_func=mean_func,
+                        symmetric=symmetric)
+                    parallel = pairwise_similarity_statistics(
+                        NIALL, tar_collection, mean_func=mean_func,
+                        symmetric=symmetric, n_jobs=3)
+                    for serial_stat, parallel_stat in zip(serial, parallel):
+                        self.assertAlmostEqual(serial_stat, parallel_stat)
+
+        self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL,
+                          (), n_jobs=2)
+        self.assertEqual(pairwise_similarity_statistics(NIALL, NIALL,
+                                                        bins=10, n_jobs=2)[4],
+                         pairwise_similarity_statistics(NIALL, NIALL,
+                                                        bins=10)[4])
+        self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL,
+                          NIALL, metric=lambda src, tar: 0.5, n_jobs=2)
+
+    def test_pairwise_similarity_statistics_stream(self):
+        """Test abydos.stats.pairwise.pairwise_similarity_statistics."""
+        for tar_collection in (NIALL, ('Kneal',)):
+            for mean_func in (amean, gmean, hmean, median):
+                for symmetric in (False, True):
+                    listed = pairwise_similarity_statistics(
+                        NIALL, tar_collection, mean_func=mean_func,
+                        symmetric=symmetric)
+                    streamed = pairwise_similarity_statistics(
+                        NIALL, tar_collection, mean_func=mean_func,
+                        symmetric=symmetric, stream=True)
+                    self.assertEqual(len(streamed), 4)
+                    for listed_stat, streamed_stat in zip(listed, streamed):
+                        self.assertAlmostEqual(listed_stat, streamed_stat)
+
+        # histograms
+        stats = pairwise_similarity_statistics(NIALL, NIALL, bins=10)
+        self.assertEqual(len(stats), 5)
+        self.assertEqual(len(stats[4]), 10)
+        self.assertEqual(sum(stats[4]), len(NIALL)**2)
+        self.assertEqual(stats[4][-1], len(NIALL))
+        self.assertEqual(pairwise_similarity_statistics('The', 'jumped',
+                                                        bins=3)[4], [1, 0, 0])
+        self.assertRaises(ValueError, pairwise_similarity_statistics, NIALL,
+                          NIALL, bins=0)
+
+        # quantiles are estimated to within one bin width
+        values = sorted(sim(src, tar) for src in NIALL for tar in NIALL)
+        for bins in (None, 10, 1000):
+            stats = pairwise_similarity_statistics(NIALL, NIALL, bins=bins,
+                                                   quantiles=(0, 0.25, 0.5,
+                                                              0.75, 1))
+            self.assertEqual(len(stats), 5 if bins is None else 6)
+            estimates = stats[-1]
+            self.assertEqual(estimates[0], values[0])
+            self.assertEqual(estimates[-1], values[-1])
+            for prob, estimate in zip((0.25, 0.5, 0.75), estimates[1:4]):
+                rank = int(ceil(prob*len(values))) - 1
+                self.assertLessEqual(abs(estimate - values[rank]),
+                                     1/(bins or 100) + 1e-12)
+
+
+class PairwiseSummaryTestCases(unittest.TestCase):
+    """Test pairwise summary & tiling helpers.
+
+    abydos.stats.pairwise._PairwiseSummary & ._tiles
+    """
+
+    def test_pairwise_summary(self):
+        """Test abydos.stats.pairwise._PairwiseSummary."""
+        values = [0.5, 0.25, 1.0, 0.75, 0.125, 0.5, 0.0625]
+        whole = _PairwiseSummary()
+        for value in values:
+            whole.add(value)
+        merged = _PairwiseSummary()
+        for start in (0, 2, 3):
+            part = _PairwiseSummary()
+            for value in values[start:{0: 2, 2: 3, 3: None}[start]]:
+                part.add(value)
+            merged.merge(part)
+        merged.merge(_PairwiseSummary())
+
+        for summary in (whole, merged):
+            self.assertEqual(summary.count, 7)
+            self.assertEqual(summary.min, 0.0625)
+            self.assertEqual(summary.max, 1.0)
+            for mean_func in (amean, gmean, hmean, qmean):
+                self.assertAlmostEqual(summary.mean(mean_func),
+                                       mean_func(values))
+                self.assertAlmostEqual(summary.std(mean_func),
+                                       std(values, mean_func))
+
+        # hmean special cases
+        for values, expected in (([0.5, 0.5], 0.5), ([0, 0.5], 0)):
+            summary = _PairwiseSummary()
+            for value in values:
+                summary.add(value)
+            self.assertEqual(summary.mean(hmean), expected)
+        summary = _PairwiseSummary()
+        for value in (0, 0, 0.5):
+            summary.add(value)
+        self.assertNotEqual(summary.mean(hmean), summary.mean(hmean))
+
+        # other mean functions require the values themselves
+        summary = _PairwiseSummary(keep_values=True)
+        for value in (0.25, 0.5, 1.0):
+            summary.add(value)
+        self.assertEqual(summary.mean(median), 0.5)
+
+    def test_tiles(self):
+        """Test abydos.stats.pairwise._tiles."""
+        for src_len, tar_len in ((1, 1), (5, 1), (16, 16), (17, 3)):
+            for n_jobs in (1, 2, 7, 32):
+                # each pair must be covered exactly once
+                pairs = [(i, j) for (src_start, src_stop, tar_start,
+                                     tar_stop) in _tiles(src_len, tar_len,
+                                                         n_jobs)
+                         for i in range(src_start, src_stop)
+                         for j in range(tar_start, tar_stop)]
+                self.assertEqual(sorted(pairs),
+                                 [(i, j) for i in range(src_len)
+                                  for j in range(tar_len)])
+                if src_len == tar_len:
+                    pairs = [(i, j) for (src_start, src_stop, tar_start,
+                                         tar_stop) in _tiles(src_len, tar_len,
+                                                             n_jobs, True)
+                             for i in range(src_start, src_stop)
+                             for j in range(max(tar_start, i+1), tar_stop)]
+                    self.assertEqual(sorted(pairs),
+                                     [(i, j) for i in range(src_len)
+                                      for j in range(i+1, src_len)])
+
 
 if __name__ == '__main__':
     unittest.main()